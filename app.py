@@ -1,39 +1,83 @@
+import json
 import os
-from flask import Flask, request, jsonify
-from io import StringIO
-import sys
-from lexer import LexerFIA
-from parser import ParserFIA
-from interpreter import VisiteurInterpretation
-from errors import FIAError
+from flask import Flask, Response, request, jsonify
+from moteurs import MOTEURS, MOTEUR_PAR_DEFAUT
+from pool_execution import PoolExecution, PoolSature, configuration_depuis_env
 
 app = Flask(__name__)
 
-def executer_code(code):
-    old_stdout = sys.stdout
-    sys.stdout = captured_output = StringIO()
-    try:
-        lexer = LexerFIA(code)
-        tokens = lexer.tokeniser()
-        parser = ParserFIA(tokens)
-        ast = parser.analyser()
-        interpreter = VisiteurInterpretation()
-        interpreter.executer(ast)
-        output = captured_output.getvalue()
-        return output
-    except FIAError as e:
-        return str(e)
-    except Exception as e:
-        return f"Erreur inattendue: {str(e)}"
-    finally:
-        sys.stdout = old_stdout
+# Moteur d'exécution par défaut du serveur (arbre, closures, vm)
+MOTEUR_SERVEUR = os.environ.get('FIA_MOTEUR', MOTEUR_PAR_DEFAUT)
+
+# Workers d'exécution partagés par les requêtes (FIA_POOL_TAILLE, FIA_POOL_FILE, FIA_POOL_ATTENTE)
+pool = PoolExecution(**configuration_depuis_env())
+
+def executer_code(code, moteur=None, limites=None):
+    """Exécute le code dans un worker du pool et retourne sa sortie
+    (limites : {'instructions', 'delai', 'profondeur', 'elements'}, bornées par FIA_MAX_*/FIA_DELAI_MAX)"""
+    return pool.executer(code, moteur or MOTEUR_SERVEUR, limites)
 
 @app.route('/execute', methods=['POST'])
 def execute():
     code = request.json.get('code', '')
-    result = executer_code(code)
+    moteur = request.json.get('moteur', MOTEUR_SERVEUR)
+    if moteur not in MOTEURS:
+        return jsonify({'error': f"Moteur inconnu '{moteur}'. Moteurs disponibles: {', '.join(MOTEURS)}"}), 400
+    try:
+        result = executer_code(code, moteur, request.json.get('limites'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except PoolSature as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     return jsonify({'result': result})
 
+def evenement_sse(type_evenement, donnees):
+    """Formate un événement server-sent events (une ligne `data:` par ligne de texte)"""
+    lignes = "".join(f"data: {ligne}\n" for ligne in donnees.split("\n"))
+    return f"event: {type_evenement}\n{lignes}\n"
+
+def flux_sse(flux):
+    for type_evenement, donnees in flux:
+        if type_evenement == 'fin':
+            yield evenement_sse('fin', json.dumps({'envoyes': flux.envoyes}))
+        else:
+            yield evenement_sse(type_evenement, donnees)
+
+def flux_texte(flux):
+    for type_evenement, donnees in flux:
+        if type_evenement == 'sortie':
+            yield donnees
+        elif type_evenement == 'erreur':
+            yield f"\n{donnees}\n"
+
+@app.route('/execute/flux', methods=['POST'])
+def execute_flux():
+    """Exécute le code en renvoyant la sortie au fur et à mesure (SSE, ou texte découpé)"""
+    code = request.json.get('code', '')
+    moteur = request.json.get('moteur', MOTEUR_SERVEUR)
+    format_flux = request.json.get('format', 'sse')
+    if moteur not in MOTEURS:
+        return jsonify({'error': f"Moteur inconnu '{moteur}'. Moteurs disponibles: {', '.join(MOTEURS)}"}), 400
+    if format_flux not in ('sse', 'texte'):
+        return jsonify({'error': f"Format inconnu '{format_flux}'. Formats disponibles: sse, texte"}), 400
+    try:
+        flux = pool.executer_en_flux(code, moteur, request.json.get('limites'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except PoolSature as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
+
+    if format_flux == 'sse':
+        reponse = Response(flux_sse(flux), mimetype='text/event-stream')
+    else:
+        reponse = Response(flux_texte(flux), mimetype='text/plain; charset=utf-8')
+    reponse.headers['Cache-Control'] = 'no-cache'
+    reponse.headers['X-Accel-Buffering'] = 'no'
+    # Client déconnecté : le serveur WSGI ferme la réponse, ce qui arrête l'exécution
+    reponse.call_on_close(flux.fermer)
+    return reponse
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port)
+    pool.demarrer()
+    app.run(host='0.0.0.0', port=port, threaded=True)
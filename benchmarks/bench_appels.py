@@ -0,0 +1,71 @@
+# bench_appels.py
+"""
+Coût de la résolution des noms de fonctions : boucle d'appels à `longueur`,
+`ajouter` et à une fonction utilisateur dans chaque moteur, avec les caches
+en ligne des identifiants et des appels, puis avec des caches toujours
+périmés (numéro de version des fonctions renouvelé à chaque lecture : chaque
+site résout de nouveau son nom, comme avant les caches).
+
+Usage: python benchmarks/bench_appels.py [tours]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+import interpreter
+
+PROGRAMME = """
+fonction carre(x) {{
+    retourner x * x
+}}
+soit liste = []
+soit total = 0
+soit i = 0
+tant_que (i < {tours}) {{
+    ajouter(liste, carre(i) % 7)
+    total += longueur(liste) + carre(2)
+    i += 1
+}}
+imprimer(total)
+"""
+
+def caches_perimes(interpreteur):
+    """Le même interpréteur, dont chaque lecture de `version_noms` donne un nouveau numéro"""
+    classe = type(interpreteur)
+    interpreteur.__class__ = type(classe.__name__, (classe,), {
+        'version_noms': property(lambda self: next(interpreter._VERSIONS_NOMS),
+                                 lambda self, valeur: None),
+    })
+    return interpreteur
+
+def chronometrer(ast, moteur, sans_cache, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        interpreteur = creer_interpreteur(moteur, sortie)
+        if sans_cache:
+            caches_perimes(interpreteur)
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()[-1]
+
+def main():
+    tours = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    ast = ParserFIA(LexerFIA(PROGRAMME.format(tours=tours)).tokeniser()).analyser()
+    print(f"{tours} tours de 4 appels :")
+    for moteur in MOTEURS:
+        duree_sans, total_sans = chronometrer(ast, moteur, sans_cache=True)
+        duree, total = chronometrer(ast, moteur, sans_cache=False)
+        assert total == total_sans
+        print(f"  {moteur:<9}: {duree_sans * 1000:7.1f} ms -> {duree * 1000:7.1f} ms "
+              f"avec caches en ligne (x{duree_sans / duree:.2f})")
+
+if __name__ == "__main__":
+    main()
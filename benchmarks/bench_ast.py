@@ -0,0 +1,45 @@
+# bench_ast.py
+"""
+Mémoire de l'AST d'un gros programme et coût de la distribution des nœuds
+dans l'interpréteur d'arbre (`VisiteurInterpretation.executer`).
+
+Usage: python benchmarks/bench_ast.py [nombre_de_lignes]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import creer_interpreteur
+from sortie import SortieFIA
+from bench_tokens import source_synthetique, memoire
+
+BOUCLE = """
+soit total = 0
+soit i = 0
+tant_que (i < 100000) {
+    total = total + i * 2 - (i % 7)
+    i += 1
+}
+"""
+
+def main():
+    nb_lignes = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    tampon = LexerFIA(source_synthetique(nb_lignes)).tokeniser_tampon()
+    ast, taille = memoire(lambda: ParserFIA(tampon).analyser())
+    print(f"AST de {nb_lignes} lignes : {taille / 1e6:6.1f} Mo, {len(ast.instructions)} instructions")
+
+    ast = ParserFIA(LexerFIA(BOUCLE).tokeniser()).analyser()
+    meilleur = None
+    for _ in range(5):
+        interpreteur = creer_interpreteur('arbre', SortieFIA(flux=None))
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    print(f"boucle de 100000 tours (moteur arbre) : {meilleur * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# bench_cache_ast.py
+"""
+Temps de chargement des AST avec et sans le cache .fiac.
+
+Mesure, pour un programme et tous les modules qu'il importe (par défaut
+exemples/seo_analyzer/seo_main.fia) :
+  - sans cache   : lexer + parser à chaque chargement
+  - cache froid  : analyse + écriture des entrées .fiac
+  - cache chaud  : relecture des entrées .fiac
+et le démarrage complet `python main.py` avec --no-cache / cache chaud.
+
+Usage: python benchmarks/bench_cache_ast.py [fichier.fia]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import subprocess
+import time
+from pathlib import Path
+from cache_ast import CacheAST
+from fia_ast import ImportModule, ImportDepuis
+from module_resolver import module_resolver
+
+RACINE = Path(__file__).resolve().parent.parent
+
+def fichiers_du_programme(chemin):
+    """Le programme et ses modules importés (transitivement)"""
+    a_visiter = [Path(chemin).resolve()]
+    vus = []
+    while a_visiter:
+        fichier = a_visiter.pop()
+        if fichier in vus:
+            continue
+        vus.append(fichier)
+        for instruction in CacheAST(actif=False).charger(fichier).instructions:
+            if isinstance(instruction, (ImportModule, ImportDepuis)):
+                module = module_resolver.resoudre_chemin(instruction.chemin_module, str(fichier))
+                if module:
+                    a_visiter.append(module)
+    return vus
+
+def charger_tout(cache, fichiers, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        for fichier in fichiers:
+            cache.charger(fichier)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur
+
+def demarrage(arguments, fichier, repetitions=5):
+    # stdin vide : les programmes interactifs bouclent sur saisir(), le budget les arrête
+    arguments = [*arguments, '--max-instructions', '1000']
+    meilleur = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        subprocess.run([sys.executable, 'main.py', *arguments, str(fichier)], cwd=RACINE,
+                       stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur
+
+def main():
+    os.chdir(RACINE)
+    programme = sys.argv[1] if len(sys.argv) > 1 else 'exemples/seo_analyzer/seo_main.fia'
+    fichiers = fichiers_du_programme(programme)
+    taille = sum(f.stat().st_size for f in fichiers)
+    print(f"{programme}: {len(fichiers)} fichiers, {taille / 1024:.0f} Ko de source")
+
+    cache = CacheAST()
+    for fichier in fichiers:
+        cache.invalider(fichier)
+    sans_cache = charger_tout(CacheAST(actif=False), fichiers)
+    debut = time.perf_counter()
+    for fichier in fichiers:
+        cache.charger(fichier)
+    froid = time.perf_counter() - debut
+    chaud = charger_tout(cache, fichiers)
+    print(f"  chargement des AST sans cache : {sans_cache * 1000:7.1f} ms")
+    print(f"  cache froid (analyse+écriture): {froid * 1000:7.1f} ms")
+    print(f"  cache chaud                   : {chaud * 1000:7.1f} ms  (x{sans_cache / chaud:.1f})")
+
+    print(f"  python main.py --no-cache     : {demarrage(['--no-cache'], programme) * 1000:7.1f} ms")
+    print(f"  python main.py (cache chaud)  : {demarrage([], programme) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# bench_collections.py
+"""
+Piles natives : remplir puis vider une pile, avec l'ancien `depiler` de
+lib/collections.fia (liste recopiée deux fois par des boucles `tant_que`,
+O(n) par appel) puis avec les fonctions intégrées `empiler` / `depiler`
+(collections_natives.py, O(1)), dans chaque moteur et pour des tailles
+croissantes : le coût de l'ancienne version croît comme n².
+
+Usage: python benchmarks/bench_collections.py [taille_max]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+
+# Algorithme de l'ancien lib/collections.fia (qui ne raccourcissait pas la pile : corrigé par retirer)
+BOUCLES = """
+fonction depiler_boucles(pile) {
+    si (longueur(pile) == 0) {
+        retourner nul
+    }
+    soit element = pile[longueur(pile) - 1]
+    soit nouvelle_pile = []
+    soit i = 0
+    tant_que (i < longueur(pile) - 1) {
+        ajouter(nouvelle_pile, pile[i])
+        i += 1
+    }
+    i = 0
+    tant_que (i < longueur(nouvelle_pile)) {
+        pile[i] = nouvelle_pile[i]
+        i += 1
+    }
+    retirer(pile, longueur(pile) - 1)
+    retourner element
+}
+"""
+
+PROGRAMME = """
+soit pile = []
+soit i = 0
+tant_que (i < {taille}) {{
+    {empiler}(pile, i)
+    i += 1
+}}
+soit total = 0
+tant_que (longueur(pile) > 0) {{
+    total += {depiler}(pile)
+}}
+imprimer(total)
+"""
+
+def chronometrer(ast, moteur, repetitions=3):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        interpreteur = creer_interpreteur(moteur, sortie)
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()[-1]
+
+def main():
+    taille_max = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    analyser = lambda code: ParserFIA(LexerFIA(code).tokeniser()).analyser()
+    taille = taille_max // 4
+    while taille <= taille_max:
+        boucles = analyser(BOUCLES + PROGRAMME.format(taille=taille, empiler="ajouter", depiler="depiler_boucles"))
+        natif = analyser(PROGRAMME.format(taille=taille, empiler="empiler", depiler="depiler"))
+        print(f"pile de {taille} éléments :")
+        for moteur in MOTEURS:
+            duree_boucles, total_boucles = chronometrer(boucles, moteur)
+            duree, total = chronometrer(natif, moteur)
+            assert total == total_boucles
+            print(f"  {moteur:<9}: {duree_boucles * 1000:8.1f} ms -> {duree * 1000:6.1f} ms "
+                  f"natif (x{duree_boucles / duree:.0f})")
+        taille *= 2
+
+if __name__ == "__main__":
+    main()
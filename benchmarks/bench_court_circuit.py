@@ -0,0 +1,94 @@
+# bench_court_circuit.py
+"""
+Gain du court-circuit de `et` / `ou` sur du code à gardes, dans le style de
+l'analyseur SEO (exemples/seo_analyzer) : tests d'attributs d'images, mots-clés
+cherchés dans un texte, garde `x != "" et calcul(x)`.
+
+Chaque moteur exécute le programme tel quel, puis avec les `et` / `ou`
+remplacés par des opérateurs évaluant toujours leurs deux côtés (ancienne
+sémantique).
+
+Usage: python benchmarks/bench_court_circuit.py [nombre_de_pages]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from fia_ast import Noeud, ExpressionBinaire, ExpressionLogique
+
+PROGRAMME = """
+fonction contient_mot(texte, mot) {{
+    pour m dans diviser(minuscule(texte), " ") {{
+        si (m == mot) {{ retourner vrai }}
+    }}
+    retourner faux
+}}
+
+fonction score_page(page) {{
+    soit score = 0
+    pour image dans page["images"] {{
+        si (image["alt"] == "" ou longueur(image["alt"]) < 3) {{ score -= 1 }}
+    }}
+    si (contient_mot(page["titre"], "seo") ou contient_mot(page["titre"], "analyse")) {{ score += 5 }}
+    si (page["description"] != "" et contient_mot(page["description"], "découvrez")) {{ score += 2 }}
+    retourner score
+}}
+
+soit images = [{{"alt": ""}}, {{"alt": "logo de la page"}}, {{"alt": ""}}, {{"alt": "photo"}}]
+soit page = {{"images": images, "titre": "seo : guide complet du référencement naturel", "description": ""}}
+soit total = 0
+soit n = 0
+tant_que (n < {pages}) {{
+    total += score_page(page)
+    n += 1
+}}
+imprimer(total)
+"""
+
+def sans_court_circuit(noeud):
+    """Remplace (sur place) les ExpressionLogique par des ExpressionBinaire
+    qui évaluent toujours leurs deux opérandes"""
+    if isinstance(noeud, list):
+        return [sans_court_circuit(element) for element in noeud]
+    if isinstance(noeud, dict):
+        return {cle: sans_court_circuit(valeur) for cle, valeur in noeud.items()}
+    if not isinstance(noeud, Noeud):
+        return noeud
+    for champ in type(noeud).__slots__:
+        if hasattr(noeud, champ):
+            setattr(noeud, champ, sans_court_circuit(getattr(noeud, champ)))
+    if isinstance(noeud, ExpressionLogique):
+        return ExpressionBinaire(noeud.gauche, noeud.operateur, noeud.droite)
+    return noeud
+
+def chronometrer(ast, moteur, repetitions=3):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        debut = time.perf_counter()
+        creer_interpreteur(moteur, sortie).executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()[-1]
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    code = PROGRAMME.format(pages=pages)
+    analyser = lambda: ParserFIA(LexerFIA(code).tokeniser()).analyser()
+    court_circuit = analyser()
+    sans = sans_court_circuit(analyser())
+    print(f"analyse de {pages} pages :")
+    for moteur in MOTEURS:
+        duree_sans, total_sans = chronometrer(sans, moteur)
+        duree, total = chronometrer(court_circuit, moteur)
+        assert total == total_sans
+        print(f"  {moteur:<9}: {duree_sans * 1000:7.1f} ms -> {duree * 1000:7.1f} ms "
+              f"avec court-circuit (x{duree_sans / duree:.1f})")
+
+if __name__ == "__main__":
+    main()
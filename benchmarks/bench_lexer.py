@@ -0,0 +1,68 @@
+# bench_lexer.py
+"""
+Compare les modes du lexer F-IA ('caracteres' historique et 'table').
+
+Usage: python benchmarks/bench_lexer.py [taille_synthetique_en_octets]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import glob
+import time
+from lexer import LexerFIA, MODES_LEXER
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MOTIF_SYNTHETIQUE = '''# rapport généré
+fonction ligne_rapport_{n}(valeur, total) {{
+    soit pourcentage = valeur * 100 / total  // ratio
+    si (pourcentage >= 50 et valeur != 0) {{
+        retourner "Élevé: " + chaine(pourcentage)
+    }} sinon {{
+        retourner 'Faible'
+    }}
+}}
+soit donnees_{n} = {{"nom": "section {n}", "valeurs": [1, 2.5, 3, {n}]}}
+imprimer(ligne_rapport_{n}(donnees_{n}["valeurs"][3], 1000))
+'''
+
+def source_synthetique(taille):
+    morceaux = []
+    longueur = 0
+    n = 0
+    while longueur < taille:
+        morceau = MOTIF_SYNTHETIQUE.format(n=n)
+        morceaux.append(morceau)
+        longueur += len(morceau)
+        n += 1
+    return ''.join(morceaux)
+
+def mesurer(code, mode, repetitions):
+    meilleur = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        lexer = LexerFIA(code, mode)
+        # Chaque mode est mesuré sur sa sortie native (celle que reçoit le parser)
+        nb_tokens = len(lexer.tokeniser_tampon() if mode == 'table' else lexer.tokeniser())
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, nb_tokens
+
+def comparer(titre, code, repetitions):
+    print(f"{titre} ({len(code) / 1024:.0f} Ko)")
+    durees = {}
+    for mode in MODES_LEXER:
+        durees[mode], nb_tokens = mesurer(code, mode, repetitions)
+        print(f"  {mode:<11} {durees[mode] * 1000:9.1f} ms  {nb_tokens} tokens")
+    print(f"  accélération: x{durees['caracteres'] / durees['table']:.1f}")
+
+def main():
+    taille = int(sys.argv[1]) if len(sys.argv) > 1 else 1024 * 1024
+    fichiers = sorted(glob.glob(os.path.join(RACINE, 'exemples', '**', '*.fia'), recursive=True))
+    exemples = '\n'.join(open(f, encoding='utf-8').read() for f in fichiers)
+    comparer(f"exemples/ ({len(fichiers)} fichiers)", exemples, 5)
+    comparer("synthétique", source_synthetique(taille), 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# bench_memoisation.py
+"""
+Mémoïsation d'une fonction pure : normalisation de mots (boucle sur les
+caractères, comme lib/texte.fia) appliquée à un texte où les mots se
+répètent, dans chaque moteur, sans puis avec `memoiser("normaliser", 256)`.
+Les statistiques du cache (succès / échecs) sont affichées par le script.
+
+Usage: python benchmarks/bench_memoisation.py [mots] [vocabulaire]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+
+PROGRAMME = """
+fonction normaliser(mot) {{
+    soit resultat = ""
+    pour c dans minuscule(mot) {{
+        si (c == "é" ou c == "è" ou c == "ê") {{ c = "e" }}
+        si (c == "à" ou c == "â") {{ c = "a" }}
+        si (c != "-" et c != "'") {{ resultat = resultat + c }}
+    }}
+    retourner resultat
+}}
+{memoiser}
+soit vocabulaire = []
+soit i = 0
+tant_que (i < {vocabulaire}) {{
+    ajouter(vocabulaire, "Élément-Référencé-" + i)
+    i += 1
+}}
+soit total = 0
+soit n = 0
+tant_que (n < {mots}) {{
+    total += longueur(normaliser(vocabulaire[(n * 7) % {vocabulaire}]))
+    n += 1
+}}
+imprimer(total)
+{statistiques}
+"""
+
+def chronometrer(ast, moteur, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        interpreteur = creer_interpreteur(moteur, sortie)
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()
+
+def main():
+    mots = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    vocabulaire = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    analyser = lambda memoiser, statistiques: ParserFIA(LexerFIA(PROGRAMME.format(
+        mots=mots, vocabulaire=vocabulaire, memoiser=memoiser, statistiques=statistiques)).tokeniser()).analyser()
+    simple = analyser("", "")
+    memoise = analyser('memoiser("normaliser", 256)', 'imprimer(statistiques_memo("normaliser"))')
+    print(f"{mots} mots normalisés, {vocabulaire} mots différents :")
+    for moteur in MOTEURS:
+        duree_simple, lignes_simple = chronometrer(simple, moteur)
+        duree, lignes = chronometrer(memoise, moteur)
+        assert lignes[-2] == lignes_simple[-1]
+        print(f"  {moteur:<9}: {duree_simple * 1000:7.1f} ms -> {duree * 1000:7.1f} ms "
+              f"avec memoiser (x{duree_simple / duree:.2f}) ; {lignes[-1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# bench_operateurs.py
+"""
+Coût des opérateurs binaires : boucle arithmétique dans chaque moteur, et
+évaluation seule d'une expression par l'interpréteur d'arbre, avec le cache
+en ligne des ExpressionBinaire (opération spécialisée pour les types
+d'opérandes) et avec la sémantique complète (conversion des chaînes).
+
+Usage: python benchmarks/bench_operateurs.py [tours]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+import interpreter
+
+BOUCLE = """
+soit total = 0
+soit i = 0
+tant_que (i < {tours}) {{
+    total = total + i * 2 - (i % 7) / 3
+    i += 1
+}}
+"""
+
+def analyser(code):
+    return ParserFIA(LexerFIA(code).tokeniser()).analyser()
+
+def meilleur_temps(fonction, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur
+
+def evaluer_expression(tours, specialiser):
+    """Évalue `a * 2 - (a % 7) / 3 + 1.5` `tours` fois (a = 12)"""
+    interpreteur = creer_interpreteur('arbre', SortieFIA(flux=None))
+    interpreteur.executer(analyser("soit a = 12"))
+    expression = analyser("soit x = a * 2 - (a % 7) / 3 + 1.5").instructions[0].valeur
+    originale = interpreter.operation_specialisee
+    if not specialiser:
+        interpreter.operation_specialisee = lambda code, type_gauche, type_droite: None
+    try:
+        executer = interpreteur.executer
+        return meilleur_temps(lambda: [executer(expression) for _ in range(tours)])
+    finally:
+        interpreter.operation_specialisee = originale
+
+def main():
+    tours = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    ast = analyser(BOUCLE.format(tours=tours))
+    print(f"boucle arithmétique, {tours} tours :")
+    for moteur in MOTEURS:
+        duree = meilleur_temps(lambda: creer_interpreteur(moteur, SortieFIA(flux=None)).executer(ast))
+        print(f"  {moteur:<9}: {duree * 1000:7.1f} ms")
+
+    print(f"expression seule (moteur arbre), {tours} évaluations :")
+    complete = evaluer_expression(tours, specialiser=False)
+    specialisee = evaluer_expression(tours, specialiser=True)
+    print(f"  sémantique complète : {complete * 1000:7.1f} ms")
+    print(f"  cache en ligne      : {specialisee * 1000:7.1f} ms  (x{complete / specialisee:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# bench_recursion_terminale.py
+"""
+Appels terminaux : parcours récursif d'une liste avec accumulateur (style
+lib/*.fia) dans chaque moteur, avec réutilisation du cadre
+(`Retour.appel_terminal`, marqué par resolveur.py) puis avec des appels
+imbriqués ordinaires, comparés à la même somme écrite avec une boucle.
+
+Sans appel terminal, les moteurs arbre et closures dépassent la pile Python
+dès quelques dizaines de niveaux : la liste est donc parcourue par tranches.
+
+Usage: python benchmarks/bench_recursion_terminale.py [taille_tranche] [tranches]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from fia_ast import Retour
+
+RECURSION = """
+fonction somme(liste, i, acc) {{
+    si (i >= longueur(liste)) {{ retourner acc }}
+    retourner somme(liste, i + 1, acc + liste[i])
+}}
+soit liste = []
+soit n = 0
+tant_que (n < {taille}) {{
+    ajouter(liste, n)
+    n += 1
+}}
+soit total = 0
+soit t = 0
+tant_que (t < {tranches}) {{
+    total += somme(liste, 0, 0)
+    t += 1
+}}
+imprimer(total)
+"""
+
+BOUCLE = """
+fonction somme(liste) {{
+    soit acc = 0
+    pour x dans liste {{ acc += x }}
+    retourner acc
+}}
+soit liste = []
+soit n = 0
+tant_que (n < {taille}) {{
+    ajouter(liste, n)
+    n += 1
+}}
+soit total = 0
+soit t = 0
+tant_que (t < {tranches}) {{
+    total += somme(liste)
+    t += 1
+}}
+imprimer(total)
+"""
+
+def sans_appels_terminaux(noeud):
+    """Retire (sur place) les marques d'appel terminal posées par le résolveur"""
+    a_visiter = [noeud]
+    while a_visiter:
+        courant = a_visiter.pop()
+        if isinstance(courant, Retour):
+            courant.appel_terminal = False
+        if isinstance(courant, list):
+            a_visiter.extend(courant)
+        elif hasattr(type(courant), '__slots__'):
+            a_visiter.extend(getattr(courant, champ, None) for champ in type(courant).__slots__)
+    return noeud
+
+def chronometrer(ast, moteur, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        interpreteur = creer_interpreteur(moteur, sortie)
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()[-1]
+
+def main():
+    taille = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    tranches = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    analyser = lambda code: ParserFIA(LexerFIA(code.format(taille=taille, tranches=tranches)).tokeniser()).analyser()
+    terminale, imbriquee, boucle = analyser(RECURSION), sans_appels_terminaux(analyser(RECURSION)), analyser(BOUCLE)
+    print(f"somme récursive de {tranches} listes de {taille} éléments :")
+    for moteur in MOTEURS:
+        duree_imbriquee, total_imbrique = chronometrer(imbriquee, moteur)
+        duree, total = chronometrer(terminale, moteur)
+        duree_boucle, total_boucle = chronometrer(boucle, moteur)
+        assert total == total_imbrique == total_boucle
+        print(f"  {moteur:<9}: {duree_imbriquee * 1000:7.1f} ms -> {duree * 1000:7.1f} ms avec appels terminaux "
+              f"(x{duree_imbriquee / duree:.2f}) ; boucle : {duree_boucle * 1000:7.1f} ms")
+
+    # Au-delà de la pile Python : une seule liste longue
+    longue = analyser(RECURSION.replace("{taille}", "{taille}000").replace("{tranches}", "1"))
+    for moteur in MOTEURS:
+        duree, _ = chronometrer(longue, moteur, repetitions=1)
+        print(f"  liste de {taille}000 éléments, {moteur:<9}: {duree * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
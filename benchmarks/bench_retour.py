@@ -0,0 +1,111 @@
+# bench_retour.py
+"""
+Coût de `retourner` : récursion, fib récursif et boucle d'appels
+courts, dans les moteurs arbre et closures, avec le résultat RETOUR propagé
+par les blocs et les boucles, puis avec l'ancien mécanisme (ReturnException
+levée par `retourner` et rattrapée par l'appel de fonction).
+
+La machine virtuelle retourne déjà par une instruction RETOURNER.
+
+Usage: python benchmarks/bench_retour.py [repetitions]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+from lexer import LexerFIA
+from parser import ParserFIA
+from sortie import SortieFIA
+from errors import ReturnException
+from interpreter import VisiteurInterpretation
+from compilateur_closures import InterpreteurClosures
+
+PROGRAMMES = {
+    "récursion (profondeur 60)": """
+fonction somme(n) {{
+    si (n == 0) {{ retourner 0 }}
+    retourner n + somme(n - 1)
+}}
+soit total = 0
+soit i = 0
+tant_que (i < {repetitions} * 5) {{
+    total += somme(60)
+    i += 1
+}}
+imprimer(total)
+""",
+    "fib(20)": """
+fonction fib(n) {{
+    si (n < 2) {{ retourner n }}
+    retourner fib(n - 1) + fib(n - 2)
+}}
+imprimer(fib(20))
+""",
+    "appels courts": """
+fonction premier_pair(liste) {{
+    pour x dans liste {{
+        si (x % 2 == 0) {{ retourner x }}
+    }}
+    retourner nul
+}}
+soit liste = [1, 3, 4, 5]
+soit total = 0
+soit i = 0
+tant_que (i < {repetitions} * 100) {{
+    total += premier_pair(liste)
+    i += 1
+}}
+imprimer(total)
+""",
+}
+
+class RetourParException:
+    """Ancien mécanisme : `retourner` lève ReturnException, l'appel la rattrape"""
+
+    def visiter_retour(self, retour):
+        raise ReturnException(self.executer(retour.valeur) if retour.valeur is not None else None)
+
+    def _compiler_retour(self, retour):
+        valeur = self.compiler(retour.valeur) if retour.valeur is not None else (lambda: None)
+
+        def retourner():
+            raise ReturnException(valeur())
+        return retourner
+
+    def _executer_fonction(self, func_def, args):
+        try:
+            return super()._executer_fonction(func_def, args)
+        except ReturnException as e:
+            return e.value
+
+MOTEURS = {
+    'arbre': (type('ArbreException', (RetourParException, VisiteurInterpretation), {}), VisiteurInterpretation),
+    'closures': (type('ClosuresException', (RetourParException, InterpreteurClosures), {}), InterpreteurClosures),
+}
+
+def chronometrer(ast, classe, repetitions=5):
+    meilleur = None
+    for _ in range(repetitions):
+        sortie = SortieFIA(flux=None, capturer=True)
+        interpreteur = classe(sortie)
+        debut = time.perf_counter()
+        interpreteur.executer(ast)
+        duree = time.perf_counter() - debut
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur, sortie.texte().splitlines()[-1]
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    for titre, code in PROGRAMMES.items():
+        ast = ParserFIA(LexerFIA(code.format(repetitions=repetitions)).tokeniser()).analyser()
+        print(f"{titre} :")
+        for moteur, (ancienne, nouvelle) in MOTEURS.items():
+            duree_exception, resultat_exception = chronometrer(ast, ancienne)
+            duree, resultat = chronometrer(ast, nouvelle)
+            assert resultat == resultat_exception
+            print(f"  {moteur:<9}: {duree_exception * 1000:7.1f} ms (exception) -> {duree * 1000:7.1f} ms "
+                  f"(x{duree_exception / duree:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# bench_tokens.py
+"""
+Mémoire du flux de tokens et coût du parser : liste de Token contre TamponTokens.
+
+Usage: python benchmarks/bench_tokens.py [nombre_de_lignes]
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import time
+import tracemalloc
+from lexer import LexerFIA
+from parser import ParserFIA
+
+LIGNES_MOTIF = [
+    'soit total_{n} = 0',
+    'fonction calcul_{n}(a, b) {{',
+    '    si (a >= b et b != 0) {{ retourner a / b }}',
+    '    retourner [a, b, "valeur {n}"]',
+    '}}',
+    'total_{n} += calcul_{n}({n}, 2.5)',
+    'imprimer({{"cle": total_{n}}})',
+    '# commentaire {n}',
+]
+
+def source_synthetique(nb_lignes):
+    lignes = []
+    n = 0
+    while len(lignes) < nb_lignes:
+        lignes.extend(ligne.format(n=n) for ligne in LIGNES_MOTIF)
+        n += 1
+    return '\n'.join(lignes[:nb_lignes])
+
+def memoire(construire):
+    gc.collect()
+    tracemalloc.start()
+    resultat = construire()
+    taille, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultat, taille
+
+def chronometrer(fonction):
+    debut = time.perf_counter()
+    fonction()
+    return time.perf_counter() - debut
+
+def main():
+    nb_lignes = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    code = source_synthetique(nb_lignes)
+    print(f"{nb_lignes} lignes, {len(code) / 1024:.0f} Ko")
+
+    liste, taille_liste = memoire(lambda: LexerFIA(code, 'caracteres').tokeniser())
+    tampon, taille_tampon = memoire(lambda: LexerFIA(code).tokeniser_tampon())
+    print(f"  liste de Token : {len(liste)} tokens, {taille_liste / 1e6:6.1f} Mo")
+    print(f"  TamponTokens   : {len(tampon)} tokens, {taille_tampon / 1e6:6.1f} Mo "
+          f"(x{taille_liste / taille_tampon:.1f} moins)")
+
+    duree_liste = chronometrer(lambda: ParserFIA(liste).analyser())
+    duree_tampon = chronometrer(lambda: ParserFIA(tampon).analyser())
+    print(f"  parser (liste convertie) : {duree_liste * 1000:7.1f} ms")
+    print(f"  parser (tampon)          : {duree_tampon * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# budget.py
+"""
+Budget d'exécution d'un interpréteur F-IA.
+
+Limites (None = pas de limite) :
+  - max_instructions : nombre de pas, un pas étant une itération de boucle
+    ou un appel de fonction F-IA (les seules constructions non bornées) ;
+  - delai            : durée maximale en secondes depuis le début du programme ;
+  - max_profondeur   : profondeur maximale d'appels de fonctions F-IA ;
+  - max_elements     : taille maximale d'une liste ou d'un dictionnaire.
+
+Coût dans les boucles : un décompte (`restants -= 1`) et une comparaison par
+pas. `verifier()` n'est appelé que lorsque le décompte passe sous zéro, au
+plus tous les `INTERVALLE_HORLOGE` pas : c'est lui qui cumule les pas et lit
+l'horloge. Une limite atteinte lève `LimiteExecutionError`.
+
+Pendant l'exécution d'un programme, le budget de l'interpréteur est le
+budget courant (`budget_courant()`, une ContextVar) : les fonctions intégrées
+qui agrandissent une liste ou un dictionnaire y vérifient `limite_elements`.
+"""
+import sys
+import time
+from contextvars import ContextVar
+from errors import LimiteExecutionError
+
+# Pas entre deux lectures de l'horloge
+INTERVALLE_HORLOGE = 4096
+
+class BudgetExecution:
+    """Limites d'exécution et consommation d'un interpréteur"""
+    __slots__ = ('max_instructions', 'delai', 'max_profondeur', 'max_elements',
+                 'restants', 'consommes', 'profondeur', 'limite_profondeur', 'limite_elements',
+                 'echeance', '_tranche', '_activations')
+
+    def __init__(self, max_instructions=None, delai=None, max_profondeur=None, max_elements=None):
+        self.max_instructions = max_instructions
+        self.delai = delai
+        self.max_profondeur = max_profondeur
+        self.max_elements = max_elements
+        # Bornes comparées dans le code chaud (sys.maxsize = pas de limite)
+        self.limite_profondeur = sys.maxsize if max_profondeur is None else max_profondeur
+        self.limite_elements = sys.maxsize if max_elements is None else max_elements
+        self.profondeur = 0
+        self._activations = 0
+        self.demarrer()
+
+    @classmethod
+    def depuis_dict(cls, limites):
+        """Budget à partir de {'instructions', 'delai', 'profondeur', 'elements'}"""
+        limites = limites or {}
+        return cls(
+            max_instructions=limites.get('instructions'),
+            delai=limites.get('delai'),
+            max_profondeur=limites.get('profondeur'),
+            max_elements=limites.get('elements'),
+        )
+
+    def demarrer(self):
+        """Remet la consommation à zéro et lance le chronomètre"""
+        self.consommes = 0
+        self.echeance = None if self.delai is None else time.monotonic() + self.delai
+        self._nouvelle_tranche()
+
+    def _nouvelle_tranche(self):
+        tranche = INTERVALLE_HORLOGE
+        if self.max_instructions is not None:
+            tranche = min(tranche, self.max_instructions - self.consommes)
+        self._tranche = self.restants = tranche
+
+    def verifier(self):
+        """Appelé quand le décompte passe sous zéro : cumule les pas et lit l'horloge"""
+        self.consommes += self._tranche - self.restants
+        if self.max_instructions is not None and self.consommes > self.max_instructions:
+            raise LimiteExecutionError(
+                f"Limite d'exécution atteinte : plus de {self.max_instructions} instructions", 'instructions')
+        if self.echeance is not None and time.monotonic() > self.echeance:
+            raise LimiteExecutionError(
+                f"Limite d'exécution atteinte : durée supérieure à {self.delai} secondes", 'delai')
+        self._nouvelle_tranche()
+
+    def pas_consommes(self):
+        """Nombre de pas exécutés depuis le démarrage"""
+        return self.consommes + self._tranche - self.restants
+
+    def depasser_profondeur(self):
+        raise LimiteExecutionError(
+            f"Limite d'exécution atteinte : profondeur d'appels supérieure à {self.max_profondeur}"
+            if self.max_profondeur is not None else
+            "Limite d'exécution atteinte : profondeur d'appels trop grande pour l'interpréteur", 'profondeur')
+
+    def depasser_elements(self):
+        raise LimiteExecutionError(
+            f"Limite d'exécution atteinte : une liste ou un dictionnaire dépasse {self.max_elements} éléments",
+            'elements')
+
+    def verifier_taille(self, taille):
+        """Vérifie la taille d'une liste ou d'un dictionnaire créé ou agrandi"""
+        if taille > self.limite_elements:
+            self.depasser_elements()
+
+    # === ACTIVATION (programme en cours) ===
+
+    def activer(self):
+        """Fait de ce budget le budget courant ; le chronomètre part au premier programme"""
+        if self._activations == 0:
+            self.demarrer()
+        self._activations += 1
+        return _budget_courant.set(self)
+
+    def desactiver(self, jeton):
+        self._activations -= 1
+        _budget_courant.reset(jeton)
+
+# Budget utilisé hors de toute exécution : aucune limite
+BUDGET_ILLIMITE = BudgetExecution()
+
+_budget_courant = ContextVar('budget_fia', default=BUDGET_ILLIMITE)
+
+def budget_courant():
+    """Budget de l'interpréteur en cours d'exécution dans ce thread"""
+    return _budget_courant.get()
@@ -1,12 +1,16 @@
 # builtin.py
+import importlib
 import json
 import math
 import random
 from errors import RuntimeError
+from sortie import afficher, sortie_courante
+from budget import budget_courant
+from collections_natives import FONCTIONS_COLLECTIONS
 
 def _imprimer(*args):
-    # Supporte l'affichage de plusieurs arguments comme print
-    print(*args)
+    # Supporte l'affichage de plusieurs arguments comme print, vers le puits de l'interpréteur
+    afficher(*args)
 
 def _longueur(obj):
     try:
@@ -163,6 +167,7 @@ def _fusionner(d1, d2):
         raise RuntimeError("Erreur d'exécution: 'fusionner' attend deux dictionnaires")
     r = d1.copy()
     r.update(d2)
+    budget_courant().verifier_taille(len(r))
     return r
 
 def _vider(d):
@@ -175,6 +180,8 @@ def _vider(d):
 def _ajouter(l, e):
     if not isinstance(l, list):
         raise RuntimeError("Erreur d'exécution: 'ajouter' attend une liste")
+    if len(l) >= budget_courant().limite_elements:
+        budget_courant().depasser_elements()
     l.append(e)
     return l  # IMPORTANT: Retourner la liste
 
@@ -187,15 +194,6 @@ def _retirer(l, index):
     return l  # IMPORTANT: Retourner la liste
 
 
-def _trier(l):
-    if not isinstance(l, list):
-        raise RuntimeError("Erreur d'exécution: 'trier' attend une liste")
-    try:
-        l.sort()
-    except Exception:
-        raise RuntimeError("Erreur d'exécution: la liste ne peut pas être triée")
-    return l
-
 def _inverser(l):
     if not isinstance(l, list):
         raise RuntimeError("Erreur d'exécution: 'inverser' attend une liste")
@@ -253,6 +251,8 @@ def _joindre(l, sep):
 
 # I/O utilisateur
 def _lire():
+    # Ce qui a été imprimé doit être visible avant la saisie
+    sortie_courante().vider()
     try:
         return input()
     except EOFError:
@@ -268,49 +268,93 @@ def _arreter():
     # Cette fonction peut être interceptée par l'interpréteur si besoin
     raise _ArretProgramme()
 
+# === REGISTRE DIFFÉRÉ DES BACKENDS PYTHON ===
+# Les noms sont enregistrés dès le départ ; le module Python qui les implémente
+# (openai, pandas, scikit-learn...) n'est importé qu'au premier appel.
+class FonctionDifferee:
+    """Fonction intégrée dont le module Python n'est importé qu'au premier appel"""
+    __slots__ = ('module', 'attribut', 'message_import', 'prefixe_erreur', '_fonction', '_erreur', '__name__')
+
+    def __init__(self, module, attribut, message_import, prefixe_erreur="Erreur"):
+        self.module = module
+        self.attribut = attribut
+        self.message_import = message_import
+        self.prefixe_erreur = prefixe_erreur
+        self._fonction = None
+        self._erreur = None
+        self.__name__ = attribut
+
+    def charger(self):
+        """Importe le backend (une seule tentative) et retourne la fonction Python"""
+        if self._fonction is None:
+            if self._erreur is None:
+                try:
+                    self._fonction = getattr(importlib.import_module(self.module), self.attribut)
+                    return self._fonction
+                except ImportError:
+                    # Si les dépendances du backend ne sont pas installées
+                    self._erreur = self.message_import
+                except Exception as e:
+                    # Autres erreurs (clés API manquantes, etc.)
+                    self._erreur = f"{self.prefixe_erreur}: {e}"
+            raise RuntimeError(self._erreur)
+        return self._fonction
+
+    def __call__(self, *args):
+        fonction = self._fonction
+        if fonction is None:
+            fonction = self.charger()
+        return fonction(*args)
+
+# Modules Python chargés à la demande (rapport de main.py --profil-demarrage)
+BACKENDS_DIFFERES = ('ia_module', 'ai_integration', 'ml_backend', 'vision_backend')
+
 # === NOUVELLES FONCTIONS IA ===
-# Import avec gestion d'erreur pour les dépendances IA
-def _safe_import_ai():
-    """Import sécurisé du module IA"""
-    try:
-        from ai_integration import (
-            _appeler_ia, _lister_plateformes_ia, _lister_modeles_ia, 
-            _generer_reponse_bot, _verifier_config_ia
-        )
-        return {
-            'appeler_ia': _appeler_ia,
-            'lister_plateformes_ia': _lister_plateformes_ia,
-            'lister_modeles_ia': _lister_modeles_ia,
-            'generer_reponse_bot': _generer_reponse_bot,
-            'verifier_config_ia': _verifier_config_ia
-        }
-    except ImportError as e:
-        # Si les dépendances IA ne sont pas installées
-        def _ia_non_disponible(*args, **kwargs):
-            raise RuntimeError("Fonctions IA non disponibles. Installez les dépendances: pip install -r requirements.txt")
-        
-        return {
-            'appeler_ia': _ia_non_disponible,
-            'lister_plateformes_ia': _ia_non_disponible,
-            'lister_modeles_ia': _ia_non_disponible,
-            'generer_reponse_bot': _ia_non_disponible,
-            'verifier_config_ia': _ia_non_disponible
-        }
-    except Exception as e:
-        # Autres erreurs (clés API manquantes, etc.)
-        def _ia_erreur(*args, **kwargs):
-            raise RuntimeError(f"Erreur IA: {str(e)}")
-        
-        return {
-            'appeler_ia': _ia_erreur,
-            'lister_plateformes_ia': _ia_erreur,
-            'lister_modeles_ia': _ia_erreur,
-            'generer_reponse_bot': _ia_erreur,
-            'verifier_config_ia': _ia_erreur
-        }
-
-# Charger les fonctions IA
-_ai_functions = _safe_import_ai()
+_IA_NON_DISPONIBLE = "Fonctions IA non disponibles. Installez les dépendances: pip install -r requirements.txt"
+
+_ai_functions = {
+    nom: FonctionDifferee('ai_integration', attribut, _IA_NON_DISPONIBLE, "Erreur IA")
+    for nom, attribut in (
+        ('appeler_ia', '_appeler_ia'),
+        ('lister_plateformes_ia', '_lister_plateformes_ia'),
+        ('lister_modeles_ia', '_lister_modeles_ia'),
+        ('generer_reponse_bot', '_generer_reponse_bot'),
+        ('verifier_config_ia', '_verifier_config_ia'),
+    )
+}
+
+# Fonctions du module IA intégré (ia_module.FONCTIONS_IA), mêmes noms en Python
+FONCTIONS_IA = {
+    nom: FonctionDifferee('ia_module', nom, "Module IA non disponible.")
+    for nom in ('reseau_neuronal', 'apprentissage', 'prediction',
+                'charger_jeu_de_donnees', 'evaluer_modele')
+}
+
+# === FRONTIÈRE AVEC LES BACKENDS PYTHON (ML, VISION) ===
+def _vers_python(valeur, memo):
+    """Copie indépendante d'une valeur F-IA ; chaque liste/dictionnaire n'est converti qu'une fois"""
+    if not isinstance(valeur, (list, dict)):
+        return valeur
+    copie = memo.get(id(valeur))
+    if copie is not None:
+        return copie
+    if isinstance(valeur, list):
+        copie = memo[id(valeur)] = []
+        copie.extend(_vers_python(element, memo) for element in valeur)
+    else:
+        copie = memo[id(valeur)] = {}
+        copie.update((cle, _vers_python(v, memo)) for cle, v in valeur.items())
+    return copie
+
+def _frontiere_python(fonction):
+    """Les backends peuvent conserver leurs arguments : on leur passe une copie
+    faite une seule fois par appel, les builtins F-IA reçoivent les valeurs par référence"""
+    def appel(*args):
+        memo = {}
+        return fonction(*[_vers_python(arg, memo) for arg in args])
+    appel.__name__ = fonction.__name__
+    appel.__doc__ = fonction.__doc__
+    return appel
 
 # === INTERFACE MACHINE LEARNING ===
 def _appeler_python_ml(nom_fonction, args):
@@ -350,13 +394,15 @@ FONCTIONS_INTEGREES = {
     # Listes
     "ajouter": _ajouter,
     "retirer": _retirer,
-    "trier": _trier,
     "inverser": _inverser,
     "copier": _copier,
     "contient": _contient,
     "index_de": _index_de,
     "compter": _compter,
 
+    # Piles, files, tranches, tri avec clé (collections_natives.py)
+    **FONCTIONS_COLLECTIONS,
+
     # Chaînes
     "majuscule": _majuscule,
     "minuscule": _minuscule,
@@ -369,10 +415,10 @@ FONCTIONS_INTEGREES = {
     "arreter": _arreter,
 
     # === INTERFACE MACHINE LEARNING ===
-    "appeler_python_ml": _appeler_python_ml,
+    "appeler_python_ml": _frontiere_python(_appeler_python_ml),
 
     # === INTERFACE VISION PAR ORDINATEUR ===
-    "appeler_python_vision": lambda nom, args: __import__("vision_backend")._appeler_python_vision(nom, args),
+    "appeler_python_vision": _frontiere_python(lambda nom, args: __import__("vision_backend")._appeler_python_vision(nom, args)),
 
     # === FONCTIONS IA INTÉGRÉES ===
     "appeler_ia": _ai_functions['appeler_ia'],
@@ -0,0 +1,136 @@
+# cache_ast.py
+"""
+Cache disque des AST F-IA (fichiers .fiac).
+
+Chaque source `dossier/nom.fia` a son entrée `dossier/.fiac/nom.fiac` :
+un en-tête (signature du compilateur, chemin, mtime, taille, empreinte
+du contenu) suivi de l'AST déjà résolu, sérialisés avec pickle.
+
+Validation d'une entrée :
+  - signature du compilateur (sources du lexer, du parser, de l'AST et du
+    résolveur) ou chemin différents : l'entrée est ignorée ;
+  - mtime et taille identiques : l'AST est chargé sans relire la source ;
+  - sinon la source est relue et son empreinte SHA-256 comparée, si bien
+    qu'un simple `touch` ne force pas une nouvelle analyse.
+
+Une entrée illisible ou un dossier non inscriptible ne sont jamais des
+erreurs : on retombe sur l'analyse normale.
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+DOSSIER_CACHE = '.fiac'
+EXTENSION_CACHE = '.fiac'
+
+# Toute modification de ces fichiers change le format de l'AST en cache
+SOURCES_COMPILATEUR = ('lexer.py', 'parser.py', 'fia_ast.py', 'resolveur.py', 'operateurs.py')
+
+def analyser_source(contenu):
+    """Lexe et parse un code source F-IA"""
+    from lexer import LexerFIA
+    from parser import ParserFIA
+    return ParserFIA(LexerFIA(contenu).tokeniser_tampon()).analyser()
+
+def _decoder(octets):
+    # Même résultat qu'une lecture en mode texte (fins de ligne universelles)
+    return octets.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+class CacheAST:
+    """Charge l'AST d'un fichier F-IA depuis le cache .fiac, ou l'analyse et l'y écrit"""
+
+    def __init__(self, actif=True):
+        self.actif = actif
+        self.succes = 0
+        self.echecs = 0
+        self._signature = None
+        # OptimiseurAST appliqué à chaque AST chargé (main.py -O) ; le cache garde l'AST du parser
+        self.optimiseur = None
+
+    def signature_compilateur(self):
+        if self._signature is None:
+            empreinte = hashlib.sha256()
+            dossier = Path(__file__).resolve().parent
+            for nom in SOURCES_COMPILATEUR:
+                empreinte.update((dossier / nom).read_bytes())
+            self._signature = empreinte.hexdigest()
+        return self._signature
+
+    def chemin_cache(self, chemin_source):
+        chemin_source = Path(chemin_source)
+        return chemin_source.parent / DOSSIER_CACHE / (chemin_source.stem + EXTENSION_CACHE)
+
+    def charger(self, chemin_source):
+        """Retourne l'AST (Programme) du fichier, en passant par le cache si actif"""
+        ast = self._charger(chemin_source)
+        if self.optimiseur is not None:
+            self.optimiseur.optimiser(ast)
+        return ast
+
+    def _charger(self, chemin_source):
+        chemin_source = Path(chemin_source).resolve()
+        if not self.actif:
+            return analyser_source(_decoder(chemin_source.read_bytes()))
+
+        stat = chemin_source.stat()
+        chemin_cache = self.chemin_cache(chemin_source)
+        octets = None
+        try:
+            with open(chemin_cache, 'rb') as f:
+                entete = pickle.load(f)
+                if (entete.get('signature') == self.signature_compilateur()
+                        and entete.get('chemin') == str(chemin_source)):
+                    if (entete.get('mtime_ns'), entete.get('taille')) == (stat.st_mtime_ns, stat.st_size):
+                        ast = pickle.load(f)
+                        self.succes += 1
+                        return ast
+                    octets = chemin_source.read_bytes()
+                    if hashlib.sha256(octets).hexdigest() == entete.get('empreinte'):
+                        ast = pickle.load(f)
+                        self.succes += 1
+                        # Contenu inchangé : on rafraîchit l'en-tête pour le chemin rapide
+                        self._ecrire(chemin_cache, chemin_source, stat, octets, ast)
+                        return ast
+        except Exception:
+            # Absent, corrompu ou incompatible : l'entrée sera réécrite
+            pass
+
+        if octets is None:
+            octets = chemin_source.read_bytes()
+        ast = analyser_source(_decoder(octets))
+        self.echecs += 1
+        self._ecrire(chemin_cache, chemin_source, stat, octets, ast)
+        return ast
+
+    def _ecrire(self, chemin_cache, chemin_source, stat, octets, ast):
+        entete = {
+            'signature': self.signature_compilateur(),
+            'chemin': str(chemin_source),
+            'mtime_ns': stat.st_mtime_ns,
+            'taille': stat.st_size,
+            'empreinte': hashlib.sha256(octets).hexdigest(),
+        }
+        temporaire = chemin_cache.with_name(f"{chemin_cache.name}.{os.getpid()}.tmp")
+        try:
+            chemin_cache.parent.mkdir(exist_ok=True)
+            with open(temporaire, 'wb') as f:
+                pickle.dump(entete, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(ast, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporaire, chemin_cache)
+        except (OSError, pickle.PicklingError, RecursionError):
+            # Dossier en lecture seule, AST trop profond... : pas de cache
+            try:
+                temporaire.unlink()
+            except OSError:
+                pass
+
+    def invalider(self, chemin_source):
+        """Supprime l'entrée de cache d'un fichier"""
+        try:
+            self.chemin_cache(Path(chemin_source).resolve()).unlink()
+        except OSError:
+            pass
+
+# Instance globale du cache (comme module_resolver)
+cache_ast = CacheAST()
@@ -0,0 +1,151 @@
+# collections_natives.py
+"""
+Collections natives de F-IA : piles, files et opérations sur les listes
+écrites en Python (exposées dans FONCTIONS_INTEGREES, utilisées par
+lib/collections.fia).
+
+  - pile : une liste F-IA ; `empiler`, `depiler` et `sommet` agissent sur
+    la fin de la liste, en O(1) ;
+  - file : `creer_file()` retourne une `File` (deque affichée comme une
+    liste, parcourable par `pour ... dans`) ; `enfiler`, `defiler` et `tete`
+    sont en O(1) ;
+  - `trancher(liste, debut, fin)` : nouvelle liste (ou chaîne), indices
+    négatifs comptés depuis la fin ;
+  - `etendre(liste, autre)`, `inserer(liste, index, element)` : sur place ;
+  - `trier(liste, cle, decroissant)` : tri stable sur place ; `cle` est nul,
+    un nom de champ (liste de dictionnaires) ou une fonction.
+
+`depiler`, `defiler`, `sommet` et `tete` retournent nul sur une collection
+vide. Les opérations qui agrandissent une collection vérifient
+`max_elements` du budget courant, comme `ajouter`.
+"""
+from collections import deque
+from errors import RuntimeError
+from budget import budget_courant
+
+
+class File(deque):
+    """File F-IA : deque affichée comme une liste"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return repr(list(self))
+
+    __str__ = __repr__
+
+
+# Piles (listes) et files
+def _empiler(pile, element):
+    if not isinstance(pile, (list, deque)):
+        raise RuntimeError("Erreur d'exécution: 'empiler' attend une pile (liste)")
+    if len(pile) >= budget_courant().limite_elements:
+        budget_courant().depasser_elements()
+    pile.append(element)
+    return pile
+
+def _depiler(pile):
+    if not isinstance(pile, (list, deque)):
+        raise RuntimeError("Erreur d'exécution: 'depiler' attend une pile (liste)")
+    return pile.pop() if pile else None
+
+def _sommet(pile):
+    if not isinstance(pile, (list, deque)):
+        raise RuntimeError("Erreur d'exécution: 'sommet' attend une pile (liste)")
+    return pile[-1] if pile else None
+
+def _creer_file(elements=None):
+    if elements is None:
+        return File()
+    if not isinstance(elements, (list, deque)):
+        raise RuntimeError("Erreur d'exécution: 'creer_file' attend une liste")
+    return File(elements)
+
+def _enfiler(file, element):
+    if not isinstance(file, deque):
+        raise RuntimeError("Erreur d'exécution: 'enfiler' attend une file (creer_file)")
+    if len(file) >= budget_courant().limite_elements:
+        budget_courant().depasser_elements()
+    file.append(element)
+    return file
+
+def _defiler(file):
+    if not isinstance(file, deque):
+        raise RuntimeError("Erreur d'exécution: 'defiler' attend une file (creer_file)")
+    return file.popleft() if file else None
+
+def _tete(file):
+    if not isinstance(file, deque):
+        raise RuntimeError("Erreur d'exécution: 'tete' attend une file (creer_file)")
+    return file[0] if file else None
+
+# Listes
+def _trancher(l, debut, fin=None):
+    if not isinstance(l, (list, str)):
+        raise RuntimeError("Erreur d'exécution: 'trancher' attend une liste ou une chaîne")
+    if not isinstance(debut, int) or not (fin is None or isinstance(fin, int)):
+        raise RuntimeError("Erreur d'exécution: les bornes de 'trancher' doivent être des entiers")
+    return l[debut:fin]
+
+def _etendre(l, autre):
+    if not isinstance(l, list) or not isinstance(autre, (list, deque)):
+        raise RuntimeError("Erreur d'exécution: 'etendre' attend deux listes")
+    budget_courant().verifier_taille(len(l) + len(autre))
+    l.extend(autre)
+    return l
+
+def _inserer(l, index, element):
+    if not isinstance(l, list):
+        raise RuntimeError("Erreur d'exécution: 'inserer' attend une liste")
+    if not isinstance(index, int) or index < 0 or index > len(l):
+        raise RuntimeError("Erreur d'exécution: index invalide dans 'inserer'")
+    if len(l) >= budget_courant().limite_elements:
+        budget_courant().depasser_elements()
+    l.insert(index, element)
+    return l
+
+def _cle_champ(champ):
+    def cle(element):
+        if not isinstance(element, dict) or champ not in element:
+            raise RuntimeError(f"Erreur d'exécution: champ '{champ}' absent d'un élément à trier")
+        return element[champ]
+    return cle
+
+def _trier(l, cle=None, decroissant=False):
+    if not isinstance(l, list):
+        raise RuntimeError("Erreur d'exécution: 'trier' attend une liste")
+    if isinstance(cle, str):
+        cle = _cle_champ(cle)
+    elif cle is not None and not callable(cle):
+        raise RuntimeError("Erreur d'exécution: la clé de 'trier' doit être un nom de champ ou une fonction")
+    try:
+        l.sort(key=cle, reverse=bool(decroissant))
+    except TypeError:
+        raise RuntimeError("Erreur d'exécution: la liste ne peut pas être triée")
+    return l
+
+
+FONCTIONS_COLLECTIONS = {
+    "empiler": _empiler,
+    "depiler": _depiler,
+    "sommet": _sommet,
+    "creer_file": _creer_file,
+    "enfiler": _enfiler,
+    "defiler": _defiler,
+    "tete": _tete,
+    "trancher": _trancher,
+    "etendre": _etendre,
+    "inserer": _inserer,
+    "trier": _trier,
+}
+
+
+def fonctions_collections(interpreteur):
+    """`trier` liée à un interpréteur : une fonction définie peut servir de clé"""
+    def trier(l, cle=None, decroissant=False):
+        if type(cle) is dict:
+            fonction = cle
+            nom = next((nom for nom, f in interpreteur.fonctions_definies.items() if f is fonction), 'cle')
+            cle = lambda element: interpreteur._appeler_fonction_definie(nom, fonction, [element])
+        return _trier(l, cle, decroissant)
+
+    return {"trier": trier}
@@ -0,0 +1,550 @@
+# compilateur_closures.py
+"""
+Moteur d'exécution F-IA par compilation en closures.
+
+Chaque nœud de l'AST est transformé une seule fois en une fonction Python
+spécialisée (sans argument) qui capture ses sous-expressions déjà compilées.
+L'exécution n'appelle donc plus `Noeud.accepter` ni `getattr` à chaque nœud :
+la résolution du type de nœud est faite à la compilation.
+
+La sémantique est celle de `VisiteurInterpretation` : les variables sont lues
+dans le slot résolu par `resolveur.py` (cadre de la fonction) ou dans les
+globales ; les imports et les appels de fonctions passent par les mêmes
+méthodes partagées.
+"""
+from collections import deque
+from errors import RuntimeError, ReturnException
+from builtin import _ArretProgramme
+from fia_ast import *
+from interpreter import VisiteurInterpretation, NON_DEFINI, VARIABLE, RETOUR
+from resolveur import resoudre_portees
+from operateurs import OPERATEURS_BINAIRES, FONCTIONS_COMPOSEES, convertir_si_nombre
+
+
+class InterpreteurClosures(VisiteurInterpretation):
+    """Interpréteur F-IA qui exécute l'AST compilé en closures Python"""
+
+    def __init__(self, sortie=None, budget=None):
+        super().__init__(sortie, budget)
+        # Cache des closures compilées {nœud: closure}
+        self._fermetures = {}
+
+    def executer(self, noeud_ast, fichier_courant=None):
+        """Compile (une seule fois) puis exécute un nœud AST"""
+        fermeture = self._fermetures.get(noeud_ast)
+        if fermeture is None:
+            fermeture = self.compiler(noeud_ast)
+            self._fermetures[noeud_ast] = fermeture
+        if fichier_courant:
+            ancien_fichier = self.fichier_courant
+            self.fichier_courant = fichier_courant
+            try:
+                return fermeture()
+            finally:
+                self.fichier_courant = ancien_fichier
+        return fermeture()
+
+    def compiler(self, noeud):
+        """Transforme un nœud AST en closure spécialisée"""
+        nom_type = type(noeud).__name__.lower()
+        compilateur = getattr(self, '_compiler_' + nom_type, None)
+        if compilateur:
+            return compilateur(noeud)
+
+        # Nœuds rares (imports...) : on réutilise la méthode du visiteur, résolue une fois
+        methode = getattr(self, 'visiter_' + nom_type, None)
+        if methode is None:
+            raise NotImplementedError(f"Méthode visiter_{nom_type} non implémentée dans le visiteur")
+        return lambda: methode(noeud)
+
+    def _compiler_sequence(self, instructions):
+        return [self.compiler(instruction) for instruction in instructions]
+
+    def _compiler_instructions(self, instructions):
+        """Compile les instructions d'un bloc ; chaque closure garde la ligne de
+        son instruction (lue dans les cadres de executer_bloc : profileur, erreurs)"""
+        fermetures = self._compiler_sequence(instructions)
+        for fermeture, instruction in zip(fermetures, instructions):
+            if instruction.ligne:
+                fermeture.ligne = instruction.ligne
+        return fermetures
+
+    # === NŒUDS STRUCTURELS ===
+
+    def _compiler_programme(self, programme):
+        instructions = self._compiler_instructions(programme.instructions)
+
+        def executer_programme():
+            jetons = self._entrer_programme()
+            resultat = None
+            try:
+                for instruction in instructions:
+                    resultat = instruction()
+                    if resultat is RETOUR:
+                        # 'retourner' hors fonction
+                        raise ReturnException(self.valeur_retour)
+            except _ArretProgramme:
+                return None
+            except RuntimeError as e:
+                self._localiser_erreur(e)
+                raise
+            finally:
+                self._sortir_programme(jetons)
+            return resultat
+        return executer_programme
+
+    def _compiler_bloc(self, bloc):
+        instructions = self._compiler_instructions(bloc.instructions)
+
+        def executer_bloc():
+            resultat = None
+            for instruction in instructions:
+                resultat = instruction()
+                if resultat is RETOUR:
+                    return RETOUR
+            return resultat
+        return executer_bloc
+
+    def _compiler_expressionstatement(self, stmt):
+        return self.compiler(stmt.expression)
+
+    # === DÉCLARATIONS ===
+
+    def _compiler_ecriture(self, nom, slot):
+        """Closure écrivant une valeur dans la variable résolue (slot local ou globale)"""
+        if slot is None:
+            return lambda valeur: self._set_variable(nom, valeur)
+        if slot >= 0:
+            def ecrire_locale(valeur):
+                self.cadre[slot] = valeur
+            return ecrire_locale
+        globales = self.globales
+
+        def ecrire_globale(valeur):
+            globales[nom] = valeur
+        return ecrire_globale
+
+    def _compiler_declarationvariable(self, decl):
+        ecrire = self._compiler_ecriture(decl.nom, decl.slot)
+        if not decl.valeur:
+            return lambda: ecrire(None)
+
+        valeur = self.compiler(decl.valeur)
+
+        def declarer():
+            ecrire(valeur())
+        return declarer
+
+    def _compiler_fonction(self, fonction):
+        fonctions_definies = self.fonctions_definies
+        nom = fonction.nom
+        if fonction.index_locaux is None:
+            resoudre_portees(Programme([fonction]))
+        definition = {'params': fonction.parametres, 'corps': fonction.corps,
+                      'locaux': fonction.index_locaux}
+
+        def definir():
+            fonctions_definies[nom] = dict(definition)
+        return definir
+
+    def _compiler_retour(self, retour):
+        if retour.appel_terminal:
+            return self._compiler_retour_terminal(retour.valeur)
+        if retour.valeur is None:
+            def retourner_nul():
+                self.valeur_retour = None
+                return RETOUR
+            return retourner_nul
+
+        valeur = self.compiler(retour.valeur)
+
+        def retourner():
+            self.valeur_retour = valeur()
+            return RETOUR
+        return retourner
+
+    def _compiler_retour_terminal(self, appel):
+        """Comme VisiteurInterpretation._retour_terminal"""
+        arguments = self._compiler_sequence(appel.arguments)
+        nom_fonction = self._nom_fonction(appel.nom_fonction)
+        appeler = self._appeler_fonction
+        resoudre = self._resoudre_fonction
+        version = fonction = None
+
+        def retourner_appel():
+            nonlocal version, fonction
+            args = [argument() for argument in arguments]
+            if version != self.version_noms:
+                fonction = resoudre(nom_fonction)
+                version = self.version_noms
+            if type(fonction) is not dict or fonction['locaux'] is not self.cadre.index:
+                self.valeur_retour = appeler(nom_fonction, args, fonction)
+                return RETOUR
+            if len(args) != len(fonction['params']):
+                raise RuntimeError(f"La fonction '{nom_fonction}' attend {len(fonction['params'])} "
+                                   f"arguments, {len(args)} fournis.")
+            self.arguments_terminaux = args
+            return RETOUR
+        return retourner_appel
+
+    # === ASSIGNATIONS ===
+
+    def _compiler_assignation(self, assign):
+        valeur = self.compiler(assign.valeur)
+        cible = assign.cible
+
+        if isinstance(cible, Identifiant):
+            nom = cible.nom
+            slot = cible.slot
+            variable_existe = self._variable_existe
+            ecrire = self._compiler_ecriture(nom, slot)
+
+            def assigner_variable():
+                resultat = valeur()
+                if not variable_existe(nom, slot):
+                    raise RuntimeError(f"Variable '{nom}' non déclarée avant assignation")
+                ecrire(resultat)
+            return assigner_variable
+
+        if isinstance(cible, AccesIndex):
+            base = self.compiler(cible.base)
+            index = self.compiler(cible.index)
+
+            def assigner_index():
+                resultat = valeur()
+                base_list = base()
+                index_value = index()
+                if not isinstance(base_list, list):
+                    raise RuntimeError("L'opérande gauche de l'assignation par index doit être une liste")
+                if not isinstance(index_value, int):
+                    raise RuntimeError("L'index doit être un entier")
+                if index_value < 0 or index_value >= len(base_list):
+                    raise RuntimeError("Index de liste hors limites")
+                base_list[index_value] = resultat
+            return assigner_index
+
+        if isinstance(cible, AccesDictionnaire):
+            base = self.compiler(cible.base)
+            cle = self.compiler(cible.cle)
+            budget = self.budget
+
+            def assigner_cle():
+                resultat = valeur()
+                base_dict = base()
+                cle_value = cle()
+                if not isinstance(base_dict, dict):
+                    raise RuntimeError("L'opérande gauche de l'assignation par clé doit être un dictionnaire")
+                if cle_value not in base_dict and len(base_dict) >= budget.limite_elements:
+                    budget.depasser_elements()
+                base_dict[cle_value] = resultat
+            return assigner_cle
+
+        def cible_invalide():
+            valeur()
+            raise RuntimeError("Cible d'assignation invalide")
+        return cible_invalide
+
+    def _compiler_assignationcomposee(self, assign_composee):
+        cible = assign_composee.cible
+        if not isinstance(cible, Identifiant):
+            # Même comportement (et même erreur) que le visiteur
+            return lambda: self.visiter_assignationcomposee(assign_composee)
+
+        nom = cible.nom
+        slot = cible.slot
+        operateur = assign_composee.operateur
+        valeur = self.compiler(assign_composee.valeur)
+        variable_existe = self._variable_existe
+        lire = self._lire_variable
+        ecrire = self._compiler_ecriture(nom, slot)
+
+        calculer = FONCTIONS_COMPOSEES.get(operateur)
+        if calculer is None:
+            def calculer(actuelle, nouvelle):
+                raise RuntimeError(f"Opérateur d'assignation composée inconnu: {operateur}")
+
+        def assigner_compose():
+            if not variable_existe(nom, slot):
+                raise RuntimeError(f"Variable '{nom}' non déclarée avant assignation composée")
+            actuelle = lire(nom, slot)
+            ecrire(calculer(actuelle, valeur()))
+        return assigner_compose
+
+    # === EXPRESSIONS ===
+
+    def _compiler_littéral(self, litteral):
+        valeur = litteral.valeur
+        return lambda: valeur
+
+    def _compiler_identifiant(self, ident):
+        nom = ident.nom
+        slot = ident.slot
+        resoudre = self._resoudre_identifiant
+        globales = self.globales
+        # Cache en ligne : fonction de ce nom (ou VARIABLE) pour une version des fonctions
+        version = resolu = None
+
+        if slot is not None and slot >= 0:
+            def lire_locale():
+                nonlocal version, resolu
+                if version != self.version_noms:
+                    version, resolu = self.version_noms, resoudre(nom)
+                if resolu is not VARIABLE:
+                    return resolu
+                valeur = self.cadre[slot]
+                if valeur is not NON_DEFINI:
+                    return valeur
+                if nom in globales:
+                    return globales[nom]
+                raise RuntimeError(f"Variable '{nom}' non définie")
+            return lire_locale
+
+        if slot is None:
+            lire_variable = self._get_variable
+        else:
+            def lire_variable(nom):
+                if nom in globales:
+                    return globales[nom]
+                raise RuntimeError(f"Variable '{nom}' non définie")
+
+        def lire_identifiant():
+            nonlocal version, resolu
+            if version != self.version_noms:
+                version, resolu = self.version_noms, resoudre(nom)
+            if resolu is not VARIABLE:
+                return resolu
+            return lire_variable(nom)
+        return lire_identifiant
+
+    def _compiler_expressionbinaire(self, expr_bin):
+        gauche = self.compiler(expr_bin.gauche)
+        droite = self.compiler(expr_bin.droite)
+        op = expr_bin.operateur
+        convertir = convertir_si_nombre
+
+        if op == '+':
+            def additionner():
+                g = gauche()
+                d = droite()
+                if isinstance(g, str) or isinstance(d, str):
+                    return str(g) + str(d)
+                return convertir(g) + convertir(d)
+            return additionner
+
+        if op == '/':
+            def diviser():
+                g = convertir(gauche())
+                d = convertir(droite())
+                if d == 0:
+                    raise RuntimeError("Division par zéro")
+                return g / d
+            return diviser
+
+        fonction_op = OPERATEURS_BINAIRES.get(op)
+        if fonction_op is None:
+            def operateur_inconnu():
+                gauche()
+                droite()
+                raise RuntimeError(f"Opérateur binaire inconnu: {op}")
+            return operateur_inconnu
+
+        def operation():
+            g = gauche()
+            d = droite()
+            if isinstance(g, str):
+                g = convertir(g)
+            if isinstance(d, str):
+                d = convertir(d)
+            return fonction_op(g, d)
+        return operation
+
+    def _compiler_expressionlogique(self, expr_log):
+        gauche = self.compiler(expr_log.gauche)
+        droite = self.compiler(expr_log.droite)
+        convertir = convertir_si_nombre
+
+        if expr_log.operateur == 'et':
+            def et_logique():
+                g = convertir(gauche())
+                if not g:
+                    return g
+                return convertir(droite())
+            return et_logique
+
+        def ou_logique():
+            g = convertir(gauche())
+            if g:
+                return g
+            return convertir(droite())
+        return ou_logique
+
+    def _compiler_expressionunaire(self, expr_unaire):
+        operande = self.compiler(expr_unaire.operande)
+        operateur = expr_unaire.operateur
+        convertir = convertir_si_nombre
+
+        if operateur == '-':
+            return lambda: -convertir(operande())
+        if operateur == '+':
+            return lambda: convertir(operande())
+
+        def operateur_inconnu():
+            convertir(operande())
+            raise RuntimeError(f"Opérateur unaire non supporté: {operateur}")
+        return operateur_inconnu
+
+    def _compiler_accesindex(self, acces_index):
+        base = self.compiler(acces_index.base)
+        index = self.compiler(acces_index.index)
+
+        def acceder_index():
+            base_value = base()
+            index_value = index()
+
+            if isinstance(base_value, dict):
+                if index_value not in base_value:
+                    raise RuntimeError(f"Clé '{index_value}' non trouvée dans le dictionnaire")
+                return base_value[index_value]
+
+            if not isinstance(base_value, list):
+                raise RuntimeError("L'opérande gauche de l'accès par index doit être une liste ou un dictionnaire")
+            if not isinstance(index_value, int):
+                raise RuntimeError("L'index doit être un entier")
+            if index_value < 0 or index_value >= len(base_value):
+                raise RuntimeError("Index de liste hors limites")
+            return base_value[index_value]
+        return acceder_index
+
+    def _compiler_accesdictionnaire(self, acces_dict):
+        base = self.compiler(acces_dict.base)
+        cle = self.compiler(acces_dict.cle)
+
+        def acceder_cle():
+            base_value = base()
+            cle_value = cle()
+            if not isinstance(base_value, dict):
+                raise RuntimeError("L'opérande gauche de l'accès par clé doit être un dictionnaire")
+            if cle_value not in base_value:
+                raise RuntimeError(f"Clé '{cle_value}' non trouvée dans le dictionnaire")
+            return base_value[cle_value]
+        return acceder_cle
+
+    def _compiler_appelfonction(self, appel):
+        arguments = self._compiler_sequence(appel.arguments)
+
+        if isinstance(appel.nom_fonction, AccesAttribut):
+            fonction_module = self.compiler(appel.nom_fonction)
+            appeler_module = self._appeler_fonction_module
+
+            def appeler_fonction_module():
+                fonction = fonction_module()
+                return appeler_module(fonction, [argument() for argument in arguments])
+            return appeler_fonction_module
+
+        nom_fonction = self._nom_fonction(appel.nom_fonction)
+        appeler = self._appeler_fonction
+        resoudre = self._resoudre_fonction
+        # Cache en ligne : fonction résolue pour une version des fonctions
+        version = fonction = None
+
+        def appeler_fonction():
+            nonlocal version, fonction
+            args = [argument() for argument in arguments]
+            if version != self.version_noms:
+                fonction = resoudre(nom_fonction)
+                version = self.version_noms
+            return appeler(nom_fonction, args, fonction)
+        return appeler_fonction
+
+    def _compiler_listelitterale(self, liste_node):
+        elements = self._compiler_sequence(liste_node.elements)
+        return lambda: [element() for element in elements]
+
+    def _compiler_dictionnairelitteral(self, dict_node):
+        elements = [(cle, self.compiler(valeur)) for cle, valeur in dict_node.elements.items()]
+        return lambda: {cle: valeur() for cle, valeur in elements}
+
+    # === STRUCTURES DE CONTRÔLE ===
+
+    def _compiler_condition(self, condition):
+        test = self.compiler(condition.condition)
+        bloc_si = self.compiler(condition.bloc_si)
+        bloc_sinon = self.compiler(condition.bloc_sinon) if condition.bloc_sinon else None
+
+        def executer_condition():
+            if test():
+                if bloc_si() is RETOUR:
+                    return RETOUR
+            elif bloc_sinon is not None:
+                if bloc_sinon() is RETOUR:
+                    return RETOUR
+        return executer_condition
+
+    def _compiler_boucletantque(self, boucle):
+        condition = self.compiler(boucle.condition)
+        corps = self.compiler(boucle.corps)
+
+        budget = self.budget
+
+        def executer_tant_que():
+            while condition():
+                if corps() is RETOUR:
+                    return RETOUR
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+        return executer_tant_que
+
+    def _compiler_bouclepour(self, boucle):
+        init = self.compiler(boucle.init)
+        condition = self.compiler(boucle.condition)
+        increment = self.compiler(boucle.increment)
+        corps = self.compiler(boucle.corps)
+
+        budget = self.budget
+
+        def executer_pour():
+            init()
+            while condition():
+                if corps() is RETOUR:
+                    return RETOUR
+                increment()
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+        return executer_pour
+
+    def _compiler_bouclepourdans(self, boucle):
+        iterable = self.compiler(boucle.iterable)
+        corps = self.compiler(boucle.corps)
+        ecrire = self._compiler_ecriture(boucle.variable, boucle.slot)
+        budget = self.budget
+
+        def executer_pour_dans():
+            iterable_value = iterable()
+            if not isinstance(iterable_value, (list, dict, str, deque)):
+                raise RuntimeError("L'objet à droite de 'dans' doit être itérable (liste, dictionnaire ou chaîne)")
+
+            for element in iterable_value:
+                ecrire(element)
+                if corps() is RETOUR:
+                    return RETOUR
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+        return executer_pour_dans
+
+    # === PROFILAGE ===
+
+    def _ligne_cadre(self, cadre_python):
+        if cadre_python.f_code in _CODES_SEQUENCES:
+            return getattr(cadre_python.f_locals.get('instruction'), 'ligne', None)
+        return super()._ligne_cadre(cadre_python)
+
+# Cadres Python qui exécutent une suite d'instructions (local `instruction`)
+_CODES_SEQUENCES = frozenset(
+    constante
+    for methode in (InterpreteurClosures._compiler_programme, InterpreteurClosures._compiler_bloc)
+    for constante in methode.__code__.co_consts
+    if isinstance(constante, type(methode.__code__))
+)
@@ -22,7 +22,21 @@ class ParseError(FIAError):
 
 class RuntimeError(FIAError):
     """Erreur pendant l'exécution du programme."""
-    pass
+    # Ligne de l'instruction en cours, fixée par l'interpréteur quand l'erreur
+    # sort du programme (None = inconnue)
+    ligne = None
+
+    def __str__(self):
+        if self.ligne is not None:
+            return f"ligne {self.ligne}: {super().__str__()}"
+        return super().__str__()
+
+class LimiteExecutionError(RuntimeError):
+    """Une limite du budget d'exécution est atteinte (instructions, temps, profondeur, taille)."""
+    def __init__(self, message, limite=None):
+        super().__init__(message)
+        # 'instructions', 'delai', 'profondeur' ou 'elements'
+        self.limite = limite
 
 # Exception spécifique pour gérer le 'retourner'
 class ReturnException(Exception):
@@ -2,45 +2,99 @@
 """
 Nœuds de l'Arbre Syntaxique Abstrait (AST) pour le langage F-IA
 """
+from operateurs import CODES_BINAIRES
+
+# Position d'un nœud dans le source, compactée en un seul entier :
+# ligne << BITS_COLONNE | colonne (0 = inconnue)
+BITS_COLONNE = 12
+MASQUE_COLONNE = (1 << BITS_COLONNE) - 1
+
+def compacter_position(ligne, colonne):
+    """(ligne, colonne) -> entier ; les colonnes au-delà de MASQUE_COLONNE sont plafonnées"""
+    return (ligne << BITS_COLONNE) | min(colonne, MASQUE_COLONNE)
+
+# Classes de nœuds, indexées par leur `type_noeud`
+CLASSES_NOEUDS = []
 
 class Noeud:
-    """Classe de base pour tous les nœuds de l'AST"""
+    """Classe de base pour tous les nœuds de l'AST
+
+    Chaque sous-classe déclare ses champs dans `__slots__` (pas de `__dict__`
+    par nœud) et reçoit un numéro de type `type_noeud` : les visiteurs
+    distribuent les nœuds par un simple index dans leur table (`table_dispatch`).
+    """
+    # Position compactée, fixée par le parser (absente sur les nœuds construits à la main)
+    __slots__ = ('position',)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.type_noeud = len(CLASSES_NOEUDS)
+        cls.nom_visite = 'visiter_' + cls.__name__.lower()
+        CLASSES_NOEUDS.append(cls)
+
+    @property
+    def ligne(self):
+        return getattr(self, 'position', 0) >> BITS_COLONNE
+
+    @property
+    def colonne(self):
+        return getattr(self, 'position', 0) & MASQUE_COLONNE
+
     def accepter(self, visiteur):
-        nom_methode = 'visiter_' + type(self).__name__.lower()
-        methode = getattr(visiteur, nom_methode, None)
-        if methode:
-            return methode(self)
-        else:
-            raise NotImplementedError(f"Méthode {nom_methode} non implémentée dans le visiteur")
+        return table_dispatch(type(visiteur))[self.type_noeud](visiteur, self)
+
+def _methode_absente(nom_methode):
+    def absente(visiteur, noeud):
+        raise NotImplementedError(f"Méthode {nom_methode} non implémentée dans le visiteur")
+    return absente
+
+def table_dispatch(classe_visiteur):
+    """Méthodes `visiter_*` (non liées) de la classe visiteur, indexées par type_noeud ;
+    construite une fois par classe et conservée sur la classe elle-même"""
+    table = classe_visiteur.__dict__.get('_table_dispatch')
+    if table is None or len(table) != len(CLASSES_NOEUDS):
+        table = tuple(getattr(classe_visiteur, classe.nom_visite, None) or _methode_absente(classe.nom_visite)
+                      for classe in CLASSES_NOEUDS)
+        classe_visiteur._table_dispatch = table
+    return table
 
 # === NŒUDS STRUCTURELS ===
 
 class Programme(Noeud):
+    __slots__ = ('instructions',)
     def __init__(self, instructions):
         self.instructions = instructions
 
 class Bloc(Noeud):
+    __slots__ = ('instructions',)
     def __init__(self, instructions):
         self.instructions = instructions
 
 # === NŒUDS DE DÉCLARATION ET DÉFINITION ===
 
 class DeclarationVariable(Noeud):
+    __slots__ = ('nom', 'valeur', 'type_declare', 'slot')
     def __init__(self, nom, valeur=None, type_declare=None):
         self.nom = nom
         self.valeur = valeur
         self.type_declare = type_declare  # Pour le futur système de types
+        self.slot = None  # Slot local (>= 0) ou global (-1), fixé par le résolveur
 
 class Fonction(Noeud):
+    __slots__ = ('nom', 'parametres', 'corps', 'type_retour', 'index_locaux')
     def __init__(self, nom, parametres, corps, type_retour=None):
         self.nom = nom
         self.parametres = parametres
         self.corps = corps
         self.type_retour = type_retour  # Pour le futur système de types
+        self.index_locaux = None  # {nom: slot} des variables locales, fixé par le résolveur
 
 class Retour(Noeud):
+    __slots__ = ('valeur', 'appel_terminal')
     def __init__(self, valeur=None):
         self.valeur = valeur
+        # `retourner f(...)` dans le corps de f (marqué par resolveur.py) : le cadre est réutilisé
+        self.appel_terminal = False
 
 # === NOUVEAUX NŒUDS POUR LES IMPORTS ===
 
@@ -48,6 +102,7 @@ class ImportModule(Noeud):
     """
     Nœud pour : importer "chemin/module.fia" comme alias
     """
+    __slots__ = ('chemin_module', 'alias')
     def __init__(self, chemin_module, alias=None):
         self.chemin_module = chemin_module
         self.alias = alias or self._extraire_nom_defaut(chemin_module)
@@ -63,6 +118,7 @@ class ImportDepuis(Noeud):
     """
     Nœud pour : depuis "module.fia" importer fonction1, fonction2 comme alias2
     """
+    __slots__ = ('chemin_module', 'elements_importes')
     def __init__(self, chemin_module, elements_importes):
         self.chemin_module = chemin_module
         self.elements_importes = elements_importes  # Liste de (nom, alias)
@@ -70,11 +126,13 @@ class ImportDepuis(Noeud):
 # === NŒUDS D'ASSIGNATION ===
 
 class Assignation(Noeud):
+    __slots__ = ('cible', 'valeur')
     def __init__(self, cible, valeur):
         self.cible = cible
         self.valeur = valeur
 
 class AssignationComposee(Noeud):
+    __slots__ = ('cible', 'operateur', 'valeur')
     def __init__(self, cible, operateur, valeur):
         self.cible = cible
         self.operateur = operateur  # +=, -=, *=, /=, %=
@@ -83,62 +141,91 @@ class AssignationComposee(Noeud):
 # === NŒUDS D'EXPRESSIONS ===
 
 class ExpressionBinaire(Noeud):
+    __slots__ = ('gauche', 'operateur', 'droite', 'code_operateur', 'cache')
     def __init__(self, gauche, operateur, droite):
         self.gauche = gauche
         self.operateur = operateur
         self.droite = droite
+        self.code_operateur = CODES_BINAIRES.get(operateur)  # None = opérateur inconnu
+        # Cache en ligne de l'interpréteur : (type gauche, type droite, opération spécialisée)
+        self.cache = None
+
+class ExpressionLogique(ExpressionBinaire):
+    """`et` / `ou` : l'opérande droit n'est évalué que si le gauche ne décide pas du résultat"""
+    __slots__ = ()
 
 class ExpressionUnaire(Noeud):
+    __slots__ = ('operateur', 'operande')
     def __init__(self, operateur, operande):
         self.operateur = operateur
         self.operande = operande
 
 class Littéral(Noeud):
+    __slots__ = ('valeur',)
     def __init__(self, valeur):
         self.valeur = valeur
 
+class ListeLitterale(Noeud):
+    """Nœud pour les listes littérales (une nouvelle liste à chaque évaluation)"""
+    __slots__ = ('elements',)
+    def __init__(self, elements):
+        self.elements = elements  # [noeud_element]
+
 class Identifiant(Noeud):
+    __slots__ = ('nom', 'slot', 'cache')
     def __init__(self, nom):
         self.nom = nom
+        self.slot = None  # None = recherche par nom à l'exécution
+        # Cache en ligne de l'interpréteur : (version des fonctions, fonction ou VARIABLE)
+        self.cache = None
 
 class AccesAttribut(Noeud):
     """
     Nouveau nœud pour l'accès aux attributs de modules
     Ex: math.racine_carree()
     """
+    __slots__ = ('objet', 'attribut')
     def __init__(self, objet, attribut):
         self.objet = objet      # Identifiant du module
         self.attribut = attribut # Nom de l'attribut/fonction
 
 class AccesIndex(Noeud):
+    __slots__ = ('base', 'index')
     def __init__(self, base, index):
         self.base = base
         self.index = index
 
 class AccesDictionnaire(Noeud):
+    __slots__ = ('base', 'cle')
     def __init__(self, base, cle):
         self.base = base
         self.cle = cle
 
 class AppelFonction(Noeud):
+    __slots__ = ('nom_fonction', 'arguments', 'cache')
     def __init__(self, nom_fonction, arguments):
         self.nom_fonction = nom_fonction
         self.arguments = arguments
+        # Cache en ligne de l'interpréteur : (version des fonctions, nom, fonction résolue)
+        self.cache = None
 
 # === NŒUDS DE CONTRÔLE DE FLUX ===
 
 class Condition(Noeud):
+    __slots__ = ('condition', 'bloc_si', 'bloc_sinon')
     def __init__(self, condition, bloc_si, bloc_sinon=None):
         self.condition = condition
         self.bloc_si = bloc_si
         self.bloc_sinon = bloc_sinon
 
 class BoucleTantQue(Noeud):
+    __slots__ = ('condition', 'corps')
     def __init__(self, condition, corps):
         self.condition = condition
         self.corps = corps
 
 class BouclePour(Noeud):
+    __slots__ = ('init', 'condition', 'increment', 'corps')
     def __init__(self, init, condition, increment, corps):
         self.init = init
         self.condition = condition
@@ -146,19 +233,23 @@ class BouclePour(Noeud):
         self.corps = corps
 
 class BouclePourDans(Noeud):
+    __slots__ = ('variable', 'iterable', 'corps', 'slot')
     def __init__(self, variable, iterable, corps):
         self.variable = variable
         self.iterable = iterable
         self.corps = corps
+        self.slot = None
 
 # === NŒUD UTILITAIRE ===
 
 class ExpressionStatement(Noeud):
     """Wrapper pour les expressions utilisées comme instructions"""
+    __slots__ = ('expression',)
     def __init__(self, expression):
         self.expression = expression
 
 class DictionnaireLitteral(Noeud):
     """Nœud spécial pour les dictionnaires littéraux"""
+    __slots__ = ('elements',)
     def __init__(self, elements):
         self.elements = elements  # {clé_str: noeud_valeur}
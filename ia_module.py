@@ -1,5 +1,6 @@
 # ia_module.py
 from errors import RuntimeError
+from sortie import afficher
 import random
 import math
 
@@ -35,7 +36,7 @@ def reseau_neuronal(couches, activation="relu"):
         "precision": 0.0
     }
     
-    print(f"✅ Réseau créé - Architecture: {couches}, Activation: {activation}")
+    afficher(f"✅ Réseau créé - Architecture: {couches}, Activation: {activation}")
     return reseau
 
 def apprentissage(modele, donnees_entrees, donnees_sorties, epoques=100, taux_apprentissage=0.01):
@@ -57,8 +58,8 @@ def apprentissage(modele, donnees_entrees, donnees_sorties, epoques=100, taux_ap
     if len(donnees_entrees) != len(donnees_sorties):
         raise RuntimeError("Le nombre d'exemples d'entrée et de sortie doit être identique")
     
-    print(f"📊 Début de l'entraînement sur {len(donnees_entrees)} exemples")
-    print(f"⏱️ {epoques} époques à un taux de {taux_apprentissage}")
+    afficher(f"📊 Début de l'entraînement sur {len(donnees_entrees)} exemples")
+    afficher(f"⏱️ {epoques} époques à un taux de {taux_apprentissage}")
     
     # Simulation d'entraînement
     erreur_initiale = 1.0
@@ -68,14 +69,14 @@ def apprentissage(modele, donnees_entrees, donnees_sorties, epoques=100, taux_ap
         
         # Affichage du progrès tous les 20%
         if epoque % max(1, epoques // 5) == 0:
-            print(f"Époque {epoque + 1}/{epoques} - Erreur: {erreur:.4f}")
+            afficher(f"Époque {epoque + 1}/{epoques} - Erreur: {erreur:.4f}")
     
     # Calcul d'une précision simulée
     precision_finale = min(0.95, 0.5 + (epoques / 200))
     modele["entraine"] = True
     modele["precision"] = precision_finale
     
-    print(f"✅ Entraînement terminé - Précision: {precision_finale:.2%}")
+    afficher(f"✅ Entraînement terminé - Précision: {precision_finale:.2%}")
     return modele
 
 def prediction(modele, donnees_test):
@@ -100,7 +101,7 @@ def prediction(modele, donnees_test):
         pred = abs(base + bruit) % 2  # Simulation d'une classification binaire
         predictions.append(round(pred))
     
-    print(f"🎯 Prédictions générées pour {len(donnees_test)} exemples")
+    afficher(f"🎯 Prédictions générées pour {len(donnees_test)} exemples")
     return predictions
 
 def charger_jeu_de_donnees(chemin):
@@ -143,9 +144,9 @@ def charger_jeu_de_donnees(chemin):
                 "donnees_sorties": [random.randint(0, 1) for _ in range(5)]
             }
         
-        print(f"📁 Jeu de données chargé: {donnees['nom']}")
-        print(f"📊 {donnees['exemples']} exemples, {len(donnees['caracteristiques'])} caractéristiques")
-        print(f"🏷️ Classes: {donnees['classes']}")
+        afficher(f"📁 Jeu de données chargé: {donnees['nom']}")
+        afficher(f"📊 {donnees['exemples']} exemples, {len(donnees['caracteristiques'])} caractéristiques")
+        afficher(f"🏷️ Classes: {donnees['classes']}")
         
         return donnees
         
@@ -177,10 +178,10 @@ def evaluer_modele(modele, donnees_test, vraies_sorties):
         "erreur": 1 - precision
     }
     
-    print(f"📊 Résultats de l'évaluation:")
-    print(f"✅ Précision: {precision:.2%}")
-    print(f"🎯 {corrects}/{len(vraies_sorties)} prédictions correctes")
-    print(f"❌ Taux d'erreur: {(1-precision):.2%}")
+    afficher(f"📊 Résultats de l'évaluation:")
+    afficher(f"✅ Précision: {precision:.2%}")
+    afficher(f"🎯 {corrects}/{len(vraies_sorties)} prédictions correctes")
+    afficher(f"❌ Taux d'erreur: {(1-precision):.2%}")
     
     return resultats
 
@@ -1,22 +1,120 @@
 # interpreter.py
-from errors import RuntimeError, ReturnException
+import itertools
+from collections import deque
+from pathlib import Path
+from errors import RuntimeError, ReturnException, LimiteExecutionError
 import builtin
-import ia_module
 from builtin import _ArretProgramme
 from fia_ast import *
-from module_resolver import module_resolver
+from module_resolver import ModuleFIA, module_resolver
+from operateurs import OPERATIONS_BINAIRES, convertir_si_nombre, operation_specialisee
+from resolveur import resoudre_portees
+from sortie import SortieFIA, activer_sortie, restaurer_sortie
+from budget import BudgetExecution
+from memoisation import FonctionMemoisee, fonctions_memoisation
+from collections_natives import fonctions_collections
+
+# Valeur d'un slot local pas encore affecté (la lecture retombe sur les globales)
+NON_DEFINI = object()
+
+class Cadre(list):
+    """Cadre d'appel d'une fonction : liste de taille fixe indexée par slot"""
+    __slots__ = ('index',)
+
+    def __init__(self, index_locaux, args):
+        super().__init__(args)
+        self.extend([NON_DEFINI] * (len(index_locaux) - len(args)))
+        # {nom: slot}, partagé par tous les cadres de la même fonction
+        self.index = index_locaux
+
+# Numéros de version des espaces de fonctions, uniques pour tous les interpréteurs
+_VERSIONS_NOMS = itertools.count(1)
+
+class EspaceNoms(dict):
+    """Fonctions intégrées ou définies d'un interpréteur. Toute modification donne
+    un nouveau numéro `version_noms` à l'interpréteur : les caches en ligne des
+    identifiants et des appels, qui mémorisent ce numéro, sont alors périmés."""
+    __slots__ = ('proprietaire',)
+
+    def __init__(self, proprietaire, *args):
+        super().__init__(*args)
+        self.proprietaire = proprietaire
+        self._modifie()
+
+    def _modifie(self):
+        self.proprietaire.version_noms = next(_VERSIONS_NOMS)
+
+    def __setitem__(self, nom, valeur):
+        super().__setitem__(nom, valeur)
+        self._modifie()
+
+    def __delitem__(self, nom):
+        super().__delitem__(nom)
+        self._modifie()
+
+    def __ior__(self, autre):
+        super().__ior__(autre)
+        self._modifie()
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._modifie()
+
+    def setdefault(self, nom, valeur=None):
+        resultat = super().setdefault(nom, valeur)
+        self._modifie()
+        return resultat
+
+    def pop(self, *args):
+        resultat = super().pop(*args)
+        self._modifie()
+        return resultat
+
+    def popitem(self):
+        resultat = super().popitem()
+        self._modifie()
+        return resultat
+
+    def clear(self):
+        super().clear()
+        self._modifie()
+
+# Identifiant résolu comme variable (pas une fonction) dans son cache en ligne
+VARIABLE = object()
+
+# Résultat d'une instruction `retourner` : la valeur est dans `interpreteur.valeur_retour`.
+# Blocs, conditions et boucles le propagent jusqu'à l'appel de fonction, sans exception.
+RETOUR = object()
 
 class VisiteurInterpretation:
-    def __init__(self):
-        # Contextes de variables (pile de dictionnaires)
-        self.contextes = [{}]
+    def __init__(self, sortie=None, budget=None):
+        # Puits de sortie (imprimer, bannières, backends) propre à l'interpréteur
+        self.sortie = sortie if sortie is not None else SortieFIA()
+        
+        # Limites d'exécution (sans limite par défaut)
+        self.budget = budget if budget is not None else BudgetExecution()
+        
+        # Variables globales, partagées par référence avec les fonctions
+        self.globales = {}
         
-        # Fonctions intégrées
-        self.fonctions_integrees = builtin.FONCTIONS_INTEGREES.copy()
-        self.fonctions_integrees.update(ia_module.FONCTIONS_IA)
+        # Cadre de la fonction en cours (None au niveau global)
+        self.cadre = None
+        # Valeur du dernier `retourner` exécuté (accompagne le résultat RETOUR)
+        self.valeur_retour = None
+        # Arguments d'un appel terminal en attente (accompagne RETOUR, voir _retour_terminal)
+        self.arguments_terminaux = None
+        
+        # Fonctions intégrées (les backends Python sont importés au premier appel)
+        self.fonctions_integrees = EspaceNoms(self, builtin.FONCTIONS_INTEGREES)
+        self.fonctions_integrees.update(builtin.FONCTIONS_IA)
         
         # Fonctions définies par l'utilisateur
-        self.fonctions_definies = {}
+        self.fonctions_definies = EspaceNoms(self)
+        # memoiser(), statistiques_memo(), vider_memo() : agissent sur fonctions_definies
+        self.fonctions_integrees.update(fonctions_memoisation(self))
+        # trier() : accepte une fonction définie comme clé
+        self.fonctions_integrees.update(fonctions_collections(self))
         
         # === NOUVEAU : SYSTÈME DE MODULES ===
         # Modules importés {alias: contexte_module}
@@ -25,9 +123,13 @@ class VisiteurInterpretation:
         # Fichier courant (pour imports relatifs)
         self.fichier_courant = None
         
-        print("🤖 Module IA activé - Fonctions disponibles:")
-        for nom_fonction in ia_module.FONCTIONS_IA.keys():
-            print(f"   • {nom_fonction}()")
+        # Méthodes visiter_* indexées par type de nœud (une table par classe de visiteur)
+        self._dispatch = table_dispatch(type(self))
+        
+        self.sortie.imprimer("🤖 Module IA activé - Fonctions disponibles:")
+        for nom_fonction in builtin.FONCTIONS_IA.keys():
+            self.sortie.imprimer(f"   • {nom_fonction}()")
+        self.sortie.vider()
 
     def executer(self, noeud_ast, fichier_courant=None):
         """Exécute un nœud AST avec contexte de fichier"""
@@ -35,11 +137,20 @@ class VisiteurInterpretation:
             ancien_fichier = self.fichier_courant
             self.fichier_courant = fichier_courant
             try:
-                return noeud_ast.accepter(self)
+                return self._dispatch[noeud_ast.type_noeud](self, noeud_ast)
             finally:
                 self.fichier_courant = ancien_fichier
         else:
-            return noeud_ast.accepter(self)
+            return self._dispatch[noeud_ast.type_noeud](self, noeud_ast)
+
+    def _entrer_programme(self):
+        """Active le puits de sortie et le budget de l'interpréteur (début d'un programme)"""
+        return activer_sortie(self.sortie), self.budget.activer()
+
+    def _sortir_programme(self, jetons):
+        jeton_sortie, jeton_budget = jetons
+        self.budget.desactiver(jeton_budget)
+        restaurer_sortie(jeton_sortie)
 
     def executer_fichier(self, chemin_fichier):
         """Exécute un fichier F-IA complet"""
@@ -56,110 +167,82 @@ class VisiteurInterpretation:
     # === MÉTHODES VISITEUR (NOMS CORRECTS) ===
 
     def visiter_programme(self, programme):
+        jetons = self._entrer_programme()
         resultat = None
         try:
             for instruction in programme.instructions:
                 resultat = self.executer(instruction)
+                if resultat is RETOUR:
+                    # 'retourner' hors fonction
+                    raise ReturnException(self.valeur_retour)
         except _ArretProgramme:
             return None
+        except RuntimeError as e:
+            self._localiser_erreur(e)
+            raise
+        finally:
+            self._sortir_programme(jetons)
         return resultat
 
     def visiter_bloc(self, bloc):
-        nouveau_contexte_cree = False
-        if len(self.contextes) == 1:
-            self.contextes.append({})
-            nouveau_contexte_cree = True
-        
+        # Les blocs ne créent pas de portée : les variables vivent dans le cadre de la fonction
         resultat = None
-        try:
-            for instruction in bloc.instructions:
-                resultat = self.executer(instruction)
-        finally:
-            if nouveau_contexte_cree and len(self.contextes) > 1:
-                contexte_bloc = self.contextes.pop()
-                if self.contextes:
-                    self.contextes[-1].update(contexte_bloc)
-        
+        for instruction in bloc.instructions:
+            resultat = self.executer(instruction)
+            if resultat is RETOUR:
+                return RETOUR
         return resultat
 
     def visiter_declarationvariable(self, decl):
         valeur = self.executer(decl.valeur) if decl.valeur else None
-        self._set_variable(decl.nom, valeur)
+        self._ecrire_variable(decl.nom, decl.slot, valeur)
 
     def visiter_fonction(self, fonction):
-        self.fonctions_definies[fonction.nom] = {'params': fonction.parametres, 'corps': fonction.corps}
+        if fonction.index_locaux is None:
+            resoudre_portees(Programme([fonction]))
+        self.fonctions_definies[fonction.nom] = {
+            'params': fonction.parametres,
+            'corps': fonction.corps,
+            'locaux': fonction.index_locaux,
+        }
 
     def visiter_retour(self, retour):
-        valeur = self.executer(retour.valeur) if retour.valeur is not None else None
-        raise ReturnException(valeur)
+        if retour.appel_terminal:
+            return self._retour_terminal(retour.valeur)
+        self.valeur_retour = self.executer(retour.valeur) if retour.valeur is not None else None
+        return RETOUR
+
+    def _retour_terminal(self, appel):
+        """`retourner f(...)` dans f : si f désigne toujours la fonction en cours, ses
+        arguments passent à `_executer_fonction`, qui réutilise le cadre (pas d'appel imbriqué)"""
+        args = [self.executer(arg) for arg in appel.arguments]
+        cache = appel.cache
+        if cache is None or cache[0] != self.version_noms:
+            nom_fonction = self._nom_fonction(appel.nom_fonction)
+            cache = appel.cache = (self.version_noms, nom_fonction, self._resoudre_fonction(nom_fonction))
+        fonction = cache[2]
+        if type(fonction) is not dict or fonction['locaux'] is not self.cadre.index:
+            self.valeur_retour = self._appeler_fonction(cache[1], args, fonction)
+            return RETOUR
+        if len(args) != len(fonction['params']):
+            raise RuntimeError(f"La fonction '{cache[1]}' attend {len(fonction['params'])} arguments, {len(args)} fournis.")
+        self.arguments_terminaux = args
+        return RETOUR
 
     # === NOUVELLES MÉTHODES POUR LES IMPORTS ===
 
     def visiter_importmodule(self, import_node):
         """Visite un nœud ImportModule (importer "module.fia" comme alias)"""
         try:
-            # Charger le module
-            ast_module, contexte_module = module_resolver.charger_module(
-            import_node.chemin_module, 
-            self.fichier_courant
-            )
-        
-            # Créer un interpréteur dédié pour ce module
-            interpreteur_module = VisiteurInterpretation()
-            interpreteur_module.fichier_courant = module_resolver.obtenir_chemin_module(
-                import_node.chemin_module, 
-                self.fichier_courant
-            )
-        
-            # Exécuter le module dans son propre contexte
-            interpreteur_module.executer(ast_module)
-        
-            # CORRECTION : Créer un objet module qui contient variables ET fonctions
-            module_obj = {}
-        
-            # Ajouter les variables du module
-            module_obj.update(interpreteur_module.contextes[0])
+            module = self._importer_module(import_node.chemin_module)
         
-            # IMPORTANT : Ajouter les fonctions comme objets callable
-            for nom_func, func_def in interpreteur_module.fonctions_definies.items():
-                # Créer une closure qui capture l'interpréteur du module
-                def creer_fonction_module(func_definition, interpreteur_parent):
-                    def fonction_module(*args):
-                        # Utiliser l'interpréteur parent pour exécuter la fonction
-                        params = func_definition['params']
-                        corps = func_definition['corps']
-                    
-                        if len(args) != len(params):
-                            raise RuntimeError(f"La fonction attend {len(params)} arguments, {len(args)} fournis.")
-                    
-                        # Créer un contexte local
-                        contexte_local = {}
-                        for param, arg in zip(params, args):
-                            contexte_local[param] = arg
-                    
-                        # Sauvegarder et remplacer le contexte
-                        ancien_contexte = interpreteur_parent.contextes[:]
-                        interpreteur_parent.contextes = [interpreteur_parent.contextes[0].copy(), contexte_local]
-                    
-                        resultat_fonction = None
-                        try:
-                            resultat_fonction = interpreteur_parent.executer(corps)
-                        except ReturnException as e:
-                            resultat_fonction = e.value
-                        finally:
-                            interpreteur_parent.contextes = ancien_contexte
-                    
-                        return resultat_fonction
-                
-                    return fonction_module
-            
-                module_obj[nom_func] = creer_fonction_module(func_def, interpreteur_module)
-        
-            # Stocker le module avec son alias
-            self.modules_importes[import_node.alias] = module_obj
+            # Stocker le module avec son alias (espace partagé avec les autres importeurs)
+            self.modules_importes[import_node.alias] = module.espace
         
-            print(f"📦 Module '{import_node.chemin_module}' importé comme '{import_node.alias}'")
+            self.sortie.imprimer(f"📦 Module '{import_node.chemin_module}' importé comme '{import_node.alias}'")
         
+        except LimiteExecutionError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Erreur lors de l'import du module '{import_node.chemin_module}': {e}")
 
@@ -167,51 +250,72 @@ class VisiteurInterpretation:
     def visiter_importdepuis(self, import_depuis_node):
         """Visite un nœud ImportDepuis (depuis "module.fia" importer element1, element2)"""
         try:
-            # Charger le module
-            ast_module, contexte_module = module_resolver.charger_module(
-                import_depuis_node.chemin_module, 
-                self.fichier_courant
-            )
-            
-            # Créer un interpréteur dédié pour ce module  
-            interpreteur_module = VisiteurInterpretation()
-            interpreteur_module.fichier_courant = module_resolver.obtenir_chemin_module(
-                import_depuis_node.chemin_module, 
-                self.fichier_courant
-            )
-            
-            # Exécuter le module
-            interpreteur_module.executer(ast_module)
+            module = self._importer_module(import_depuis_node.chemin_module)
             
             # Récupérer le contexte du module
-            contexte_module = interpreteur_module.contextes[0]
-            fonctions_module = interpreteur_module.fonctions_definies
+            contexte_module = module.interpreteur.globales
+            fonctions_module = module.interpreteur.fonctions_definies
             
             # Importer les éléments demandés dans le contexte courant
             for nom_element, alias_element in import_depuis_node.elements_importes:
                 if nom_element in contexte_module:
                     # Variable du module
                     self._set_variable(alias_element, contexte_module[nom_element])
-                    print(f"📦 Variable '{nom_element}' importée comme '{alias_element}'")
+                    self.sortie.imprimer(f"📦 Variable '{nom_element}' importée comme '{alias_element}'")
                 elif nom_element in fonctions_module:
                     # Fonction du module
                     self.fonctions_definies[alias_element] = fonctions_module[nom_element]
-                    print(f"📦 Fonction '{nom_element}' importée comme '{alias_element}'")
+                    self.sortie.imprimer(f"📦 Fonction '{nom_element}' importée comme '{alias_element}'")
                 else:
                     raise RuntimeError(f"'{nom_element}' n'existe pas dans le module '{import_depuis_node.chemin_module}'")
             
+        except LimiteExecutionError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Erreur lors de l'import depuis '{import_depuis_node.chemin_module}': {e}")
 
+    def _importer_module(self, chemin_module):
+        """Retourne le ModuleFIA importé ; son corps n'est exécuté qu'au premier import"""
+        return module_resolver.importer_module(chemin_module, self.fichier_courant, self._executer_module)
+
+    def _executer_module(self, ast_module, chemin_module):
+        """Exécute le corps d'un module dans un interpréteur dédié et construit son espace de noms"""
+        # Même puits de sortie que l'interpréteur qui importe
+        interpreteur_module = type(self)(self.sortie, self.budget)
+        interpreteur_module.fichier_courant = chemin_module
+        interpreteur_module.executer(ast_module)
+    
+        # Objet module : variables ET fonctions
+        espace = dict(interpreteur_module.globales)
+    
+        # Les fonctions deviennent des objets callable liés à l'interpréteur du module
+        def creer_fonction_module(nom_func, func_definition):
+            def fonction_module(*args):
+                params = func_definition['params']
+            
+                if len(args) != len(params):
+                    raise RuntimeError(f"La fonction attend {len(params)} arguments, {len(args)} fournis.")
+            
+                return interpreteur_module._executer_fonction(func_definition, list(args))
+        
+            # Nom affiché par le profileur : module.fonction
+            fonction_module.__qualname__ = f"{Path(chemin_module).stem}.{nom_func}"
+            return fonction_module
+    
+        for nom_func, func_def in interpreteur_module.fonctions_definies.items():
+            espace[nom_func] = creer_fonction_module(nom_func, func_def)
+    
+        return ModuleFIA(chemin_module, interpreteur_module, espace)
+
     # === ASSIGNATIONS ===
 
     def visiter_assignation(self, assign):
         valeur = self.executer(assign.valeur)
         cible = assign.cible
         if isinstance(cible, Identifiant):
-            if not self._variable_existe(cible.nom):
+            if not self._variable_existe(cible.nom, cible.slot):
                 raise RuntimeError(f"Variable '{cible.nom}' non déclarée avant assignation")
-            self._set_variable(cible.nom, valeur)
+            self._ecrire_variable(cible.nom, cible.slot, valeur)
         elif isinstance(cible, AccesIndex):
             base_list = self.executer(cible.base)
             index_value = self.executer(cible.index)
@@ -227,6 +331,8 @@ class VisiteurInterpretation:
             cle_value = self.executer(cible.cle)
             if not isinstance(base_dict, dict):
                 raise RuntimeError("L'opérande gauche de l'assignation par clé doit être un dictionnaire")
+            if cle_value not in base_dict and len(base_dict) >= self.budget.limite_elements:
+                self.budget.depasser_elements()
             base_dict[cle_value] = valeur
         else:
             raise RuntimeError(f"Cible d'assignation invalide")
@@ -236,10 +342,10 @@ class VisiteurInterpretation:
         cible = assign_composee.cible
         
         if isinstance(cible, Identifiant):
-            if not self._variable_existe(cible.nom):
+            if not self._variable_existe(cible.nom, cible.slot):
                 raise RuntimeError(f"Variable '{cible.nom}' non déclarée avant assignation composée")
             
-            valeur_actuelle = self._get_variable(cible.nom)
+            valeur_actuelle = self._lire_variable(cible.nom, cible.slot)
             nouvelle_valeur = self.executer(assign_composee.valeur)
             
             if assign_composee.operateur == '+=':
@@ -270,7 +376,7 @@ class VisiteurInterpretation:
             else:
                 raise RuntimeError(f"Opérateur d'assignation composée inconnu: {assign_composee.operateur}")
             
-            self._set_variable(cible.nom, resultat)
+            self._ecrire_variable(cible.nom, cible.slot, resultat)
             
         else:
             # Gestion des autres types de cibles (listes, dicts) - code similaire à avant
@@ -279,38 +385,44 @@ class VisiteurInterpretation:
     # === EXPRESSIONS ===
 
     def visiter_expressionbinaire(self, expr_bin):
-        gauche = self.executer(expr_bin.gauche)
-        droite = self.executer(expr_bin.droite)
-
-        op = expr_bin.operateur
-        
-        if op == '+':
-            if isinstance(gauche, str) or isinstance(droite, str):
-                return str(gauche) + str(droite)
-            gauche = self.convertir_si_nombre(gauche)
-            droite = self.convertir_si_nombre(droite)
-            return gauche + droite
-        
-        gauche = self.convertir_si_nombre(gauche)
-        droite = self.convertir_si_nombre(droite)
-
-        if op == '-': return gauche - droite
-        elif op == '*': return gauche * droite
-        elif op == '/':
-            if droite == 0:
-                raise RuntimeError("Division par zéro")
-            return gauche / droite
-        elif op == '%': return gauche % droite
-        elif op == '==': return gauche == droite
-        elif op == '!=': return gauche != droite
-        elif op == '<': return gauche < droite
-        elif op == '<=': return gauche <= droite
-        elif op == '>': return gauche > droite
-        elif op == '>=': return gauche >= droite
-        elif op == 'et': return gauche and droite
-        elif op == 'ou': return gauche or droite
-        else:
-            raise RuntimeError(f"Opérateur binaire inconnu: {op}")
+        # Opérandes évalués par la table de distribution, sans passer par executer
+        dispatch = self._dispatch
+        noeud = expr_bin.gauche
+        gauche = dispatch[noeud.type_noeud](self, noeud)
+        noeud = expr_bin.droite
+        droite = dispatch[noeud.type_noeud](self, noeud)
+        # Cache en ligne : opération spécialisée pour les derniers types d'opérandes vus
+        cache = expr_bin.cache
+        if cache is not None:
+            type_gauche, type_droite, operation = cache
+            if type(gauche) is type_gauche and type(droite) is type_droite:
+                return operation(gauche, droite)
+        return self._operation_binaire(expr_bin, gauche, droite)
+
+    def _operation_binaire(self, expr_bin, gauche, droite):
+        """Chemin lent : spécialise l'opération pour ces types d'opérandes (ou applique
+        la sémantique complète avec conversion des chaînes numériques)"""
+        code = expr_bin.code_operateur
+        if code is None:
+            raise RuntimeError(f"Opérateur binaire inconnu: {expr_bin.operateur}")
+        operation = operation_specialisee(code, type(gauche), type(droite))
+        if operation is None:
+            return OPERATIONS_BINAIRES[code](gauche, droite)
+        expr_bin.cache = (type(gauche), type(droite), operation)
+        return operation(gauche, droite)
+
+    def visiter_expressionlogique(self, expr_log):
+        """et / ou avec court-circuit : même résultat que `gauche and droite`
+        (après conversion des chaînes numériques), sans évaluer droite inutilement"""
+        noeud = expr_log.gauche
+        gauche = self.convertir_si_nombre(self._dispatch[noeud.type_noeud](self, noeud))
+        if expr_log.operateur == 'et':
+            if not gauche:
+                return gauche
+        elif gauche:
+            return gauche
+        noeud = expr_log.droite
+        return self.convertir_si_nombre(self._dispatch[noeud.type_noeud](self, noeud))
 
     def visiter_expressionunaire(self, expr_unaire):
         operand_value = self.executer(expr_unaire.operande)
@@ -326,14 +438,22 @@ class VisiteurInterpretation:
         return litteral.valeur
 
     def visiter_identifiant(self, ident):
-        nom = ident.nom
-        if nom in self.fonctions_integrees or nom in self.fonctions_definies:
-            if nom in self.fonctions_integrees:
-                return self.fonctions_integrees[nom]
-            elif nom in self.fonctions_definies:
-                return self.fonctions_definies[nom]
-        else:
-            return self._get_variable(nom)
+        # Cache en ligne : fonction de ce nom, ou VARIABLE, tant que les fonctions ne changent pas
+        cache = ident.cache
+        if cache is None or cache[0] != self.version_noms:
+            cache = ident.cache = (self.version_noms, self._resoudre_identifiant(ident.nom))
+        valeur = cache[1]
+        if valeur is VARIABLE:
+            return self._lire_variable(ident.nom, ident.slot)
+        return valeur
+
+    def _resoudre_identifiant(self, nom):
+        """Les fonctions (intégrées puis définies) masquent les variables du même nom"""
+        if nom in self.fonctions_integrees:
+            return self.fonctions_integrees[nom]
+        if nom in self.fonctions_definies:
+            return self.fonctions_definies[nom]
+        return VARIABLE
 
     def visiter_accesattribut(self, acces_node):
         """Visite un AccesAttribut (module.fonction)"""
@@ -369,10 +489,7 @@ class VisiteurInterpretation:
         if index_value < 0 or index_value >= len(base_value):
             raise RuntimeError("Index de liste hors limites")
 
-        element = base_value[index_value]
-        if isinstance(element, Noeud):
-            return self.executer(element)
-        return element
+        return base_value[index_value]
 
     def visiter_accesdictionnaire(self, acces_dict):
         base_value = self.executer(acces_dict.base)
@@ -392,141 +509,171 @@ class VisiteurInterpretation:
             # C'est un appel de type module.fonction()
             fonction_module = self.executer(appel.nom_fonction)
             args = [self.executer(arg) for arg in appel.arguments]
-    
-            # CORRECTION: Conversion complète des arguments pour les modules ML
-            args_convertis = []
-            for arg in args:
-                if hasattr(arg, 'nom'):  # Si c'est un identifiant (comme un ID de modèle)
-                    args_convertis.append(arg.nom)
-                elif hasattr(arg, 'valeur'):  # Si c'est un littéral
-                    args_convertis.append(self._convertir_en_python(arg.valeur))
-                else:
-                    args_convertis.append(self._convertir_en_python(arg))
-    
-            if callable(fonction_module):
-                try:
-                    return fonction_module(*args_convertis)
-                except Exception as e:
-                    raise RuntimeError(f"Erreur lors de l'appel de fonction de module: {e}")
-            else:
-                raise RuntimeError("L'élément n'est pas une fonction")
-
-        # Appel normal
-        if isinstance(appel.nom_fonction, str):
-            nom_fonction = appel.nom_fonction
-        elif hasattr(appel.nom_fonction, 'nom'):
-            nom_fonction = appel.nom_fonction.nom
-        elif hasattr(appel.nom_fonction, 'valeur'):
-            nom_fonction = appel.nom_fonction.valeur
-        else:
-            nom_fonction = str(appel.nom_fonction)
+            return self._appeler_fonction_module(fonction_module, args)
 
+        # Appel normal : fonction résolue une fois par site d'appel (cache en ligne)
         args = [self.executer(arg) for arg in appel.arguments]
-        args_convertis = [self._convertir_en_python(arg) for arg in args]
-
-        if nom_fonction in self.fonctions_integrees:
-            fonction = self.fonctions_integrees[nom_fonction]
+        cache = appel.cache
+        if cache is None or cache[0] != self.version_noms:
+            nom_fonction = self._nom_fonction(appel.nom_fonction)
+            cache = appel.cache = (self.version_noms, nom_fonction, self._resoudre_fonction(nom_fonction))
+        return self._appeler_fonction(cache[1], args, cache[2])
+
+    # === APPELS (PARTAGÉS PAR TOUS LES MOTEURS) ===
+
+    @staticmethod
+    def _nom_fonction(nom_fonction):
+        """Extrait le nom d'une fonction appelée depuis le nœud du parser"""
+        if isinstance(nom_fonction, str):
+            return nom_fonction
+        elif hasattr(nom_fonction, 'nom'):
+            return nom_fonction.nom
+        elif hasattr(nom_fonction, 'valeur'):
+            return nom_fonction.valeur
+        return str(nom_fonction)
+
+    def _appeler_fonction_module(self, fonction_module, args):
+        """Appelle une fonction obtenue par module.fonction() avec des arguments évalués"""
+        if callable(fonction_module):
             try:
-                return fonction(*args_convertis)
-            except _ArretProgramme:
-                raise _ArretProgramme()
-            except TypeError as e:
-                raise RuntimeError(f"Erreur lors de l'appel de '{nom_fonction}': {e}")
+                return fonction_module(*args)
+            except LimiteExecutionError:
+                raise
             except Exception as e:
-                raise RuntimeError(f"Erreur IA dans '{nom_fonction}': {str(e)}")
-        elif nom_fonction in self.fonctions_definies:
-            func_def = self.fonctions_definies[nom_fonction]
-            params = func_def['params']
-            corps = func_def['corps']
-            if len(args) != len(params):
-                raise RuntimeError(f"La fonction '{nom_fonction}' attend {len(params)} arguments, {len(args)} fournis.")
-            
-            contexte_local = {}
-            for param, arg in zip(params, args):
-                contexte_local[param] = arg
-            
-            ancien_contexte = self.contextes[:]
-            self.contextes = [ancien_contexte[0].copy(), contexte_local]
-            resultat_fonction = None
-            try:
-                resultat_fonction = self.executer(corps)
-            except ReturnException as e:
-                resultat_fonction = e.value
-            finally:
-                self.contextes = ancien_contexte
-            return resultat_fonction
+                if isinstance(e, RuntimeError):
+                    # Ligne dans le module, avant que l'appel ne prenne celle de l'appelant
+                    self._localiser_erreur(e)
+                raise RuntimeError(f"Erreur lors de l'appel de fonction de module: {e}")
         else:
-            raise RuntimeError(f"Fonction '{nom_fonction}' non définie")
+            raise RuntimeError("L'élément n'est pas une fonction")
+
+    def _resoudre_fonction(self, nom_fonction):
+        """Fonction intégrée (callable) ou définie ({'params', 'corps', 'locaux'}) de ce nom"""
+        if nom_fonction in self.fonctions_integrees:
+            return self.fonctions_integrees[nom_fonction]
+        if nom_fonction in self.fonctions_definies:
+            return self.fonctions_definies[nom_fonction]
+        raise RuntimeError(f"Fonction '{nom_fonction}' non définie")
+
+    def _appeler_fonction(self, nom_fonction, args, fonction=None):
+        """Appelle une fonction intégrée ou définie avec des arguments évalués ;
+        `fonction` : cible déjà résolue par le cache en ligne de l'appel (sinon recherche par nom)"""
+        if fonction is None:
+            fonction = self._resoudre_fonction(nom_fonction)
+        if type(fonction) is dict:
+            return self._appeler_fonction_definie(nom_fonction, fonction, args)
+        if type(fonction) is FonctionMemoisee:
+            # Fonction définie : ses erreurs ne sont pas celles d'une fonction intégrée
+            return fonction(*args)
+        # Les valeurs F-IA sont des objets Python natifs : passage par référence
+        try:
+            return fonction(*args)
+        except _ArretProgramme:
+            raise _ArretProgramme()
+        except TypeError as e:
+            raise RuntimeError(f"Erreur lors de l'appel de '{nom_fonction}': {e}")
+        except LimiteExecutionError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Erreur IA dans '{nom_fonction}': {str(e)}")
+
+    def _appeler_fonction_definie(self, nom_fonction, func_def, args):
+        """Exécute le corps d'une fonction F-IA dans un nouveau contexte local"""
+        params = func_def['params']
+        if len(args) != len(params):
+            raise RuntimeError(f"La fonction '{nom_fonction}' attend {len(params)} arguments, {len(args)} fournis.")
+        return self._executer_fonction(func_def, args)
+
+    def _executer_fonction(self, func_def, args):
+        """Exécute le corps d'une fonction dans un nouveau cadre (coût en O(paramètres)) ;
+        un appel terminal à elle-même (`retourner f(...)`) remplace le cadre et recommence"""
+        budget = self.budget
+        if budget.profondeur >= budget.limite_profondeur:
+            budget.depasser_profondeur()
+        budget.restants -= 1
+        if budget.restants < 0:
+            budget.verifier()
+        ancien_cadre = self.cadre
+        self.cadre = Cadre(func_def['locaux'], args)
+        budget.profondeur += 1
+        resultat_fonction = None
+        try:
+            while True:
+                resultat_fonction = self.executer(func_def['corps'])
+                if resultat_fonction is not RETOUR:
+                    break
+                args = self.arguments_terminaux
+                if args is None:
+                    resultat_fonction = self.valeur_retour
+                    self.valeur_retour = None
+                    break
+                # Appel terminal : même profondeur, un pas du budget comme tout appel
+                self.arguments_terminaux = None
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+                self.cadre = Cadre(func_def['locaux'], args)
+        except RecursionError:
+            # Pile Python épuisée avant max_profondeur
+            budget.depasser_profondeur()
+        finally:
+            budget.profondeur -= 1
+            self.cadre = ancien_cadre
+        return resultat_fonction
 
     # === STRUCTURES DE CONTRÔLE ===
 
     def visiter_condition(self, condition):
         valeur_condition = self.executer(condition.condition)
         if valeur_condition:
-            self.executer(condition.bloc_si)
+            if self.executer(condition.bloc_si) is RETOUR:
+                return RETOUR
         elif condition.bloc_sinon:
-            self.executer(condition.bloc_sinon)
+            if self.executer(condition.bloc_sinon) is RETOUR:
+                return RETOUR
+
+    # Chaque itération consomme un pas du budget d'exécution (voir budget.py)
 
     def visiter_boucletantque(self, boucle):
-        condition_value = self.executer(boucle.condition)
-        compteur = 0
-        while condition_value and compteur < 1000:  # AUGMENTÉ À 1000
-            self.executer(boucle.corps)
-            condition_value = self.executer(boucle.condition)
-            compteur += 1
-        if compteur >= 1000:
-            print("🛑 Sécurité: boucle arrêtée après 1000 itérations")
+        budget = self.budget
+        while self.executer(boucle.condition):
+            if self.executer(boucle.corps) is RETOUR:
+                return RETOUR
+            budget.restants -= 1
+            if budget.restants < 0:
+                budget.verifier()
 
     def visiter_bouclepour(self, boucle):
+        budget = self.budget
         self.executer(boucle.init)
-        condition_value = self.executer(boucle.condition)
-        compteur = 0
-        while condition_value and compteur < 1000:  # AUGMENTÉ À 1000
-            self.executer(boucle.corps)
+        while self.executer(boucle.condition):
+            if self.executer(boucle.corps) is RETOUR:
+                return RETOUR
             self.executer(boucle.increment)
-            condition_value = self.executer(boucle.condition)
-            compteur += 1
-        if compteur >= 1000:
-            print("🛑 Sécurité: boucle arrêtée après 1000 itérations")
+            budget.restants -= 1
+            if budget.restants < 0:
+                budget.verifier()
 
     def visiter_bouclepourdans(self, boucle):
         """Visite une boucle pour...dans"""
         iterable_value = self.executer(boucle.iterable)
         
-        if not isinstance(iterable_value, (list, dict, str)):
+        if not isinstance(iterable_value, (list, dict, str, deque)):
             raise RuntimeError("L'objet à droite de 'dans' doit être itérable (liste, dictionnaire ou chaîne)")
         
-        self.contextes.append({})
-        
-        compteur = 0
-        try:
-            if isinstance(iterable_value, list):
-                for element in iterable_value:
-                    if compteur >= 1000:  # AUGMENTÉ À 1000
-                        print("🛑 Sécurité: boucle pour...dans arrêtée après 1000 itérations")
-                        break
-                    self._set_variable(boucle.variable, element)
-                    self.executer(boucle.corps)
-                    compteur += 1
-            elif isinstance(iterable_value, dict):
-                for cle in iterable_value.keys():
-                    if compteur >= 1000:  # AUGMENTÉ À 1000
-                        print("🛑 Sécurité: boucle pour...dans arrêtée après 1000 itérations")
-                        break
-                    self._set_variable(boucle.variable, cle)
-                    self.executer(boucle.corps)
-                    compteur += 1
-            elif isinstance(iterable_value, str):
-                for caractere in iterable_value:
-                    if compteur >= 1000:  # AUGMENTÉ À 1000
-                        print("🛑 Sécurité: boucle pour...dans arrêtée après 1000 itérations")
-                        break
-                    self._set_variable(boucle.variable, caractere)
-                    self.executer(boucle.corps)
-                    compteur += 1
-        finally:
-            if len(self.contextes) > 1:
-                self.contextes.pop()
+        # La variable de boucle est une variable du cadre courant (ou globale)
+        budget = self.budget
+        for element in iterable_value:
+            self._ecrire_variable(boucle.variable, boucle.slot, element)
+            if self.executer(boucle.corps) is RETOUR:
+                return RETOUR
+            budget.restants -= 1
+            if budget.restants < 0:
+                budget.verifier()
+
+    def visiter_listelitterale(self, liste_node):
+        """Visite une liste littérale : construit une nouvelle liste de valeurs évaluées"""
+        return [self.executer(element) for element in liste_node.elements]
 
     def visiter_dictionnairelitteral(self, dict_node):
         """Visite un dictionnaire littéral en évaluant toutes les valeurs"""
@@ -545,48 +692,114 @@ class VisiteurInterpretation:
 
     # === MÉTHODES UTILITAIRES ===
 
+    def _lire_variable(self, nom, slot):
+        """Lit une variable résolue : slot local, puis globales."""
+        if slot is None:
+            return self._get_variable(nom)
+        if slot >= 0:
+            valeur = self.cadre[slot]
+            if valeur is not NON_DEFINI:
+                return valeur
+        try:
+            return self.globales[nom]
+        except KeyError:
+            raise RuntimeError(f"Variable '{nom}' non définie")
+
+    def _ecrire_variable(self, nom, slot, valeur):
+        """Écrit une variable résolue dans son slot local ou dans les globales."""
+        if slot is None:
+            self._set_variable(nom, valeur)
+        elif slot >= 0:
+            self.cadre[slot] = valeur
+        else:
+            self.globales[nom] = valeur
+
+    def _slot_par_nom(self, nom):
+        """Slot local d'une variable du cadre courant (ou -1 si globale)."""
+        if self.cadre is not None:
+            return self.cadre.index.get(nom, -1)
+        return -1
+
     def _get_variable(self, nom):
-        """Recherche une variable dans la pile des contextes."""
-        for contexte in reversed(self.contextes):
-            if nom in contexte:
-                return contexte[nom]
-        raise RuntimeError(f"Variable '{nom}' non définie")
-
-    def _variable_existe(self, nom):
-        """Vérifie si une variable existe dans la pile des contextes."""
-        for contexte in reversed(self.contextes):
-            if nom in contexte:
-                return True
-        return False
+        """Recherche une variable par son nom (cadre courant puis globales)."""
+        return self._lire_variable(nom, self._slot_par_nom(nom))
+
+    def _variable_existe(self, nom, slot=None):
+        """Vérifie si une variable existe (cadre courant ou globales)."""
+        if slot is None:
+            slot = self._slot_par_nom(nom)
+        if slot >= 0 and self.cadre[slot] is not NON_DEFINI:
+            return True
+        return nom in self.globales
 
     def _set_variable(self, nom, valeur):
-        """Définit une variable dans le contexte local actuel."""
-        if self.contextes:
-            self.contextes[-1][nom] = valeur
-        else:
-            self.contextes = [{}]
-            self.contextes[0][nom] = valeur
+        """Définit une variable par son nom dans le cadre courant (ou les globales)."""
+        self._ecrire_variable(nom, self._slot_par_nom(nom), valeur)
 
     def convertir_si_nombre(self, valeur):
         """Convertit une valeur en nombre si possible"""
-        if isinstance(valeur, str):
-            if valeur.replace('.', '').replace('-', '').isdigit():
-                return float(valeur) if '.' in valeur else int(valeur)
-        return valeur
-
-    def _convertir_en_python(self, valeur):
-        """Convertit récursivement les objets F-IA en types Python natifs."""
-        from fia_ast import Littéral, Identifiant
-    
-        # CORRECTION: Gestion des identifiants F-IA
-        if isinstance(valeur, Identifiant):
-            # Si c'est un identifiant, récupérer sa valeur dans le contexte
-            return self._get_variable(valeur.nom)
-        elif isinstance(valeur, Littéral):
-            return self._convertir_en_python(valeur.valeur)
-        elif isinstance(valeur, list):
-            return [self._convertir_en_python(item) for item in valeur]
-        elif isinstance(valeur, dict):
-            return {k: self._convertir_en_python(v) for k, v in valeur.items()}
-        else:
-            return valeur
+        return convertir_si_nombre(valeur)
+
+    # === PROFILAGE (lu par profileur.py depuis son thread d'échantillonnage) ===
+
+    def pile_appels(self, cadre_python):
+        """Pile d'appels F-IA [(fonction, ligne)], de la plus externe à la plus
+        interne, reconstruite depuis le cadre Python courant du programme.
+        Chaque appel passe par `_appeler_fonction` (ou `_appeler_fonction_module`) :
+        ces cadres délimitent les fonctions F-IA, et la ligne d'une fonction est
+        celle de l'instruction la plus interne exécutée avant l'appel suivant.
+        Un moteur qui enchaîne des appels dans un même cadre Python les donne
+        par `_appels_cadre`."""
+        pile = []
+        ligne = None
+        while cadre_python is not None:
+            code = cadre_python.f_code
+            if code is _CODE_APPELER:
+                pile.append((cadre_python.f_locals['nom_fonction'], ligne))
+                ligne = None
+            elif code is _CODE_APPELER_MODULE:
+                fonction = cadre_python.f_locals['fonction_module']
+                pile.append((getattr(fonction, '__qualname__', '<module>'), ligne))
+                ligne = None
+            else:
+                if ligne is None:
+                    ligne = self._ligne_cadre(cadre_python)
+                for nom_fonction, ligne_appel in self._appels_cadre(cadre_python):
+                    pile.append((nom_fonction, ligne))
+                    ligne = ligne_appel
+            cadre_python = cadre_python.f_back
+        pile.append(('<programme>', ligne))
+        pile.reverse()
+        return pile
+
+    def _localiser_erreur(self, erreur):
+        """Fixe la ligne d'une erreur d'exécution : celle de l'instruction la plus
+        interne de sa trace Python. Ne coûte rien tant qu'aucune erreur n'est levée."""
+        if erreur.ligne is not None:
+            return
+        cadres = []
+        trace = erreur.__traceback__
+        while trace is not None:
+            cadres.append(trace.tb_frame)
+            trace = trace.tb_next
+        for cadre_python in reversed(cadres):
+            ligne = self._ligne_cadre(cadre_python)
+            if ligne:
+                erreur.ligne = ligne
+                return
+
+    def _ligne_cadre(self, cadre_python):
+        """Ligne F-IA exécutée par ce cadre Python (None si le cadre n'en exécute pas)"""
+        if cadre_python.f_code is _CODE_EXECUTER:
+            return getattr(cadre_python.f_locals['noeud_ast'], 'ligne', 0) or None
+        return None
+
+    def _appels_cadre(self, cadre_python):
+        """Appels F-IA en cours dans ce cadre Python, du plus interne au plus externe :
+        [(fonction appelée, ligne de l'appel)] ; aucun pour ce moteur"""
+        return ()
+
+# Cadres Python reconnus par pile_appels
+_CODE_EXECUTER = VisiteurInterpretation.executer.__code__
+_CODE_APPELER = VisiteurInterpretation._appeler_fonction.__code__
+_CODE_APPELER_MODULE = VisiteurInterpretation._appeler_fonction_module.__code__
@@ -1,8 +1,97 @@
 # lexer.py
 import re
+from array import array
+from bisect import bisect_right
+from sys import intern, maxsize
 from errors import LexerError
 
+# Mots-clés (SUPPRIMÉ RACINE, PUISSANCE, etc. - ce sont des fonctions, pas des mots-clés)
+MOTS_CLES = {
+    'soit': 'SOIT',
+    'si': 'SI',
+    'sinon': 'SINON',
+    'pour': 'POUR',
+    'dans': 'DANS',
+    'tant_que': 'TANT_QUE',
+    'fonction': 'FONCTION',
+    'retourner': 'RETOURNER',
+    'vrai': 'VRAI',
+    'faux': 'FAUX',
+    'nul': 'NUL',
+    'et': 'ET',
+    'ou': 'OU',
+    'non': 'NON',
+    'essayer': 'ESSAYER',
+    'attraper': 'ATTRAPER',
+    # === MOTS-CLÉS MODULES ===
+    'importer': 'IMPORTER',
+    'depuis': 'DEPUIS',
+    'comme': 'COMME',
+    'de': 'DE',
+    # SUPPRIMÉ : racine, puissance, arrondir, aleatoire, etc. 
+    # Ce sont des fonctions intégrées, pas des mots-clés !
+}
+
+# Symboles et opérateurs
+SYMBOLES = {
+    '=': 'ASSIGNATION',
+    '==': 'EGAL',
+    '!=': 'DIFF',
+    '<': 'INF',
+    '<=': 'INF_EGAL',
+    '>': 'SUP',
+    '>=': 'SUP_EGAL',
+    '+': 'PLUS',
+    '-': 'MOINS',
+    '*': 'FOIS',
+    '/': 'DIVISE',
+    '%': 'MODULO',
+    '(': 'PARENTHESE_OUVRANTE',
+    ')': 'PARENTHESE_FERMANTE',
+    '{': 'ACCOLADE_OUVRANTE',
+    '}': 'ACCOLADE_FERMANTE',
+    '[': 'CROCHET_OUVRANT',
+    ']': 'CROCHET_FERMANT',
+    '.': 'POINT',
+    ',': 'VIRGULE',
+    ':': 'DEUX_POINTS',
+    ';': 'POINT_VIRGULE',
+    # Opérateurs d'assignation composés
+    '+=': 'PLUS_EGAL',
+    '-=': 'MOINS_EGAL',
+    '*=': 'FOIS_EGAL',
+    '/=': 'DIVISE_EGAL',
+    '%=': 'MODULO_EGAL',
+}
+
+# === MODE TABLE : UNE SEULE EXPRESSION RÉGULIÈRE ===
+# Chaque correspondance saute les blancs et commentaires puis capture un token ;
+# les groupes sont essayés dans l'ordre du lexer caractère par caractère :
+# mots, nombres, chaînes, symboles (2 caractères d'abord).
+_ACCENTUE = '\u00C0-\u017F'
+MOTIF_TOKENS = re.compile(r'(?:\s+|\#[^\n]*|//[^\n]*)*(?:' + '|'.join([
+    rf'(?P<MOT>(?:[^\W\d]|[{_ACCENTUE}])[\w{_ACCENTUE}]*)',
+    r'(?P<NOMBRE>\d+(?:\.\d*)?)',
+    r"""(?P<CHAINE>"[^"\n]*"|'[^'\n]*')""",
+    r"""(?P<CHAINE_OUVERTE>["'])""",
+    '(?P<SYMBOLE>' + '|'.join(re.escape(s) for s in sorted(SYMBOLES, key=len, reverse=True)) + ')',
+    r'(?P<INCONNU>.)',
+    # Blancs en fin de source : évite tout retour arrière dans les commentaires
+    r'(?P<FIN>\Z)',
+]) + ')')
+
+MODES_LEXER = ('table', 'caracteres')
+MODE_LEXER_PAR_DEFAUT = 'table'
+
+# Identifiants numériques des types de tokens (colonne `types` de TamponTokens)
+TYPES_TOKENS = ('EOF', 'IDENTIFIANT', 'NOMBRE', 'CHAINE') + tuple(MOTS_CLES.values()) + tuple(SYMBOLES.values())
+ID_TYPES = {type_token: index for index, type_token in enumerate(TYPES_TOKENS)}
+_ID_MOTS_CLES = {mot: ID_TYPES[type_token] for mot, type_token in MOTS_CLES.items()}
+_ID_SYMBOLES = {symbole: ID_TYPES[type_token] for symbole, type_token in SYMBOLES.items()}
+
 class Token:
+    __slots__ = ('type', 'valeur', 'ligne', 'colonne')
+
     def __init__(self, type_token, valeur, ligne=0, colonne=0):
         self.type = type_token
         self.valeur = valeur
@@ -12,74 +101,225 @@ class Token:
     def __repr__(self):
         return f"Token({self.type}, {self.valeur}, L{self.ligne}, C{self.colonne})"
 
+class IndexLignes:
+    """Convertit un décalage dans le source en (ligne, colonne), à la demande"""
+    def __init__(self, code):
+        self.code = code
+        self._debuts = None
+
+    def debuts(self):
+        """Décalage du début de chaque ligne"""
+        if self._debuts is None:
+            # Construit une seule fois, au premier besoin (positions, erreurs)
+            self._debuts = [0] + [m.end() for m in re.finditer('\n', self.code)]
+        return self._debuts
+
+    def position(self, decalage):
+        debuts = self.debuts()
+        ligne = bisect_right(debuts, decalage)
+        return ligne, decalage - debuts[ligne - 1] + 1
+
+class TamponTokens:
+    """
+    Flux de tokens en colonnes parallèles (struct-of-arrays) :
+      - types : id de type (index dans TYPES_TOKENS), array('B')
+      - valeurs : table des valeurs (lexèmes, nombres, chaînes)
+      - lignes / colonnes : array('I'), calculées à la demande depuis les
+        décalages quand le tampon vient du lexer en mode table
+    """
+    __slots__ = ('types', 'valeurs', 'decalages', '_lignes', '_colonnes', '_index_lignes')
+
+    def __init__(self, index_lignes=None):
+        self.types = array('B')
+        self.valeurs = []
+        self.decalages = array('I')
+        self._lignes = None
+        self._colonnes = None
+        self._index_lignes = index_lignes
+
+    @classmethod
+    def depuis_tokens(cls, tokens):
+        """Construit un tampon à partir d'une liste de Token"""
+        tampon = cls()
+        tampon._lignes = array('I')
+        tampon._colonnes = array('I')
+        for token in tokens:
+            tampon.types.append(ID_TYPES[token.type])
+            tampon.valeurs.append(token.valeur)
+            tampon._lignes.append(token.ligne)
+            tampon._colonnes.append(token.colonne)
+        return tampon
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        return self.token(index)
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield self.token(index)
+
+    def type(self, index):
+        return TYPES_TOKENS[self.types[index]]
+
+    def _calculer_positions(self):
+        # Les décalages sont croissants : un seul parcours des débuts de lignes
+        debuts = self._index_lignes.debuts()
+        nb_lignes = len(debuts)
+        lignes = array('I')
+        colonnes = array('I')
+        ligne = 1
+        debut = 0
+        suivant = debuts[1] if nb_lignes > 1 else maxsize
+        for decalage in self.decalages:
+            while decalage >= suivant:
+                ligne += 1
+                debut = suivant
+                suivant = debuts[ligne] if ligne < nb_lignes else maxsize
+            lignes.append(ligne)
+            colonnes.append(decalage - debut + 1)
+        self._lignes = lignes
+        self._colonnes = colonnes
+
+    def positions_compactees(self, bits_colonne):
+        """Position de chaque token compactée en `ligne << bits_colonne | colonne`
+        (colonne plafonnée), suivie d'un 0 pour la fin du flux"""
+        masque = (1 << bits_colonne) - 1
+        if self._lignes is not None:
+            return array('I', [(ligne << bits_colonne) | min(colonne, masque)
+                               for ligne, colonne in zip(self._lignes, self._colonnes)] + [0])
+        # Même parcours que _calculer_positions, sans tableaux intermédiaires
+        debuts = self._index_lignes.debuts()
+        nb_lignes = len(debuts)
+        positions = array('I')
+        ligne = 1
+        debut = 0
+        suivant = debuts[1] if nb_lignes > 1 else maxsize
+        base = ligne << bits_colonne
+        for decalage in self.decalages:
+            while decalage >= suivant:
+                ligne += 1
+                debut = suivant
+                suivant = debuts[ligne] if ligne < nb_lignes else maxsize
+                base = ligne << bits_colonne
+            colonne = decalage - debut + 1
+            positions.append(base | (colonne if colonne <= masque else masque))
+        positions.append(0)
+        return positions
+
+    def ligne(self, index):
+        if self._lignes is None:
+            self._calculer_positions()
+        return self._lignes[index]
+
+    def colonne(self, index):
+        if self._colonnes is None:
+            self._calculer_positions()
+        return self._colonnes[index]
+
+    def token(self, index):
+        """Vue Token d'une entrée du tampon (position calculée seulement si lue)"""
+        return TokenTampon(self, index)
+
+    def en_tokens(self):
+        return [Token(self.type(i), self.valeurs[i], self.ligne(i), self.colonne(i))
+                for i in range(len(self.types))]
+
+class TokenTampon(Token):
+    """Token lu dans un TamponTokens : ligne et colonne sont lues dans le tampon"""
+    __slots__ = ('_tampon', '_index')
+
+    def __init__(self, tampon, index):
+        self.type = TYPES_TOKENS[tampon.types[index]]
+        self.valeur = tampon.valeurs[index]
+        self._tampon = tampon
+        self._index = index
+
+    @property
+    def ligne(self):
+        return self._tampon.ligne(self._index)
+
+    @property
+    def colonne(self):
+        return self._tampon.colonne(self._index)
+
 class LexerFIA:
-    def __init__(self, code_source):
+    def __init__(self, code_source, mode=MODE_LEXER_PAR_DEFAUT):
+        if mode not in MODES_LEXER:
+            raise LexerError(f"Mode de lexer inconnu '{mode}'. Modes disponibles: {', '.join(MODES_LEXER)}")
         self.code = code_source
+        self.mode = mode
         self.position = 0
         self.ligne = 1
         self.colonne = 1
         self.tokens = []
-
-        # Mots-clés (SUPPRIMÉ RACINE, PUISSANCE, etc. - ce sont des fonctions, pas des mots-clés)
-        self.mots_cles = {
-            'soit': 'SOIT',
-            'si': 'SI',
-            'sinon': 'SINON',
-            'pour': 'POUR',
-            'dans': 'DANS',
-            'tant_que': 'TANT_QUE',
-            'fonction': 'FONCTION',
-            'retourner': 'RETOURNER',
-            'vrai': 'VRAI',
-            'faux': 'FAUX',
-            'nul': 'NUL',
-            'et': 'ET',
-            'ou': 'OU',
-            'non': 'NON',
-            'essayer': 'ESSAYER',
-            'attraper': 'ATTRAPER',
-            # === MOTS-CLÉS MODULES ===
-            'importer': 'IMPORTER',
-            'depuis': 'DEPUIS',
-            'comme': 'COMME',
-            'de': 'DE',
-            # SUPPRIMÉ : racine, puissance, arrondir, aleatoire, etc. 
-            # Ce sont des fonctions intégrées, pas des mots-clés !
-        }
-
-        # Symboles et opérateurs
-        self.symboles = {
-            '=': 'ASSIGNATION',
-            '==': 'EGAL',
-            '!=': 'DIFF',
-            '<': 'INF',
-            '<=': 'INF_EGAL',
-            '>': 'SUP',
-            '>=': 'SUP_EGAL',
-            '+': 'PLUS',
-            '-': 'MOINS',
-            '*': 'FOIS',
-            '/': 'DIVISE',
-            '%': 'MODULO',
-            '(': 'PARENTHESE_OUVRANTE',
-            ')': 'PARENTHESE_FERMANTE',
-            '{': 'ACCOLADE_OUVRANTE',
-            '}': 'ACCOLADE_FERMANTE',
-            '[': 'CROCHET_OUVRANT',
-            ']': 'CROCHET_FERMANT',
-            '.': 'POINT',
-            ',': 'VIRGULE',
-            ':': 'DEUX_POINTS',
-            ';': 'POINT_VIRGULE',
-            # Opérateurs d'assignation composés
-            '+=': 'PLUS_EGAL',
-            '-=': 'MOINS_EGAL',
-            '*=': 'FOIS_EGAL',
-            '/=': 'DIVISE_EGAL',
-            '%=': 'MODULO_EGAL',
-        }
+        self.mots_cles = MOTS_CLES
+        self.symboles = SYMBOLES
 
     def tokeniser(self):
+        """Retourne la liste des Token"""
+        if self.mode == 'table':
+            self.tokens = self.tokeniser_table().en_tokens()
+            return self.tokens
+        return self.tokeniser_caracteres()
+
+    def tokeniser_tampon(self):
+        """Retourne les tokens sous forme compacte (TamponTokens), utilisée par le parser"""
+        if self.mode == 'table':
+            return self.tokeniser_table()
+        return TamponTokens.depuis_tokens(self.tokeniser_caracteres())
+
+    def tokeniser_table(self):
+        """Découpe tout le source avec MOTIF_TOKENS, directement dans un TamponTokens"""
+        code = self.code
+        lignes = IndexLignes(code)
+        tampon = TamponTokens(lignes)
+        ajouter_type = tampon.types.append
+        ajouter_valeur = tampon.valeurs.append
+        ajouter_decalage = tampon.decalages.append
+        id_mots_cles = _ID_MOTS_CLES
+        id_symboles = _ID_SYMBOLES
+        id_identifiant = ID_TYPES['IDENTIFIANT']
+        id_nombre = ID_TYPES['NOMBRE']
+        id_chaine = ID_TYPES['CHAINE']
+
+        for correspondance in MOTIF_TOKENS.finditer(code):
+            genre = correspondance.lastgroup
+            lexeme = correspondance.group(genre)
+            if genre == 'MOT':
+                ajouter_type(id_mots_cles.get(lexeme, id_identifiant))
+                ajouter_valeur(intern(lexeme))
+            elif genre == 'SYMBOLE':
+                ajouter_type(id_symboles[lexeme])
+                ajouter_valeur(intern(lexeme))
+            elif genre == 'NOMBRE':
+                ajouter_type(id_nombre)
+                ajouter_valeur(float(lexeme) if '.' in lexeme else int(lexeme))
+            elif genre == 'CHAINE':
+                ajouter_type(id_chaine)
+                ajouter_valeur(lexeme[1:-1])
+            elif genre == 'FIN':
+                break
+            elif genre == 'CHAINE_OUVERTE':
+                debut = correspondance.start(genre)
+                if code.find('\n', debut) == -1:
+                    raise LexerError("Chaîne non terminée à la fin du fichier")
+                raise LexerError(f"Chaîne non terminée à la ligne {lignes.position(debut)[0]}")
+            else:
+                ligne, colonne = lignes.position(correspondance.start(genre))
+                raise LexerError(f"Caractère inconnu '{lexeme}' à la ligne {ligne}, colonne {colonne}")
+            ajouter_decalage(correspondance.start(genre))
+
+        # Token de fin
+        ajouter_type(ID_TYPES['EOF'])
+        ajouter_valeur('')
+        ajouter_decalage(len(code))
+        self.position = len(code)
+        return tampon
+
+    def tokeniser_caracteres(self):
+        """Lexer historique : avance caractère par caractère"""
         while self.position < len(self.code):
             char = self.code[self.position]
 
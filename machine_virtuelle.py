@@ -0,0 +1,756 @@
+# machine_virtuelle.py
+"""
+Machine virtuelle à pile pour F-IA.
+
+Le compilateur transforme un `Programme`, un `Bloc` (corps de fonction) ou une
+expression en un `CodeFIA` plat :
+  - `operations` : codes d'opération dans un `array('B')`
+  - `arguments`  : opérande de chaque instruction dans un `array('i')`
+  - `constantes` / `noms` : tables référencées par les opérandes
+
+La machine exécute ce bytecode dans une seule boucle de dispatch. Un appel
+de fonction F-IA ne rappelle pas la boucle : le cadre de l'appelant (code,
+pc, pile, registre, variables locales) est empilé sur une pile d'appels
+explicite, en mémoire, et la boucle continue dans le code de la fonction ;
+RETOURNER le dépile. La profondeur de récursion F-IA ne dépend donc pas de
+la pile Python (voir PROFONDEUR_MAX).
+
+Chaque instruction de niveau bloc laisse une valeur sur la pile, dépilée dans
+le registre `resultat` (valeur de la dernière instruction, comme le visiteur).
+
+Les variables résolues par `resolveur.py` sont lues et écrites directement
+dans le slot du cadre courant (CHARGER_LOCAL / STOCKER_LOCAL) ou dans le
+dictionnaire des globales (CHARGER_GLOBAL / STOCKER_GLOBAL).
+"""
+from array import array
+from collections import deque
+
+from errors import RuntimeError, ReturnException
+from builtin import _ArretProgramme
+from fia_ast import *
+from interpreter import VisiteurInterpretation, Cadre, NON_DEFINI, VARIABLE
+from operateurs import SYMBOLES_BINAIRES, OPERATIONS_BINAIRES as OPERATIONS, FONCTIONS_COMPOSEES, convertir_si_nombre
+
+# === JEU D'INSTRUCTIONS ===
+
+CHARGER_CONST = 0         # empile constantes[arg]
+CHARGER_NOM = 1           # empile noms[arg] (fonction ou variable non résolue, recherche par nom)
+DECLARER_NOM = 2          # dépile et lie noms[arg] (variable non résolue)
+ASSIGNER_NOM = 3          # dépile dans noms[arg], qui doit déjà exister
+BINAIRE = 4               # dépile droite, gauche ; empile OPERATIONS[arg](gauche, droite)
+SAUTER = 5                # pc = arg
+SAUTER_SI_FAUX = 6        # dépile ; si faux, pc = arg
+APPELER = 7               # constantes[arg] = (nom, nb_args)
+DEPILER_RESULTAT = 8      # dépile dans le registre resultat
+RETOURNER = 9             # termine le code et retourne le sommet de pile
+RETOURNER_RESULTAT = 10   # termine le code et retourne le registre resultat
+UNAIRE = 11               # arg = 0 pour '-', 1 pour '+'
+ACCES_INDEX = 12          # dépile index, base ; empile base[index]
+ACCES_CLE = 13            # dépile clé, base ; empile base[clé]
+STOCKER_INDEX = 14        # dépile index, base, valeur ; base[index] = valeur
+STOCKER_CLE = 15          # dépile clé, base, valeur ; base[clé] = valeur
+APPELER_MODULE = 16       # arg = nb_args ; la fonction est sous les arguments
+CONSTRUIRE_DICT = 17      # constantes[arg] = tuple des clés
+CHARGER_COMPOSE = 18      # empile noms[arg] (doit exister, pour += -= ...)
+COMPOSER = 19             # comme BINAIRE avec COMPOSITIONS[arg]
+DEFINIR_FONCTION = 20     # constantes[arg] = nœud Fonction
+CHARGER_LOCAL = 21        # empile noms[arg] (fonction, slot local du cadre, puis globale)
+CHARGER_GLOBAL = 22       # empile noms[arg] (fonction ou variable globale)
+ET_LOGIQUE = 23           # convertit le sommet ; s'il est faux, pc = arg (il reste), sinon il est dépilé
+OU_LOGIQUE = 24           # convertit le sommet ; s'il est vrai, pc = arg (il reste), sinon il est dépilé
+COMPTER_PAS = 25          # consomme un pas du budget d'exécution (fin d'itération)
+ITERER_DEBUT = 27         # remplace l'itérable au sommet de pile par son itérateur
+ITERER_SUIVANT = 28       # empile l'élément suivant (un pas du budget), ou pc = arg en fin d'itération
+ITERER_FIN = 29           # dépile l'itérateur
+VISITER = 30              # délègue constantes[arg] au visiteur (imports, cas rares)
+LEVER_RETOUR = 31         # 'retourner' hors fonction : même exception que le visiteur
+STOCKER_LOCAL = 32        # dépile dans le slot slots[arg] du cadre courant
+STOCKER_GLOBAL = 33       # dépile dans la globale noms[arg]
+CONSTRUIRE_LISTE = 34     # dépile arg valeurs ; empile une nouvelle liste
+APPELER_TERMINAL = 35     # comme APPELER ; si la fonction est celle en cours, son cadre est réutilisé
+
+# Profondeur maximale de la pile d'appels de la machine quand le budget ne fixe pas
+# de max_profondeur (quelques centaines d'octets par appel en cours)
+PROFONDEUR_MAX = 200_000
+
+NOMS_INSTRUCTIONS = {valeur: nom for nom, valeur in globals().items()
+                     if nom.isupper() and isinstance(valeur, int)}
+
+# Tables d'opérations référencées par l'argument de COMPOSER (celles de BINAIRE : operateurs.py)
+SYMBOLES_COMPOSES = list(FONCTIONS_COMPOSEES)
+COMPOSITIONS = [FONCTIONS_COMPOSEES[op] for op in SYMBOLES_COMPOSES]
+
+
+class CodeFIA:
+    """Bytecode compilé d'un programme, d'un corps de fonction ou d'une expression"""
+    __slots__ = ('operations', 'arguments', 'lignes', 'constantes', 'noms', 'slots', 'nom',
+                 'caches_noms', 'caches_appels', 'tables')
+
+    def __init__(self, nom):
+        self.nom = nom
+        self.operations = array('B')
+        self.arguments = array('i')
+        # Ligne source de chaque instruction (profileur)
+        self.lignes = array('I')
+        self.constantes = []
+        self.noms = []
+        # Slot résolu de chaque nom (>= 0 local, -1 global, None recherche par nom)
+        self.slots = []
+        # Caches en ligne (version des fonctions, résolution) par nom et par constante d'APPELER
+        self.caches_noms = []
+        self.caches_appels = []
+        # Tables lues par la boucle de dispatch (remplies sur place par le compilateur)
+        self.tables = (self.operations, self.arguments, self.constantes, self.noms, self.slots,
+                       self.caches_noms, self.caches_appels)
+
+    def desassembler(self):
+        """Retourne une représentation lisible du bytecode (débogage)"""
+        lignes = [f"<code {self.nom}>"]
+        for pc, (op, arg) in enumerate(zip(self.operations, self.arguments)):
+            detail = ''
+            if op in (CHARGER_NOM, DECLARER_NOM, ASSIGNER_NOM, CHARGER_COMPOSE,
+                      CHARGER_LOCAL, CHARGER_GLOBAL, STOCKER_LOCAL, STOCKER_GLOBAL):
+                detail = self.noms[arg]
+            elif op == DEFINIR_FONCTION:
+                fonction = self.constantes[arg]
+                detail = f"{fonction.nom}({', '.join(fonction.parametres)})"
+            elif op in (CHARGER_CONST, APPELER, APPELER_TERMINAL, CONSTRUIRE_DICT, VISITER):
+                detail = repr(self.constantes[arg])
+            elif op == BINAIRE:
+                detail = SYMBOLES_BINAIRES[arg]
+            elif op == COMPOSER:
+                detail = SYMBOLES_COMPOSES[arg]
+            lignes.append(f"{pc:5d} {NOMS_INSTRUCTIONS[op]:<18} {arg:<6} {detail}")
+        return "\n".join(lignes)
+
+
+def desassembler_programme(programme):
+    """Bytecode lisible d'un programme puis de chaque fonction qu'il définit
+    (débogage : `python main.py --bytecode fichier.fia`)"""
+    compilateur = CompilateurBytecode()
+    parties = [compilateur.compiler_programme(programme).desassembler()]
+    a_visiter = [programme]
+    while a_visiter:
+        noeud = a_visiter.pop()
+        if isinstance(noeud, Fonction):
+            parties.append(compilateur.compiler_corps(noeud.corps, noeud.nom).desassembler())
+        if isinstance(noeud, Noeud):
+            a_visiter.extend(reversed([getattr(noeud, champ, None) for champ in type(noeud).__slots__]))
+        elif isinstance(noeud, list):
+            a_visiter.extend(reversed(noeud))
+    return "\n\n".join(parties)
+
+
+class CompilateurBytecode:
+    """Compile l'AST F-IA en `CodeFIA`"""
+
+    def _nouveau_code(self, nom):
+        self._code = CodeFIA(nom)
+        self._ligne = 0
+        self._index_constantes = {}
+        self._index_noms = {}
+
+    def compiler_programme(self, programme):
+        self._nouveau_code('<programme>')
+        self._dans_fonction = False
+        for instruction in programme.instructions:
+            self._instruction(instruction)
+        self._emettre(RETOURNER_RESULTAT)
+        return self._code
+
+    def compiler_corps(self, bloc, nom='<fonction>'):
+        self._nouveau_code(nom)
+        self._dans_fonction = True
+        self._bloc(bloc)
+        self._emettre(RETOURNER_RESULTAT)
+        return self._code
+
+    def compiler_expression(self, noeud):
+        self._nouveau_code('<expression>')
+        self._dans_fonction = False
+        self._expression(noeud)
+        self._emettre(RETOURNER)
+        return self._code
+
+    # === ÉMISSION ===
+
+    def _emettre(self, operation, argument=0):
+        self._code.operations.append(operation)
+        self._code.arguments.append(argument)
+        self._code.lignes.append(self._ligne)
+        return len(self._code.operations) - 1
+
+    def _position(self):
+        return len(self._code.operations)
+
+    def _corriger_saut(self, position_instruction, cible):
+        self._code.arguments[position_instruction] = cible
+
+    def _constante(self, valeur):
+        # Indexées par identité (1, 1.0 et vrai restent distincts).
+        # La table garde les objets vivants.
+        index = self._index_constantes.get(id(valeur))
+        if index is None:
+            index = len(self._code.constantes)
+            self._code.constantes.append(valeur)
+            self._code.caches_appels.append(None)
+            self._index_constantes[id(valeur)] = index
+        return index
+
+    def _nom(self, nom, slot=None):
+        # Dans un même code, un nom a toujours le même slot (une seule fonction)
+        index = self._index_noms.get(nom)
+        if index is None:
+            index = len(self._code.noms)
+            self._code.noms.append(nom)
+            self._code.slots.append(slot)
+            self._code.caches_noms.append(None)
+            self._index_noms[nom] = index
+        return index
+
+    def _charger_variable(self, nom, slot):
+        if slot is None:
+            self._emettre(CHARGER_NOM, self._nom(nom))
+        elif slot >= 0:
+            self._emettre(CHARGER_LOCAL, self._nom(nom, slot))
+        else:
+            self._emettre(CHARGER_GLOBAL, self._nom(nom, slot))
+
+    def _stocker_variable(self, nom, slot):
+        if slot is None:
+            self._emettre(DECLARER_NOM, self._nom(nom))
+        elif slot >= 0:
+            self._emettre(STOCKER_LOCAL, self._nom(nom, slot))
+        else:
+            self._emettre(STOCKER_GLOBAL, self._nom(nom, slot))
+
+    # === INSTRUCTIONS (laissent toujours une valeur, dépilée dans resultat) ===
+
+    def _instruction(self, noeud):
+        ligne_englobante = self._ligne
+        self._ligne = noeud.ligne or ligne_englobante
+        self._valeur_instruction(noeud)
+        self._emettre(DEPILER_RESULTAT)
+        self._ligne = ligne_englobante
+
+    def _bloc(self, bloc):
+        for instruction in bloc.instructions:
+            self._instruction(instruction)
+
+    def _valeur_instruction(self, noeud):
+        if isinstance(noeud, ExpressionStatement):
+            self._expression(noeud.expression)
+        elif isinstance(noeud, DeclarationVariable):
+            if noeud.valeur:
+                self._expression(noeud.valeur)
+            else:
+                self._emettre(CHARGER_CONST, self._constante(None))
+            self._stocker_variable(noeud.nom, noeud.slot)
+            self._emettre(CHARGER_CONST, self._constante(None))
+        elif isinstance(noeud, Assignation):
+            self._assignation(noeud)
+            self._emettre(CHARGER_CONST, self._constante(None))
+        elif (isinstance(noeud, AssignationComposee) and isinstance(noeud.cible, Identifiant)
+              and noeud.operateur in FONCTIONS_COMPOSEES):
+            cible = noeud.cible
+            self._emettre(CHARGER_COMPOSE, self._nom(cible.nom, cible.slot))
+            self._expression(noeud.valeur)
+            self._emettre(COMPOSER, SYMBOLES_COMPOSES.index(noeud.operateur))
+            self._stocker_variable(cible.nom, cible.slot)
+            self._emettre(CHARGER_CONST, self._constante(None))
+        elif isinstance(noeud, Condition):
+            self._condition(noeud)
+        elif isinstance(noeud, BoucleTantQue):
+            self._boucle_tant_que(noeud)
+        elif isinstance(noeud, BouclePour):
+            self._boucle_pour(noeud)
+        elif isinstance(noeud, BouclePourDans):
+            self._boucle_pour_dans(noeud)
+        elif isinstance(noeud, Fonction):
+            self._emettre(DEFINIR_FONCTION, self._constante(noeud))
+            self._emettre(CHARGER_CONST, self._constante(None))
+        elif isinstance(noeud, Retour):
+            if noeud.appel_terminal and self._dans_fonction:
+                self._appel(noeud.valeur, APPELER_TERMINAL)
+            elif noeud.valeur is not None:
+                self._expression(noeud.valeur)
+            else:
+                self._emettre(CHARGER_CONST, self._constante(None))
+            self._emettre(RETOURNER if self._dans_fonction else LEVER_RETOUR)
+        elif isinstance(noeud, Bloc):
+            self._bloc(noeud)
+            self._emettre(CHARGER_CONST, self._constante(None))
+        else:
+            self._expression(noeud)
+
+    def _assignation(self, assign):
+        cible = assign.cible
+        if not isinstance(cible, (Identifiant, AccesIndex, AccesDictionnaire)):
+            # Cible invalide : le visiteur évalue la valeur puis signale l'erreur
+            self._emettre(VISITER, self._constante(assign))
+            self._emettre(DEPILER_RESULTAT)
+            return
+        self._expression(assign.valeur)
+        if isinstance(cible, Identifiant):
+            self._emettre(ASSIGNER_NOM, self._nom(cible.nom, cible.slot))
+        elif isinstance(cible, AccesIndex):
+            self._expression(cible.base)
+            self._expression(cible.index)
+            self._emettre(STOCKER_INDEX)
+        else:
+            self._expression(cible.base)
+            self._expression(cible.cle)
+            self._emettre(STOCKER_CLE)
+
+    def _condition(self, condition):
+        self._expression(condition.condition)
+        saut_sinon = self._emettre(SAUTER_SI_FAUX)
+        self._bloc_ou_instruction(condition.bloc_si)
+        if condition.bloc_sinon:
+            saut_fin = self._emettre(SAUTER)
+            self._corriger_saut(saut_sinon, self._position())
+            self._bloc_ou_instruction(condition.bloc_sinon)
+            self._corriger_saut(saut_fin, self._position())
+        else:
+            self._corriger_saut(saut_sinon, self._position())
+        self._emettre(CHARGER_CONST, self._constante(None))
+
+    def _bloc_ou_instruction(self, noeud):
+        if isinstance(noeud, Bloc):
+            self._bloc(noeud)
+        else:
+            self._instruction(noeud)
+
+    def _boucle_tant_que(self, boucle):
+        debut = self._position()
+        self._expression(boucle.condition)
+        saut_fin = self._emettre(SAUTER_SI_FAUX)
+        self._bloc_ou_instruction(boucle.corps)
+        self._emettre(COMPTER_PAS)
+        self._emettre(SAUTER, debut)
+        self._corriger_saut(saut_fin, self._position())
+        self._emettre(CHARGER_CONST, self._constante(None))
+
+    def _boucle_pour(self, boucle):
+        self._instruction(boucle.init)
+        debut = self._position()
+        self._expression(boucle.condition)
+        saut_fin = self._emettre(SAUTER_SI_FAUX)
+        self._bloc_ou_instruction(boucle.corps)
+        self._instruction(boucle.increment)
+        self._emettre(COMPTER_PAS)
+        self._emettre(SAUTER, debut)
+        self._corriger_saut(saut_fin, self._position())
+        self._emettre(CHARGER_CONST, self._constante(None))
+
+    def _boucle_pour_dans(self, boucle):
+        self._expression(boucle.iterable)
+        self._emettre(ITERER_DEBUT)
+        debut = self._position()
+        saut_fin = self._emettre(ITERER_SUIVANT)
+        self._stocker_variable(boucle.variable, boucle.slot)
+        self._bloc_ou_instruction(boucle.corps)
+        self._emettre(SAUTER, debut)
+        fin = self._position()
+        self._corriger_saut(saut_fin, fin)
+        self._emettre(ITERER_FIN)
+        self._emettre(CHARGER_CONST, self._constante(None))
+
+    # === EXPRESSIONS (laissent exactement une valeur sur la pile) ===
+
+    def _expression(self, noeud):
+        if isinstance(noeud, Littéral):
+            self._emettre(CHARGER_CONST, self._constante(noeud.valeur))
+        elif isinstance(noeud, Identifiant):
+            self._charger_variable(noeud.nom, noeud.slot)
+        elif isinstance(noeud, ExpressionLogique):
+            # Court-circuit : droite n'est évaluée que si gauche ne décide pas
+            self._expression(noeud.gauche)
+            saut_fin = self._emettre(ET_LOGIQUE if noeud.operateur == 'et' else OU_LOGIQUE)
+            self._expression(noeud.droite)
+            self._emettre(UNAIRE, 1)
+            self._corriger_saut(saut_fin, self._position())
+        elif isinstance(noeud, ExpressionBinaire) and noeud.code_operateur is not None:
+            self._expression(noeud.gauche)
+            self._expression(noeud.droite)
+            self._emettre(BINAIRE, noeud.code_operateur)
+        elif isinstance(noeud, ExpressionUnaire) and noeud.operateur in ('-', '+'):
+            self._expression(noeud.operande)
+            self._emettre(UNAIRE, 0 if noeud.operateur == '-' else 1)
+        elif isinstance(noeud, AppelFonction):
+            self._appel(noeud)
+        elif isinstance(noeud, AccesIndex):
+            self._expression(noeud.base)
+            self._expression(noeud.index)
+            self._emettre(ACCES_INDEX)
+        elif isinstance(noeud, AccesDictionnaire):
+            self._expression(noeud.base)
+            self._expression(noeud.cle)
+            self._emettre(ACCES_CLE)
+        elif isinstance(noeud, ListeLitterale):
+            for element in noeud.elements:
+                self._expression(element)
+            self._emettre(CONSTRUIRE_LISTE, len(noeud.elements))
+        elif isinstance(noeud, DictionnaireLitteral):
+            for valeur in noeud.elements.values():
+                self._expression(valeur)
+            self._emettre(CONSTRUIRE_DICT, self._constante(tuple(noeud.elements.keys())))
+        else:
+            # Accès aux modules, imports, nœuds rares : le visiteur fait foi
+            self._emettre(VISITER, self._constante(noeud))
+
+    def _appel(self, appel, instruction=APPELER):
+        if isinstance(appel.nom_fonction, AccesAttribut):
+            self._emettre(VISITER, self._constante(appel.nom_fonction))
+            for argument in appel.arguments:
+                self._expression(argument)
+            self._emettre(APPELER_MODULE, len(appel.arguments))
+            return
+        for argument in appel.arguments:
+            self._expression(argument)
+        nom_fonction = VisiteurInterpretation._nom_fonction(appel.nom_fonction)
+        self._emettre(instruction, self._constante((nom_fonction, len(appel.arguments))))
+
+
+class MachineVirtuelleFIA(VisiteurInterpretation):
+    """Interpréteur F-IA qui compile l'AST en bytecode et l'exécute sur une pile"""
+
+    def __init__(self, sortie=None, budget=None):
+        super().__init__(sortie, budget)
+        self.compilateur = CompilateurBytecode()
+        # Cache du bytecode compilé {nœud: CodeFIA}
+        self._codes = {}
+
+    def compiler(self, noeud):
+        """Retourne le bytecode (mis en cache) d'un nœud AST"""
+        code = self._codes.get(noeud)
+        if code is None:
+            if isinstance(noeud, Programme):
+                code = self.compilateur.compiler_programme(noeud)
+            elif isinstance(noeud, Bloc):
+                code = self.compilateur.compiler_corps(noeud)
+            else:
+                code = self.compilateur.compiler_expression(noeud)
+            self._codes[noeud] = code
+        return code
+
+    def executer(self, noeud_ast, fichier_courant=None):
+        """Compile (une seule fois) puis exécute un nœud AST sur la machine virtuelle"""
+        code = self.compiler(noeud_ast)
+        est_programme = isinstance(noeud_ast, Programme)
+        if fichier_courant:
+            ancien_fichier = self.fichier_courant
+            self.fichier_courant = fichier_courant
+            try:
+                return self._executer_code(code, est_programme)
+            finally:
+                self.fichier_courant = ancien_fichier
+        return self._executer_code(code, est_programme)
+
+    def _executer_code(self, code, est_programme=False):
+        if est_programme:
+            jetons = self._entrer_programme()
+            try:
+                return self._executer_boucle(code)
+            except _ArretProgramme:
+                return None
+            except RuntimeError as e:
+                self._localiser_erreur(e)
+                raise
+            finally:
+                self._sortir_programme(jetons)
+        return self._executer_boucle(code)
+
+    def _executer_boucle(self, code):
+        """Exécute `code` ; si une erreur interrompt des appels en cours dans la
+        boucle, le cadre et la profondeur de l'appelant sont restaurés"""
+        appels = []
+        try:
+            return self._boucle(code, appels)
+        except BaseException:
+            if appels:
+                self.cadre = appels[0][4]
+                self.budget.profondeur -= len(appels)
+            raise
+
+    def _boucle(self, code, appels):
+        """Boucle de dispatch de la machine virtuelle. `appels` : pile des appels
+        F-IA en cours dans cette boucle, [(code, pc, pile, resultat, cadre, nom)]
+        de l'appelant de chacun"""
+        (operations, arguments, constantes, noms, slots,
+         caches_noms, caches_appels) = code.tables
+        resoudre_identifiant = self._resoudre_identifiant
+        globales = self.globales
+        cadre = self.cadre
+        budget = self.budget
+        limite_profondeur = min(budget.limite_profondeur, PROFONDEUR_MAX)
+
+        pile = []
+        empiler = pile.append
+        depiler = pile.pop
+        resultat = None
+        pc = 0
+
+        while True:
+            op = operations[pc]
+            arg = arguments[pc]
+            pc += 1
+
+            if op == CHARGER_LOCAL:
+                cache = caches_noms[arg]
+                if cache is None or cache[0] != self.version_noms:
+                    cache = caches_noms[arg] = (self.version_noms, resoudre_identifiant(noms[arg]))
+                valeur = cache[1]
+                if valeur is VARIABLE:
+                    valeur = cadre[slots[arg]]
+                    if valeur is NON_DEFINI:
+                        nom = noms[arg]
+                        if nom not in globales:
+                            raise RuntimeError(f"Variable '{nom}' non définie")
+                        valeur = globales[nom]
+                empiler(valeur)
+            elif op == CHARGER_GLOBAL:
+                cache = caches_noms[arg]
+                if cache is None or cache[0] != self.version_noms:
+                    cache = caches_noms[arg] = (self.version_noms, resoudre_identifiant(noms[arg]))
+                valeur = cache[1]
+                if valeur is VARIABLE:
+                    nom = noms[arg]
+                    if nom not in globales:
+                        raise RuntimeError(f"Variable '{nom}' non définie")
+                    valeur = globales[nom]
+                empiler(valeur)
+            elif op == STOCKER_LOCAL:
+                cadre[slots[arg]] = depiler()
+            elif op == STOCKER_GLOBAL:
+                globales[noms[arg]] = depiler()
+            elif op == CHARGER_CONST:
+                empiler(constantes[arg])
+            elif op == DEPILER_RESULTAT:
+                resultat = depiler()
+            elif op == BINAIRE:
+                droite = depiler()
+                pile[-1] = OPERATIONS[arg](pile[-1], droite)
+            elif op == SAUTER_SI_FAUX:
+                if not depiler():
+                    pc = arg
+            elif op == SAUTER:
+                pc = arg
+            elif op == ET_LOGIQUE:
+                valeur = pile[-1] = convertir_si_nombre(pile[-1])
+                if valeur:
+                    depiler()
+                else:
+                    pc = arg
+            elif op == OU_LOGIQUE:
+                valeur = pile[-1] = convertir_si_nombre(pile[-1])
+                if valeur:
+                    pc = arg
+                else:
+                    depiler()
+            elif op == APPELER or op == APPELER_TERMINAL:
+                nom_fonction, nb_args = constantes[arg]
+                if nb_args:
+                    args = pile[-nb_args:]
+                    del pile[-nb_args:]
+                else:
+                    args = []
+                cache = caches_appels[arg]
+                if cache is None or cache[0] != self.version_noms:
+                    cache = caches_appels[arg] = (self.version_noms, self._resoudre_fonction(nom_fonction))
+                fonction = cache[1]
+                if type(fonction) is not dict:
+                    empiler(self._appeler_fonction(nom_fonction, args, fonction))
+                    continue
+                if len(args) != len(fonction['params']):
+                    raise RuntimeError(f"La fonction '{nom_fonction}' attend {len(fonction['params'])} "
+                                       f"arguments, {len(args)} fournis.")
+                if op == APPELER_TERMINAL and fonction['locaux'] is cadre.index:
+                    # Appel terminal à la fonction en cours : même code, nouveau cadre, même profondeur
+                    budget.restants -= 1
+                    if budget.restants < 0:
+                        budget.verifier()
+                    cadre = self.cadre = Cadre(fonction['locaux'], args)
+                    pile = []
+                    empiler = pile.append
+                    depiler = pile.pop
+                    resultat = None
+                    pc = 0
+                    continue
+                # Fonction F-IA : le cadre de l'appelant passe sur la pile d'appels
+                if budget.profondeur >= limite_profondeur:
+                    budget.depasser_profondeur()
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+                appels.append((code, pc, pile, resultat, cadre, nom_fonction))
+                budget.profondeur += 1
+                cadre = self.cadre = Cadre(fonction['locaux'], args)
+                code = self.compiler(fonction['corps'])
+                (operations, arguments, constantes, noms, slots,
+                 caches_noms, caches_appels) = code.tables
+                pile = []
+                empiler = pile.append
+                depiler = pile.pop
+                resultat = None
+                pc = 0
+            elif op == CHARGER_COMPOSE:
+                nom = noms[arg]
+                if not self._variable_existe(nom, slots[arg]):
+                    raise RuntimeError(f"Variable '{nom}' non déclarée avant assignation composée")
+                empiler(self._lire_variable(nom, slots[arg]))
+            elif op == COMPOSER:
+                nouvelle = depiler()
+                pile[-1] = COMPOSITIONS[arg](pile[-1], nouvelle)
+            elif op == ASSIGNER_NOM:
+                nom = noms[arg]
+                if not self._variable_existe(nom, slots[arg]):
+                    raise RuntimeError(f"Variable '{nom}' non déclarée avant assignation")
+                self._ecrire_variable(nom, slots[arg], depiler())
+            elif op == RETOURNER or op == RETOURNER_RESULTAT:
+                valeur = depiler() if op == RETOURNER else resultat
+                if not appels:
+                    return valeur
+                # Retour à l'appelant sur la pile d'appels
+                code, pc, pile, resultat, cadre, _ = appels.pop()
+                self.cadre = cadre
+                budget.profondeur -= 1
+                (operations, arguments, constantes, noms, slots,
+                 caches_noms, caches_appels) = code.tables
+                empiler = pile.append
+                depiler = pile.pop
+                empiler(valeur)
+            elif op == COMPTER_PAS:
+                budget.restants -= 1
+                if budget.restants < 0:
+                    budget.verifier()
+            elif op == ITERER_SUIVANT:
+                element = next(pile[-1], _FIN_ITERATION)
+                if element is _FIN_ITERATION:
+                    pc = arg
+                else:
+                    budget.restants -= 1
+                    if budget.restants < 0:
+                        budget.verifier()
+                    empiler(element)
+            elif op == ACCES_INDEX:
+                index_value = depiler()
+                pile[-1] = self._acceder_index(pile[-1], index_value)
+            elif op == ACCES_CLE:
+                cle_value = depiler()
+                base_value = pile[-1]
+                if not isinstance(base_value, dict):
+                    raise RuntimeError("L'opérande gauche de l'accès par clé doit être un dictionnaire")
+                if cle_value not in base_value:
+                    raise RuntimeError(f"Clé '{cle_value}' non trouvée dans le dictionnaire")
+                pile[-1] = base_value[cle_value]
+            elif op == UNAIRE:
+                valeur = convertir_si_nombre(pile[-1])
+                pile[-1] = -valeur if arg == 0 else valeur
+            elif op == APPELER_MODULE:
+                if arg:
+                    args = pile[-arg:]
+                    del pile[-arg:]
+                else:
+                    args = []
+                fonction_module = depiler()
+                empiler(self._appeler_fonction_module(fonction_module, args))
+            elif op == CONSTRUIRE_LISTE:
+                if arg:
+                    valeurs = pile[-arg:]
+                    del pile[-arg:]
+                else:
+                    valeurs = []
+                empiler(valeurs)
+            elif op == CONSTRUIRE_DICT:
+                cles = constantes[arg]
+                if cles:
+                    valeurs = pile[-len(cles):]
+                    del pile[-len(cles):]
+                else:
+                    valeurs = []
+                empiler(dict(zip(cles, valeurs)))
+            elif op == STOCKER_INDEX:
+                index_value = depiler()
+                base_list = depiler()
+                valeur = depiler()
+                if not isinstance(base_list, list):
+                    raise RuntimeError("L'opérande gauche de l'assignation par index doit être une liste")
+                if not isinstance(index_value, int):
+                    raise RuntimeError("L'index doit être un entier")
+                if index_value < 0 or index_value >= len(base_list):
+                    raise RuntimeError("Index de liste hors limites")
+                base_list[index_value] = valeur
+            elif op == STOCKER_CLE:
+                cle_value = depiler()
+                base_dict = depiler()
+                valeur = depiler()
+                if not isinstance(base_dict, dict):
+                    raise RuntimeError("L'opérande gauche de l'assignation par clé doit être un dictionnaire")
+                if cle_value not in base_dict and len(base_dict) >= budget.limite_elements:
+                    budget.depasser_elements()
+                base_dict[cle_value] = valeur
+            elif op == ITERER_DEBUT:
+                iterable_value = pile[-1]
+                if not isinstance(iterable_value, (list, dict, str, deque)):
+                    raise RuntimeError("L'objet à droite de 'dans' doit être itérable (liste, dictionnaire ou chaîne)")
+                pile[-1] = iter(iterable_value)
+            elif op == ITERER_FIN:
+                depiler()
+            elif op == DEFINIR_FONCTION:
+                self.visiter_fonction(constantes[arg])
+            elif op == VISITER:
+                empiler(constantes[arg].accepter(self))
+            elif op == CHARGER_NOM:
+                cache = caches_noms[arg]
+                if cache is None or cache[0] != self.version_noms:
+                    cache = caches_noms[arg] = (self.version_noms, resoudre_identifiant(noms[arg]))
+                valeur = cache[1]
+                if valeur is VARIABLE:
+                    valeur = self._get_variable(noms[arg])
+                empiler(valeur)
+            elif op == DECLARER_NOM:
+                self._set_variable(noms[arg], depiler())
+            elif op == LEVER_RETOUR:
+                raise ReturnException(depiler())
+            else:
+                raise RuntimeError(f"Instruction inconnue: {op}")
+
+    def _acceder_index(self, base_value, index_value):
+        if isinstance(base_value, dict):
+            if index_value not in base_value:
+                raise RuntimeError(f"Clé '{index_value}' non trouvée dans le dictionnaire")
+            return base_value[index_value]
+
+        if not isinstance(base_value, list):
+            raise RuntimeError("L'opérande gauche de l'accès par index doit être une liste ou un dictionnaire")
+        if not isinstance(index_value, int):
+            raise RuntimeError("L'index doit être un entier")
+        if index_value < 0 or index_value >= len(base_value):
+            raise RuntimeError("Index de liste hors limites")
+        return base_value[index_value]
+
+    # === PROFILAGE ===
+
+    def _ligne_cadre(self, cadre_python):
+        if cadre_python.f_code is _CODE_BOUCLE:
+            variables = cadre_python.f_locals
+            pc = variables.get('pc', 0)
+            if pc > 0:
+                # pc pointe déjà sur l'instruction suivante
+                return variables['code'].lignes[pc - 1] or None
+            return None
+        return super()._ligne_cadre(cadre_python)
+
+    def _appels_cadre(self, cadre_python):
+        if cadre_python.f_code is not _CODE_BOUCLE:
+            return ()
+        # pc de l'appelant : instruction suivant son APPELER
+        return [(nom_fonction, code.lignes[pc - 1] or None)
+                for code, pc, _, _, _, nom_fonction in reversed(cadre_python.f_locals['appels'])]
+
+_CODE_BOUCLE = MachineVirtuelleFIA._boucle.__code__
+
+
+# Sentinelle de fin d'itération (distincte de toute valeur F-IA)
+_FIN_ITERATION = object()
@@ -1,38 +1,45 @@
 # main.py
 import sys
+from profil_demarrage import profil
+
+# Le profil doit être installé avant les autres imports pour les mesurer
+if "--profil-demarrage" in sys.argv[1:]:
+    profil.demarrer()
+
 import os
+import argparse
 from pathlib import Path
-from lexer import LexerFIA
-from parser import ParserFIA
-from interpreter import VisiteurInterpretation
+from cache_ast import cache_ast
+from moteurs import MOTEURS, MOTEUR_PAR_DEFAUT, creer_interpreteur
 from errors import RuntimeError, LexerError, ParseError
-from repl import demarrer_repl
+from sortie import SortieFIA
+from budget import BudgetExecution
 
-def executer_fichier(chemin_fichier):
-    """Exécute un fichier F-IA"""
+def executer_fichier(chemin_fichier, moteur=MOTEUR_PAR_DEFAUT, budget=None, profiler=None):
+    """Exécute un fichier F-IA avec le moteur d'exécution choisi (et ses limites)
+    profiler : None ou {'sortie': fichier des piles repliées, 'intervalle': secondes, 'top': n}"""
     try:
         # Vérifier que le fichier existe
         if not Path(chemin_fichier).exists():
             print(f"❌ Erreur: Fichier '{chemin_fichier}' non trouvé")
             return 1
         
-        # Lire le contenu
-        with open(chemin_fichier, 'r', encoding='utf-8') as f:
-            contenu = f.read()
-        
-        # Lexer
-        lexer = LexerFIA(contenu)
-        tokens = lexer.tokeniser()
-        
-        # Parser
-        parser = ParserFIA(tokens)
-        ast = parser.analyser()
+        # Lexer + parser (ou AST relu depuis le cache .fiac)
+        with profil.phase("Analyse"):
+            ast = cache_ast.charger(chemin_fichier)
         
         # Interpréteur
-        interpreter = VisiteurInterpretation()
+        with profil.phase("Interpréteur"):
+            # Dans un terminal, chaque ligne s'affiche tout de suite ; sinon écritures par lots
+            sortie = SortieFIA(taille_lot=0) if sys.stdout.isatty() else None
+            interpreter = creer_interpreteur(moteur, sortie, budget)
         
         # Exécuter avec contexte de fichier
-        interpreter.executer(ast, chemin_fichier)
+        with profil.phase("Exécution"):
+            if profiler is None:
+                interpreter.executer(ast, chemin_fichier)
+            else:
+                executer_avec_profiler(interpreter, ast, chemin_fichier, profiler)
         
         return 0
         
@@ -49,6 +56,30 @@ def executer_fichier(chemin_fichier):
         print(f"❌ Erreur inattendue: {e}")
         return 1
 
+def afficher_bytecode(chemin_fichier):
+    """Affiche le bytecode de la machine virtuelle pour un fichier, sans l'exécuter"""
+    from machine_virtuelle import desassembler_programme
+    try:
+        print(desassembler_programme(cache_ast.charger(chemin_fichier)))
+        return 0
+    except (LexerError, ParseError) as e:
+        print(f"❌ Erreur d'analyse: {e}")
+        return 1
+
+def executer_avec_profiler(interpreter, ast, chemin_fichier, profiler):
+    """Exécute le programme sous le profileur, puis écrit les piles et le rapport"""
+    from profileur import ProfileurFIA
+    profileur = ProfileurFIA(interpreter, profiler['intervalle'])
+    try:
+        with profileur:
+            interpreter.executer(ast, chemin_fichier)
+    finally:
+        # Le profil reste utile si le programme échoue
+        profileur.ecrire_piles_repliees(profiler['sortie'])
+        print()
+        print(profileur.rapport(profiler['top']))
+        print(f"🔥 Piles repliées (flamegraph) : {profiler['sortie']}")
+
 def afficher_aide():
     """Affiche l'aide du programme"""
     print("🚀 F-IA - Langage de Programmation Français avec IA")
@@ -58,6 +89,21 @@ def afficher_aide():
     print("  python main.py <fichier.fia>      # Exécuter un fichier")
     print("  python main.py --aide             # Afficher cette aide")
     print()
+    print("Options:")
+    print(f"  --moteur=<nom>    Moteur d'exécution ({', '.join(MOTEURS)}, défaut: {MOTEUR_PAR_DEFAUT})")
+    print("  --no-cache        Ne pas utiliser le cache d'AST (.fiac)")
+    print("  --profil-demarrage Afficher le coût des imports et des phases du lancement")
+    print("  -O, --optimiser    Plier les constantes et supprimer les branches mortes avant l'exécution")
+    print("  --bytecode         Afficher le bytecode (programme et fonctions) sans exécuter")
+    print("  --profiler         Profiler le programme (piles repliées + rapport des fonctions et lignes)")
+    print("  --profiler-sortie=<f>   Fichier des piles repliées (défaut: <script>.folded)")
+    print("  --profiler-intervalle=<ms>  Intervalle d'échantillonnage (défaut: 5)")
+    print("  --profiler-top=<n>      Nombre de fonctions et de lignes du rapport (défaut: 15)")
+    print("  --max-instructions=<n>  Limite d'itérations de boucles et d'appels de fonctions")
+    print("  --delai-max=<s>         Durée maximale d'exécution en secondes")
+    print("  --max-profondeur=<n>    Profondeur maximale d'appels de fonctions")
+    print("  --max-elements=<n>      Taille maximale d'une liste ou d'un dictionnaire")
+    print()
     print("Exemples:")
     print("  python main.py exemples/test_modules.fia")
     print("  python main.py exemples/chatbot_simple.fia")
@@ -71,29 +117,81 @@ def afficher_aide():
     print()
     print("Documentation: https://github.com/Jimmyjoe13/f-ia-2")
 
+def analyser_arguments(argv):
+    """Analyse les arguments de la ligne de commande"""
+    analyseur = argparse.ArgumentParser(prog="main.py", add_help=False)
+    analyseur.add_argument("fichier", nargs="?")
+    analyseur.add_argument("--aide", "--help", "-h", action="store_true")
+    analyseur.add_argument("--moteur", choices=sorted(MOTEURS), default=MOTEUR_PAR_DEFAUT)
+    analyseur.add_argument("--no-cache", dest="cache", action="store_false")
+    analyseur.add_argument("--profil-demarrage", action="store_true")
+    analyseur.add_argument("-O", "--optimiser", action="store_true")
+    analyseur.add_argument("--bytecode", action="store_true")
+    # Profileur par échantillonnage du programme F-IA
+    analyseur.add_argument("--profiler", action="store_true")
+    analyseur.add_argument("--profiler-sortie")
+    analyseur.add_argument("--profiler-intervalle", type=float, default=5.0)
+    analyseur.add_argument("--profiler-top", type=int, default=15)
+    # Budget d'exécution (aucune limite par défaut)
+    analyseur.add_argument("--max-instructions", type=int)
+    analyseur.add_argument("--delai-max", type=float)
+    analyseur.add_argument("--max-profondeur", type=int)
+    analyseur.add_argument("--max-elements", type=int)
+    return analyseur.parse_args(argv)
+
 def main():
     """Point d'entrée principal"""
     print("🤖 F-IA v2.0 - Phase 3 ML native activée")
     
-    # Pas d'arguments = mode REPL
-    if len(sys.argv) == 1:
-        print("🔄 Démarrage du mode interactif...")
-        print("💡 Tapez 'aide()' pour l'aide ou Ctrl+C pour quitter")
-        demarrer_repl()
-        return 0
+    arguments = analyser_arguments(sys.argv[1:])
+    cache_ast.actif = arguments.cache
+    if arguments.optimiser:
+        from optimiseur import OptimiseurAST
+        cache_ast.optimiseur = OptimiseurAST()
     
     # Aide
-    if sys.argv[1] in ['--aide', '--help', '-h']:
+    if arguments.aide:
         afficher_aide()
         return 0
     
+    # Pas de fichier = mode REPL
+    if arguments.fichier is None:
+        print("🔄 Démarrage du mode interactif...")
+        print("💡 Tapez 'aide()' pour l'aide ou Ctrl+C pour quitter")
+        from repl import demarrer_repl
+        demarrer_repl()
+        return 0
+    
     # Exécution de fichier
-    fichier = sys.argv[1]
+    fichier = arguments.fichier
     if not fichier.endswith('.fia'):
         print("⚠️  Attention: Les fichiers F-IA ont généralement l'extension .fia")
     
+    if arguments.bytecode:
+        return afficher_bytecode(fichier)
+
     print(f"📂 Exécution du fichier: {fichier}")
-    return executer_fichier(fichier)
+    budget = BudgetExecution(
+        max_instructions=arguments.max_instructions,
+        delai=arguments.delai_max,
+        max_profondeur=arguments.max_profondeur,
+        max_elements=arguments.max_elements,
+    )
+    profiler = None
+    if arguments.profiler:
+        profiler = {
+            'sortie': arguments.profiler_sortie or Path(fichier).stem + ".folded",
+            'intervalle': arguments.profiler_intervalle / 1000,
+            'top': arguments.profiler_top,
+        }
+    code_sortie = executer_fichier(fichier, arguments.moteur, budget, profiler)
+    if cache_ast.optimiseur is not None:
+        print()
+        print(cache_ast.optimiseur.rapport())
+    if arguments.profil_demarrage:
+        print()
+        print(profil.rapport())
+    return code_sortie
 
 if __name__ == "__main__":
     try:
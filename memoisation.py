@@ -0,0 +1,127 @@
+# memoisation.py
+"""
+Mémoïsation des fonctions F-IA pures.
+
+`memoiser("nom", taille_max)` remplace la fonction définie `nom` de
+l'interpréteur par une `FonctionMemoisee` : un cache LRU (au plus
+`taille_max` résultats, 128 par défaut) indexé par un instantané hachable
+des arguments. Les listes et dictionnaires passés en argument sont
+comparés par contenu, au moment de l'appel ; `1`, `1.0` et `vrai` sont
+des arguments distincts.
+
+Redéfinir la fonction (`fonction nom(...)`) retire le cache. Un résultat
+mis en cache est retourné tel quel à chaque appel : les fonctions
+mémoïsées ne doivent pas avoir d'effet de bord, et leurs résultats
+(listes, dictionnaires) ne doivent pas être modifiés par l'appelant.
+
+`statistiques_memo("nom")` retourne {"succes", "echecs", "taille",
+"taille_max"} ; `vider_memo("nom")` vide le cache et remet les compteurs
+à zéro.
+"""
+from collections import OrderedDict
+from errors import RuntimeError
+
+TAILLE_MAX_DEFAUT = 128
+
+# Arguments dont l'instantané n'est pas hachable (objets des backends Python)
+_NON_MEMOISABLE = object()
+
+
+def _instantane(valeur):
+    """Clé hachable décrivant le contenu d'une valeur F-IA"""
+    if isinstance(valeur, list):
+        return (list, tuple(_instantane(element) for element in valeur))
+    if isinstance(valeur, dict):
+        return (dict, frozenset((cle, _instantane(v)) for cle, v in valeur.items()))
+    hash(valeur)
+    return (type(valeur), valeur)
+
+
+def cle_arguments(args):
+    """Instantané des arguments d'un appel, ou _NON_MEMOISABLE"""
+    try:
+        return tuple(_instantane(argument) for argument in args)
+    except (TypeError, RecursionError):
+        return _NON_MEMOISABLE
+
+
+class FonctionMemoisee:
+    """Fonction définie dont les résultats sont gardés dans un cache LRU"""
+    __slots__ = ('interpreteur', 'nom', 'definition', 'taille_max', 'resultats', 'succes', 'echecs')
+
+    def __init__(self, interpreteur, nom, definition, taille_max=TAILLE_MAX_DEFAUT):
+        self.interpreteur = interpreteur
+        self.nom = nom
+        # {'params', 'corps', 'locaux'} de la fonction d'origine
+        self.definition = definition
+        self.taille_max = taille_max
+        self.resultats = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+
+    def __call__(self, *args):
+        cle = cle_arguments(args)
+        if cle is not _NON_MEMOISABLE:
+            resultats = self.resultats
+            if cle in resultats:
+                self.succes += 1
+                resultats.move_to_end(cle)
+                return resultats[cle]
+        self.echecs += 1
+        resultat = self.interpreteur._appeler_fonction_definie(self.nom, self.definition, list(args))
+        if cle is not _NON_MEMOISABLE:
+            self.resultats[cle] = resultat
+            if len(self.resultats) > self.taille_max:
+                self.resultats.popitem(last=False)
+        return resultat
+
+    def vider(self):
+        self.resultats.clear()
+        self.succes = self.echecs = 0
+
+    def statistiques(self):
+        return {"succes": self.succes, "echecs": self.echecs,
+                "taille": len(self.resultats), "taille_max": self.taille_max}
+
+    def __repr__(self):
+        return f"<fonction mémoïsée {self.nom}>"
+
+
+def fonctions_memoisation(interpreteur):
+    """Fonctions intégrées de mémoïsation liées aux fonctions définies d'un interpréteur"""
+    fonctions = interpreteur.fonctions_definies
+
+    def fonction_memoisee(nom_fonction, builtin):
+        fonction = fonctions.get(nom_fonction)
+        if not isinstance(fonction, FonctionMemoisee):
+            raise RuntimeError(f"Erreur d'exécution: '{builtin}' attend le nom d'une fonction mémoïsée")
+        return fonction
+
+    def memoiser(nom_fonction, taille_max=TAILLE_MAX_DEFAUT):
+        if not isinstance(taille_max, int) or isinstance(taille_max, bool) or taille_max < 1:
+            raise RuntimeError("Erreur d'exécution: 'memoiser' attend une taille maximale entière positive")
+        fonction = fonctions.get(nom_fonction)
+        if isinstance(fonction, FonctionMemoisee):
+            fonction.taille_max = taille_max
+            while len(fonction.resultats) > taille_max:
+                fonction.resultats.popitem(last=False)
+            return nom_fonction
+        if not isinstance(fonction, dict):
+            raise RuntimeError(f"Erreur d'exécution: 'memoiser' attend le nom d'une fonction définie, "
+                               f"'{nom_fonction}' n'en est pas une")
+        # Remplacer l'entrée invalide les caches en ligne des appels déjà résolus
+        fonctions[nom_fonction] = FonctionMemoisee(interpreteur, nom_fonction, fonction, taille_max)
+        return nom_fonction
+
+    def statistiques_memo(nom_fonction):
+        return fonction_memoisee(nom_fonction, 'statistiques_memo').statistiques()
+
+    def vider_memo(nom_fonction):
+        fonction_memoisee(nom_fonction, 'vider_memo').vider()
+        return nom_fonction
+
+    return {
+        "memoiser": memoiser,
+        "statistiques_memo": statistiques_memo,
+        "vider_memo": vider_memo,
+    }
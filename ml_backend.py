@@ -12,6 +12,7 @@ from sklearn.metrics import accuracy_score, precision_recall_fscore_support, con
 import json
 import os
 from errors import RuntimeError
+from sortie import afficher
 
 # ===== NOUVELLE SECTION : WEB SCRAPING =====
 def faire_requete_web(url):
@@ -28,11 +29,11 @@ def faire_requete_web(url):
             'Upgrade-Insecure-Requests': '1'
         }
         
-        print(f"🌐 [WEB] Requête HTTP vers: {url}")
+        afficher(f"🌐 [WEB] Requête HTTP vers: {url}")
         response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
         
-        print(f"✅ [WEB] Requête réussie - Status: {response.status_code}")
-        print(f"📏 [WEB] Taille HTML: {len(response.text)} caractères")
+        afficher(f"✅ [WEB] Requête réussie - Status: {response.status_code}")
+        afficher(f"📏 [WEB] Taille HTML: {len(response.text)} caractères")
         
         return {
             "html": response.text,
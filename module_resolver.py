@@ -5,6 +5,17 @@ from pathlib import Path
 from typing import Dict, List, Optional, Set
 from errors import RuntimeError
 
+class ModuleFIA:
+    """Module F-IA exécuté : son interpréteur et l'espace de noms qu'il exporte"""
+    __slots__ = ('chemin', 'interpreteur', 'espace')
+
+    def __init__(self, chemin, interpreteur, espace):
+        self.chemin = chemin
+        # Interpréteur qui a exécuté le corps du module (globales, fonctions)
+        self.interpreteur = interpreteur
+        # {nom: valeur ou fonction appelable}, partagé par tous les importeurs
+        self.espace = espace
+
 class ModuleResolver:
     """Gestionnaire de résolution et cache des modules F-IA"""
     
@@ -12,12 +23,18 @@ class ModuleResolver:
         # Cache des modules déjà chargés {chemin_absolu: ast_module}
         self.cache_modules: Dict[str, any] = {}
         
-        # Cache des contextes d'exécution {chemin_absolu: contexte}
-        self.cache_contextes: Dict[str, dict] = {}
+        # Modules déjà exécutés {chemin_absolu: ModuleFIA}
+        self.cache_contextes: Dict[str, ModuleFIA] = {}
+        
+        # Chemins déjà résolus {(nom_module, répertoire de l'import relatif): Path}
+        self.cache_chemins: Dict[tuple, Path] = {}
         
         # Stack des modules en cours de chargement (détection cycles)
         self.stack_chargement: Set[str] = set()
         
+        # Modules dont le corps est en cours d'exécution, dans l'ordre des imports
+        self.pile_execution: List[str] = []
+        
         # Chemins de recherche des modules
         self.chemins_recherche: List[Path] = []
         self._initialiser_chemins()
@@ -91,7 +108,8 @@ class ModuleResolver:
             fichier_courant: Fichier qui demande le chargement
         
         Returns:
-            (ast_module, contexte_execution)
+            (ast_module, module) où module est le ModuleFIA déjà exécuté,
+            ou None si le corps du module n'a pas encore été exécuté
         
         Raises:
             RuntimeError: Si module non trouvé ou dépendance circulaire
@@ -118,7 +136,7 @@ class ModuleResolver:
         
         # 2. Vérifier le cache
         if chemin_str in self.cache_modules:
-            return self.cache_modules[chemin_str], self.cache_contextes[chemin_str]
+            return self.cache_modules[chemin_str], self.cache_contextes.get(chemin_str)
         
         # 3. Détecter les dépendances circulaires
         if chemin_str in self.stack_chargement:
@@ -129,24 +147,14 @@ class ModuleResolver:
         try:
             self.stack_chargement.add(chemin_str)
             
-            # Lire le contenu
-            with open(chemin_module, 'r', encoding='utf-8') as f:
-                contenu = f.read()
-            
-            # Parser le module (imports nécessaires)
-            from lexer import LexerFIA
-            from parser import ParserFIA
-            
-            lexer = LexerFIA(contenu)
-            tokens = lexer.tokeniser()
-            parser = ParserFIA(tokens)
-            ast_module = parser.analyser()
+            # Parser le module (ou le relire depuis le cache .fiac)
+            from cache_ast import cache_ast
+            ast_module = cache_ast.charger(chemin_module)
             
             # Mettre en cache
             self.cache_modules[chemin_str] = ast_module
-            self.cache_contextes[chemin_str] = {}  # Contexte vide initialement
             
-            return ast_module, self.cache_contextes[chemin_str]
+            return ast_module, None
             
         except Exception as e:
             raise RuntimeError(f"Erreur lors du chargement du module '{nom_module}': {e}")
@@ -154,6 +162,49 @@ class ModuleResolver:
             # Retirer de la pile de chargement
             self.stack_chargement.discard(chemin_str)
     
+    def importer_module(self, nom_module: str, fichier_courant: Optional[str], executer) -> ModuleFIA:
+        """
+        Retourne le module importé, en n'exécutant son corps qu'une fois par processus
+        
+        Args:
+            nom_module: Nom du module à importer
+            fichier_courant: Fichier qui fait l'import
+            executer: executer(ast_module, chemin_module) -> ModuleFIA, appelé
+                seulement au premier import du module
+        
+        Raises:
+            RuntimeError: Si module non trouvé ou import circulaire
+        """
+        # Imports suivants : deux accès dictionnaire, sans toucher au disque
+        cle = (nom_module, str(Path(fichier_courant).parent)
+               if fichier_courant and nom_module.startswith('./') else None)
+        chemin_module = self.cache_chemins.get(cle)
+        if chemin_module is not None:
+            module = self.cache_contextes.get(str(chemin_module))
+            if module is not None:
+                return module
+        
+        ast_module, module = self.charger_module(nom_module, fichier_courant)
+        chemin_module = self.resoudre_chemin(nom_module, fichier_courant)
+        chemin_str = str(chemin_module)
+        self.cache_chemins[cle] = chemin_module
+        if module is not None:
+            return module
+        
+        if chemin_str in self.pile_execution:
+            cycle = " → ".join(self.pile_execution[self.pile_execution.index(chemin_str):])
+            raise RuntimeError(f"Dépendance circulaire détectée : {cycle} → {nom_module}")
+        
+        self.pile_execution.append(chemin_str)
+        try:
+            module = executer(ast_module, chemin_str)
+        finally:
+            self.pile_execution.pop()
+        
+        # Un module dont l'exécution échoue n'est pas mis en cache
+        self.cache_contextes[chemin_str] = module
+        return module
+    
     def obtenir_chemin_module(self, nom_module: str, fichier_courant: Optional[str] = None) -> str:
         """Obtient le chemin absolu d'un module (pour le cache)"""
         chemin = self.resoudre_chemin(nom_module, fichier_courant)
@@ -163,6 +214,11 @@ class ModuleResolver:
         """Vide le cache des modules (utile pour le développement/tests)"""
         self.cache_modules.clear()
         self.cache_contextes.clear()
+        self.cache_chemins.clear()
+    
+    def vider_modules_executes(self):
+        """Oublie les modules exécutés (leur état) mais garde les AST analysés"""
+        self.cache_contextes.clear()
     
     def lister_modules_charges(self) -> List[str]:
         """Liste les modules actuellement en cache"""
@@ -0,0 +1,33 @@
+# moteurs.py
+"""
+Sélection du moteur d'exécution F-IA.
+
+- arbre    : interpréteur visiteur historique (VisiteurInterpretation)
+- closures : AST compilé une fois en closures Python (InterpreteurClosures)
+- vm       : bytecode compact exécuté par une machine à pile (MachineVirtuelleFIA)
+
+Le module d'un moteur n'est importé que lorsqu'il est choisi.
+"""
+import importlib
+from errors import RuntimeError
+
+# {nom: (module, classe)}
+MOTEURS = {
+    'arbre': ('interpreter', 'VisiteurInterpretation'),
+    'closures': ('compilateur_closures', 'InterpreteurClosures'),
+    'vm': ('machine_virtuelle', 'MachineVirtuelleFIA'),
+}
+
+MOTEUR_PAR_DEFAUT = 'arbre'
+
+def creer_interpreteur(moteur=MOTEUR_PAR_DEFAUT, sortie=None, budget=None):
+    """Crée un interpréteur pour le moteur demandé
+    (sortie : SortieFIA, sys.stdout par défaut ; budget : BudgetExecution, sans limite par défaut)"""
+    if moteur not in MOTEURS:
+        raise RuntimeError(f"Moteur d'exécution inconnu '{moteur}'. Moteurs disponibles: {', '.join(MOTEURS)}")
+    return classe_moteur(moteur)(sortie, budget)
+
+def classe_moteur(moteur):
+    """Importe et retourne la classe d'interpréteur d'un moteur"""
+    module, classe = MOTEURS[moteur]
+    return getattr(importlib.import_module(module), classe)
@@ -0,0 +1,106 @@
+# operateurs.py
+"""
+Sémantique des opérateurs F-IA partagée par les moteurs d'exécution.
+
+Les opérandes chaînes qui ressemblent à des nombres sont converties avant
+les opérations arithmétiques et les comparaisons ; '+' concatène dès qu'un
+des deux côtés est une chaîne.
+"""
+import operator
+
+from errors import RuntimeError
+
+def convertir_si_nombre(valeur):
+    """Convertit une valeur en nombre si possible"""
+    if isinstance(valeur, str):
+        if valeur.replace('.', '').replace('-', '').isdigit():
+            return float(valeur) if '.' in valeur else int(valeur)
+    return valeur
+
+def et_logique(gauche, droite):
+    return gauche and droite
+
+def ou_logique(gauche, droite):
+    return gauche or droite
+
+# Opérateurs binaires après conversion numérique des opérandes ('+' et '/' sont traités à part)
+OPERATEURS_BINAIRES = {
+    '-': operator.sub,
+    '*': operator.mul,
+    '%': operator.mod,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'et': et_logique,
+    'ou': ou_logique,
+}
+
+def additionner(gauche, droite):
+    if isinstance(gauche, str) or isinstance(droite, str):
+        return str(gauche) + str(droite)
+    return convertir_si_nombre(gauche) + convertir_si_nombre(droite)
+
+def diviser(gauche, droite):
+    gauche = convertir_si_nombre(gauche)
+    droite = convertir_si_nombre(droite)
+    if droite == 0:
+        raise RuntimeError("Division par zéro")
+    return gauche / droite
+
+def _avec_conversion(fonction_op):
+    def operation(gauche, droite):
+        return fonction_op(convertir_si_nombre(gauche), convertir_si_nombre(droite))
+    return operation
+
+# Sémantique complète de chaque opérateur binaire {symbole: fonction(gauche, droite)}
+FONCTIONS_BINAIRES = {'+': additionner, '/': diviser}
+FONCTIONS_BINAIRES.update({op: _avec_conversion(f) for op, f in OPERATEURS_BINAIRES.items()})
+
+# Opérateurs binaires numérotés : ExpressionBinaire.code_operateur, argument de BINAIRE (VM)
+SYMBOLES_BINAIRES = tuple(FONCTIONS_BINAIRES)
+CODES_BINAIRES = {op: code for code, op in enumerate(SYMBOLES_BINAIRES)}
+OPERATIONS_BINAIRES = tuple(FONCTIONS_BINAIRES[op] for op in SYMBOLES_BINAIRES)
+
+def diviser_nombres(gauche, droite):
+    if droite == 0:
+        raise RuntimeError("Division par zéro")
+    return gauche / droite
+
+def concatener(gauche, droite):
+    return str(gauche) + str(droite)
+
+# Même sémantique que OPERATIONS_BINAIRES quand aucun opérande n'est une chaîne
+# (convertir_si_nombre ne change que les chaînes)
+OPERATIONS_NATIVES = tuple(
+    operator.add if op == '+' else diviser_nombres if op == '/' else OPERATEURS_BINAIRES[op]
+    for op in SYMBOLES_BINAIRES
+)
+CODE_ADDITION = CODES_BINAIRES['+']
+
+def operation_specialisee(code, type_gauche, type_droite):
+    """Opération sans conversion, valable pour tous les opérandes de ces types, ou None.
+    Une chaîne se convertit selon son contenu : avec une chaîne, seul '+' se spécialise."""
+    if issubclass(type_gauche, str) or issubclass(type_droite, str):
+        if code != CODE_ADDITION:
+            return None
+        return operator.add if type_gauche is str and type_droite is str else concatener
+    return OPERATIONS_NATIVES[code]
+
+def _diviser_compose(actuelle, nouvelle):
+    actuelle = convertir_si_nombre(actuelle)
+    nouvelle = convertir_si_nombre(nouvelle)
+    if nouvelle == 0:
+        raise RuntimeError("Division par zéro dans assignation composée")
+    return actuelle / nouvelle
+
+# Sémantique des assignations composées {symbole: fonction(actuelle, nouvelle)}
+FONCTIONS_COMPOSEES = {
+    '+=': additionner,
+    '-=': FONCTIONS_BINAIRES['-'],
+    '*=': FONCTIONS_BINAIRES['*'],
+    '/=': _diviser_compose,
+    '%=': FONCTIONS_BINAIRES['%'],
+}
@@ -0,0 +1,226 @@
+# optimiseur.py
+"""
+Optimiseur d'AST F-IA (`python main.py -O fichier.fia`).
+
+Passage facultatif entre l'analyse (ou la relecture du cache .fiac) et
+l'exécution, qui réécrit l'AST sur place :
+  - pliage des constantes : opérations arithmétiques, comparaisons et
+    concaténations entre littéraux (`2 * 3` -> `6`, `-5` -> `Littéral(-5)`),
+    avec la sémantique de operateurs.py ; une opération qui échouerait
+    (division par zéro...) est laissée telle quelle pour l'exécution ;
+  - élimination des branches mortes : `si` à condition constante remplacé par
+    le bloc retenu (les blocs ne créent pas de portée), `tant_que (faux)`
+    supprimé ;
+  - listes et dictionnaires littéraux constants figés en un seul objet là où
+    ils ne peuvent pas être modifiés (itérable d'un `pour ... dans`, lecture
+    par index) au lieu d'être reconstruits à chaque évaluation.
+
+Les appels de fonctions ne sont jamais évalués ; `et`/`ou` sont pliés quand leurs
+deux côtés sont constants, ou quand le côté gauche constant décide du résultat
+(le côté droit n'aurait pas été évalué) : aucun effet de bord n'est supprimé.
+L'AST en cache reste celui du parser.
+"""
+from fia_ast import *
+from operateurs import FONCTIONS_BINAIRES, convertir_si_nombre
+
+# Valeurs qu'un Littéral peut porter après pliage
+TYPES_SCALAIRES = (int, float, str, bool, type(None))
+
+def compter_noeuds(noeud):
+    """Nombre de nœuds de l'arbre (champs déclarés dans les __slots__ des nœuds)"""
+    total = 0
+    a_visiter = [noeud]
+    while a_visiter:
+        courant = a_visiter.pop()
+        if isinstance(courant, Noeud):
+            total += 1
+            for champ in type(courant).__slots__:
+                a_visiter.append(getattr(courant, champ, None))
+        elif isinstance(courant, list):
+            a_visiter.extend(courant)
+        elif isinstance(courant, dict):
+            a_visiter.extend(courant.values())
+    return total
+
+def _est_constante(noeud):
+    return isinstance(noeud, Littéral) and isinstance(noeud.valeur, TYPES_SCALAIRES)
+
+class OptimiseurAST:
+    """Plie les constantes et élimine les branches mortes ; les compteurs
+    s'accumulent sur tous les programmes et modules optimisés"""
+
+    def __init__(self):
+        self.noeuds_elimines = 0
+        self.expressions_pliees = 0
+        self.branches_eliminees = 0
+        self.collections_figees = 0
+
+    def optimiser(self, programme):
+        """Optimise un Programme sur place et le retourne"""
+        avant = compter_noeuds(programme)
+        programme.instructions = self._instructions(programme.instructions)
+        self.noeuds_elimines += avant - compter_noeuds(programme)
+        return programme
+
+    def rapport(self):
+        return (f"⚡ Optimiseur : {self.noeuds_elimines} nœuds éliminés "
+                f"({self.expressions_pliees} expressions pliées, {self.branches_eliminees} branches supprimées, "
+                f"{self.collections_figees} collections figées)")
+
+    # === INSTRUCTIONS ===
+
+    def _instructions(self, instructions):
+        resultat = []
+        for instruction in instructions:
+            resultat.extend(self._instruction(instruction))
+        return resultat
+
+    def _sous_bloc(self, noeud):
+        """Corps d'une structure de contrôle : reste un seul nœud"""
+        if isinstance(noeud, Bloc):
+            noeud.instructions = self._instructions(noeud.instructions)
+            return noeud
+        instructions = self._instruction(noeud)
+        if len(instructions) == 1:
+            return instructions[0]
+        return _placer(Bloc(instructions), noeud)
+
+    def _instruction(self, noeud):
+        """Liste (éventuellement vide) des instructions qui remplacent `noeud`"""
+        if isinstance(noeud, Condition):
+            condition = self._expression(noeud.condition)
+            if isinstance(condition, Littéral):
+                self.branches_eliminees += 1
+                retenu = noeud.bloc_si if condition.valeur else noeud.bloc_sinon
+                if retenu is None:
+                    return []
+                if isinstance(retenu, Bloc):
+                    return self._instructions(retenu.instructions)
+                return self._instruction(retenu)
+            noeud.condition = condition
+            noeud.bloc_si = self._sous_bloc(noeud.bloc_si)
+            if noeud.bloc_sinon:
+                noeud.bloc_sinon = self._sous_bloc(noeud.bloc_sinon)
+        elif isinstance(noeud, BoucleTantQue):
+            noeud.condition = self._expression(noeud.condition)
+            if isinstance(noeud.condition, Littéral) and not noeud.condition.valeur:
+                self.branches_eliminees += 1
+                return []
+            noeud.corps = self._sous_bloc(noeud.corps)
+        elif isinstance(noeud, BouclePour):
+            noeud.init = self._sous_bloc(noeud.init)
+            noeud.condition = self._expression(noeud.condition)
+            if isinstance(noeud.condition, Littéral) and not noeud.condition.valeur:
+                self.branches_eliminees += 1
+                return [noeud.init]
+            noeud.increment = self._sous_bloc(noeud.increment)
+            noeud.corps = self._sous_bloc(noeud.corps)
+        elif isinstance(noeud, BouclePourDans):
+            noeud.iterable = self._figer(self._expression(noeud.iterable))
+            noeud.corps = self._sous_bloc(noeud.corps)
+        elif isinstance(noeud, Fonction):
+            noeud.corps = self._sous_bloc(noeud.corps)
+        elif isinstance(noeud, Bloc):
+            noeud.instructions = self._instructions(noeud.instructions)
+        elif isinstance(noeud, DeclarationVariable):
+            if noeud.valeur:
+                noeud.valeur = self._expression(noeud.valeur)
+        elif isinstance(noeud, (Assignation, AssignationComposee)):
+            noeud.cible = self._cible(noeud.cible)
+            noeud.valeur = self._expression(noeud.valeur)
+        elif isinstance(noeud, Retour):
+            if noeud.valeur is not None:
+                noeud.valeur = self._expression(noeud.valeur)
+        elif isinstance(noeud, ExpressionStatement):
+            noeud.expression = self._expression(noeud.expression)
+        elif isinstance(noeud, (ImportModule, ImportDepuis)):
+            pass
+        elif isinstance(noeud, Noeud):
+            noeud = self._expression(noeud)
+        return [noeud]
+
+    def _cible(self, cible):
+        """Cible d'une assignation : sa base est modifiée, elle n'est jamais figée"""
+        if isinstance(cible, AccesIndex):
+            cible.base = self._expression(cible.base)
+            cible.index = self._expression(cible.index)
+        elif isinstance(cible, AccesDictionnaire):
+            cible.base = self._expression(cible.base)
+            cible.cle = self._expression(cible.cle)
+        return cible
+
+    # === EXPRESSIONS ===
+
+    def _expression(self, noeud):
+        if isinstance(noeud, ExpressionBinaire):
+            noeud.gauche = self._expression(noeud.gauche)
+            noeud.droite = self._expression(noeud.droite)
+            if _est_constante(noeud.gauche) and _est_constante(noeud.droite):
+                return self._plier_binaire(noeud)
+            if isinstance(noeud, ExpressionLogique) and _est_constante(noeud.gauche):
+                valeur = convertir_si_nombre(noeud.gauche.valeur)
+                if (noeud.operateur == 'et') != bool(valeur):
+                    # `faux et ...`, `vrai ou ...` : court-circuit
+                    self.expressions_pliees += 1
+                    return _placer(Littéral(valeur), noeud)
+        elif isinstance(noeud, ExpressionUnaire):
+            noeud.operande = self._expression(noeud.operande)
+            if _est_constante(noeud.operande) and noeud.operateur in ('-', '+'):
+                valeur = convertir_si_nombre(noeud.operande.valeur)
+                if isinstance(valeur, (int, float)) and not isinstance(valeur, bool):
+                    self.expressions_pliees += 1
+                    return _placer(Littéral(-valeur if noeud.operateur == '-' else valeur), noeud)
+        elif isinstance(noeud, AppelFonction):
+            if isinstance(noeud.nom_fonction, Noeud):
+                noeud.nom_fonction = self._expression(noeud.nom_fonction)
+            noeud.arguments = [self._expression(argument) for argument in noeud.arguments]
+        elif isinstance(noeud, AccesAttribut):
+            noeud.objet = self._expression(noeud.objet)
+        elif isinstance(noeud, AccesIndex):
+            noeud.base = self._figer(self._expression(noeud.base))
+            noeud.index = self._expression(noeud.index)
+        elif isinstance(noeud, AccesDictionnaire):
+            noeud.base = self._figer(self._expression(noeud.base))
+            noeud.cle = self._expression(noeud.cle)
+        elif isinstance(noeud, ListeLitterale):
+            noeud.elements = [self._expression(element) for element in noeud.elements]
+        elif isinstance(noeud, DictionnaireLitteral):
+            noeud.elements = {cle: self._expression(valeur) for cle, valeur in noeud.elements.items()}
+        return noeud
+
+    def _plier_binaire(self, noeud):
+        operation = FONCTIONS_BINAIRES.get(noeud.operateur)
+        gauche, droite = noeud.gauche.valeur, noeud.droite.valeur
+        if operation is None:
+            return noeud
+        if noeud.operateur == '*' and (isinstance(convertir_si_nombre(gauche), str)
+                                       or isinstance(convertir_si_nombre(droite), str)):
+            # Répétition de chaîne : le résultat peut être arbitrairement grand
+            return noeud
+        try:
+            valeur = operation(gauche, droite)
+        except Exception:
+            # Erreur signalée à l'exécution, à la bonne ligne
+            return noeud
+        if not isinstance(valeur, TYPES_SCALAIRES):
+            return noeud
+        self.expressions_pliees += 1
+        return _placer(Littéral(valeur), noeud)
+
+    def _figer(self, noeud):
+        """Liste ou dictionnaire littéral de constantes -> Littéral partagé
+        (uniquement là où la valeur ne peut pas être modifiée)"""
+        if isinstance(noeud, ListeLitterale) and all(map(_est_constante, noeud.elements)):
+            valeur = [element.valeur for element in noeud.elements]
+        elif isinstance(noeud, DictionnaireLitteral) and all(map(_est_constante, noeud.elements.values())):
+            valeur = {cle: element.valeur for cle, element in noeud.elements.items()}
+        else:
+            return noeud
+        self.collections_figees += 1
+        return _placer(Littéral(valeur), noeud)
+
+def _placer(noeud, origine):
+    """Le nœud de remplacement garde la position source du nœud d'origine"""
+    if hasattr(origine, 'position'):
+        noeud.position = origine.position
+    return noeud
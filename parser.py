@@ -1,44 +1,91 @@
 # parser.py
-from lexer import Token
+from lexer import Token, TamponTokens, TYPES_TOKENS
 from fia_ast import *
 from errors import ParseError
+from resolveur import resoudre_portees
 
 class ParserFIA:
     def __init__(self, tokens):
+        # Accepte une liste de Token ou directement un TamponTokens
+        if not isinstance(tokens, TamponTokens):
+            tokens = TamponTokens.depuis_tokens(tokens)
         self.tokens = tokens
+        self._types = tokens.types
+        self._valeurs = tokens.valeurs
+        self._nb_tokens = len(tokens)
         self.position = 0
         self.ligne_courante = 0
+        # Position compactée de chaque token (0 pour la fin du flux)
+        self._positions = tokens.positions_compactees(BITS_COLONNE)
 
     def analyser(self):
         instructions = []
-        while not self.est_a_la_fin() and not self.regarder_token().type == 'EOF':
+        while not self.est_a_la_fin() and not self.regarder_type() == 'EOF':
             instruction = self.analyser_instruction()
             if instruction:
                 instructions.append(instruction)
-        return Programme(instructions)
+        return resoudre_portees(self._placer(Programme(instructions), 0))
+
+    def _placer(self, noeud, index):
+        """Attache au nœud la position compactée du token `index` et le retourne"""
+        noeud.position = self._positions[index]
+        return noeud
 
     def est_a_la_fin(self):
-        return self.position >= len(self.tokens)
+        return self.position >= self._nb_tokens
+
+    def regarder_type(self):
+        """Type du token courant, lu dans la colonne des types (sans créer de Token)"""
+        try:
+            return TYPES_TOKENS[self._types[self.position]]
+        except IndexError:
+            return 'EOF'
 
     def regarder_token(self):
         if self.est_a_la_fin():
             return Token('EOF', '', 0, 0)
-        return self.tokens[self.position]
+        return self.tokens.token(self.position)
 
     def consommer_token(self, type_attendu=None):
+        if type_attendu and self.regarder_type() != type_attendu:
+            self._erreur_attendu(type_attendu)
         token = self.regarder_token()
-        if type_attendu and token.type != type_attendu:
-            raise ParseError(
-                f"Attendu '{type_attendu}', trouvé '{token.type}' ('{token.valeur}')",
-                ligne=token.ligne,
-                colonne=token.colonne
-            )
         self.position += 1
         return token
 
-    def analyser_instruction(self):
+    def passer_token(self, type_attendu=None):
+        """Consomme le token courant sans créer d'objet Token"""
+        if type_attendu and self.regarder_type() != type_attendu:
+            self._erreur_attendu(type_attendu)
+        self.position += 1
+
+    def consommer_valeur(self, type_attendu=None):
+        """Consomme le token courant et retourne seulement sa valeur (sans créer de Token)"""
+        if type_attendu and self.regarder_type() != type_attendu:
+            self._erreur_attendu(type_attendu)
+        position = self.position
+        self.position += 1
+        if position >= self._nb_tokens:
+            return ''
+        return self._valeurs[position]
+
+    def _erreur_attendu(self, type_attendu):
         token = self.regarder_token()
-        
+        raise ParseError(
+            f"Attendu '{type_attendu}', trouvé '{token.type}' ('{token.valeur}')",
+            ligne=token.ligne,
+            colonne=token.colonne
+        )
+
+    def analyser_instruction(self):
+        debut = self.position
+        instruction = self._analyser_instruction(self.regarder_token())
+        if instruction is not None:
+            # Une instruction commence à son premier token
+            self._placer(instruction, debut)
+        return instruction
+
+    def _analyser_instruction(self, token):
         # === NOUVELLES INSTRUCTIONS D'IMPORT ===
         if token.type == 'IMPORTER':
             return self.analyser_import_module()
@@ -63,8 +110,8 @@ class ParserFIA:
         else:
             # Pour les expressions qui ne commencent pas par un identifiant
             expr = self.analyser_expression()
-            if self.regarder_token().type == 'POINT_VIRGULE':
-                self.consommer_token('POINT_VIRGULE')
+            if self.regarder_type() == 'POINT_VIRGULE':
+                self.passer_token('POINT_VIRGULE')
             return ExpressionStatement(expr)
 
     # === NOUVELLES MÉTHODES POUR LES IMPORTS ===
@@ -73,7 +120,7 @@ class ParserFIA:
         """
         Analyse : importer "chemin/module.fia" [comme alias]
         """
-        self.consommer_token('IMPORTER')
+        self.passer_token('IMPORTER')
         
         # Récupérer le chemin du module (chaîne)
         token_chemin = self.consommer_token('CHAINE')
@@ -81,14 +128,14 @@ class ParserFIA:
         
         # Vérifier s'il y a un alias
         alias = None
-        if self.regarder_token().type == 'COMME':
-            self.consommer_token('COMME')
+        if self.regarder_type() == 'COMME':
+            self.passer_token('COMME')
             token_alias = self.consommer_token('IDENTIFIANT')
             alias = token_alias.valeur
         
         # Point-virgule optionnel
-        if self.regarder_token().type == 'POINT_VIRGULE':
-            self.consommer_token('POINT_VIRGULE')
+        if self.regarder_type() == 'POINT_VIRGULE':
+            self.passer_token('POINT_VIRGULE')
         
         return ImportModule(chemin_module, alias)
 
@@ -96,43 +143,43 @@ class ParserFIA:
         """
         Analyse : depuis "module.fia" importer element1 [comme alias1], element2 [comme alias2]
         """
-        self.consommer_token('DEPUIS')
+        self.passer_token('DEPUIS')
         
         # Récupérer le chemin du module
         token_chemin = self.consommer_token('CHAINE')
         chemin_module = token_chemin.valeur
         
-        self.consommer_token('IMPORTER')
+        self.passer_token('IMPORTER')
         
         # Liste des éléments à importer
         elements_importes = []
         
         # Premier élément
-        nom_element = self.consommer_token('IDENTIFIANT').valeur
+        nom_element = self.consommer_valeur('IDENTIFIANT')
         alias_element = nom_element  # Par défaut, alias = nom
         
-        if self.regarder_token().type == 'COMME':
-            self.consommer_token('COMME')
-            alias_element = self.consommer_token('IDENTIFIANT').valeur
+        if self.regarder_type() == 'COMME':
+            self.passer_token('COMME')
+            alias_element = self.consommer_valeur('IDENTIFIANT')
         
         elements_importes.append((nom_element, alias_element))
         
         # Éléments supplémentaires
-        while self.regarder_token().type == 'VIRGULE':
-            self.consommer_token('VIRGULE')
+        while self.regarder_type() == 'VIRGULE':
+            self.passer_token('VIRGULE')
             
-            nom_element = self.consommer_token('IDENTIFIANT').valeur
+            nom_element = self.consommer_valeur('IDENTIFIANT')
             alias_element = nom_element
             
-            if self.regarder_token().type == 'COMME':
-                self.consommer_token('COMME')
-                alias_element = self.consommer_token('IDENTIFIANT').valeur
+            if self.regarder_type() == 'COMME':
+                self.passer_token('COMME')
+                alias_element = self.consommer_valeur('IDENTIFIANT')
             
             elements_importes.append((nom_element, alias_element))
         
         # Point-virgule optionnel
-        if self.regarder_token().type == 'POINT_VIRGULE':
-            self.consommer_token('POINT_VIRGULE')
+        if self.regarder_type() == 'POINT_VIRGULE':
+            self.passer_token('POINT_VIRGULE')
         
         return ImportDepuis(chemin_module, elements_importes)
 
@@ -143,34 +190,34 @@ class ParserFIA:
         expr = self.analyser_expression()
         
         # Vérifier le type d'assignation
-        token_courant = self.regarder_token()
+        type_courant = self.regarder_type()
         
-        if token_courant.type == 'ASSIGNATION':
+        if type_courant == 'ASSIGNATION':
             # Assignation normale
-            self.consommer_token('ASSIGNATION')
+            self.passer_token('ASSIGNATION')
             valeur = self.analyser_expression()
-            if self.regarder_token().type == 'POINT_VIRGULE':
-                self.consommer_token('POINT_VIRGULE')
+            if self.regarder_type() == 'POINT_VIRGULE':
+                self.passer_token('POINT_VIRGULE')
             return Assignation(expr, valeur)
-        elif token_courant.type in ['PLUS_EGAL', 'MOINS_EGAL', 'FOIS_EGAL', 'DIVISE_EGAL', 'MODULO_EGAL']:
+        elif type_courant in ['PLUS_EGAL', 'MOINS_EGAL', 'FOIS_EGAL', 'DIVISE_EGAL', 'MODULO_EGAL']:
             # Assignation composée
-            operateur = self.consommer_token().valeur
+            operateur = self.consommer_valeur()
             valeur = self.analyser_expression()
-            if self.regarder_token().type == 'POINT_VIRGULE':
-                self.consommer_token('POINT_VIRGULE')
+            if self.regarder_type() == 'POINT_VIRGULE':
+                self.passer_token('POINT_VIRGULE')
             return AssignationComposee(expr, operateur, valeur)
         else:
             # Expression simple
-            if self.regarder_token().type == 'POINT_VIRGULE':
-                self.consommer_token('POINT_VIRGULE')
+            if self.regarder_type() == 'POINT_VIRGULE':
+                self.passer_token('POINT_VIRGULE')
             return ExpressionStatement(expr)
 
     def analyser_boucle_pour_ou_pour_dans(self):
-        self.consommer_token('POUR')
+        self.passer_token('POUR')
         
-        if self.regarder_token().type == 'PARENTHESE_OUVRANTE':
+        if self.regarder_type() == 'PARENTHESE_OUVRANTE':
             return self.analyser_boucle_pour_classique()
-        elif self.regarder_token().type == 'IDENTIFIANT':
+        elif self.regarder_type() == 'IDENTIFIANT':
             return self.analyser_boucle_pour_dans()
         else:
             raise ParseError(f"Syntaxe de boucle 'pour' invalide", 
@@ -178,172 +225,183 @@ class ParserFIA:
                            colonne=self.regarder_token().colonne)
 
     def analyser_boucle_pour_classique(self):
-        self.consommer_token('PARENTHESE_OUVRANTE')
+        self.passer_token('PARENTHESE_OUVRANTE')
         init = self.analyser_instruction()
-        self.consommer_token('POINT_VIRGULE')
+        self.passer_token('POINT_VIRGULE')
         condition = self.analyser_expression()
-        self.consommer_token('POINT_VIRGULE')
+        self.passer_token('POINT_VIRGULE')
         increment = self.analyser_instruction()
-        self.consommer_token('PARENTHESE_FERMANTE')
+        self.passer_token('PARENTHESE_FERMANTE')
         corps = self.analyser_bloc()
         return BouclePour(init, condition, increment, corps)
 
     def analyser_boucle_pour_dans(self):
-        variable = self.consommer_token('IDENTIFIANT').valeur
-        self.consommer_token('DANS')
+        variable = self.consommer_valeur('IDENTIFIANT')
+        self.passer_token('DANS')
         iterable = self.analyser_expression()
         corps = self.analyser_bloc()
         return BouclePourDans(variable, iterable, corps)
 
     def analyser_declaration_variable(self):
-        self.consommer_token('SOIT')
-        nom = self.consommer_token('IDENTIFIANT').valeur
+        self.passer_token('SOIT')
+        nom = self.consommer_valeur('IDENTIFIANT')
         valeur = None
-        if self.regarder_token().type == 'ASSIGNATION':
-            self.consommer_token('ASSIGNATION')
+        if self.regarder_type() == 'ASSIGNATION':
+            self.passer_token('ASSIGNATION')
             valeur = self.analyser_expression()
-        if self.regarder_token().type == 'POINT_VIRGULE':
-            self.consommer_token('POINT_VIRGULE')
+        if self.regarder_type() == 'POINT_VIRGULE':
+            self.passer_token('POINT_VIRGULE')
         return DeclarationVariable(nom, valeur)
 
     def analyser_fonction(self):
-        self.consommer_token('FONCTION')
-        nom = self.consommer_token('IDENTIFIANT').valeur
-        self.consommer_token('PARENTHESE_OUVRANTE')
+        self.passer_token('FONCTION')
+        nom = self.consommer_valeur('IDENTIFIANT')
+        self.passer_token('PARENTHESE_OUVRANTE')
         params = []
-        if self.regarder_token().type != 'PARENTHESE_FERMANTE':
-            params.append(self.consommer_token('IDENTIFIANT').valeur)
-            while self.regarder_token().type == 'VIRGULE':
-                self.consommer_token('VIRGULE')
-                params.append(self.consommer_token('IDENTIFIANT').valeur)
-        self.consommer_token('PARENTHESE_FERMANTE')
+        if self.regarder_type() != 'PARENTHESE_FERMANTE':
+            params.append(self.consommer_valeur('IDENTIFIANT'))
+            while self.regarder_type() == 'VIRGULE':
+                self.passer_token('VIRGULE')
+                params.append(self.consommer_valeur('IDENTIFIANT'))
+        self.passer_token('PARENTHESE_FERMANTE')
         corps = self.analyser_bloc()
         return Fonction(nom, params, corps)
 
     def analyser_retour(self):
-        self.consommer_token('RETOURNER')
+        self.passer_token('RETOURNER')
         valeur = None
-        if self.regarder_token().type not in ['POINT_VIRGULE', 'ACCOLADE_FERMANTE']:
+        if self.regarder_type() not in ['POINT_VIRGULE', 'ACCOLADE_FERMANTE']:
             valeur = self.analyser_expression()
-        if self.regarder_token().type == 'POINT_VIRGULE':
-            self.consommer_token('POINT_VIRGULE')
+        if self.regarder_type() == 'POINT_VIRGULE':
+            self.passer_token('POINT_VIRGULE')
         return Retour(valeur)
 
     def analyser_condition(self):
-        self.consommer_token('SI')
-        self.consommer_token('PARENTHESE_OUVRANTE')
+        self.passer_token('SI')
+        self.passer_token('PARENTHESE_OUVRANTE')
         condition = self.analyser_expression()
-        self.consommer_token('PARENTHESE_FERMANTE')
+        self.passer_token('PARENTHESE_FERMANTE')
         bloc_si = self.analyser_bloc()
         bloc_sinon = None
-        if self.regarder_token().type == 'SINON':
-            self.consommer_token('SINON')
-            if self.regarder_token().type == 'SI':
-                bloc_sinon = Bloc([self.analyser_condition()])
+        if self.regarder_type() == 'SINON':
+            self.passer_token('SINON')
+            if self.regarder_type() == 'SI':
+                debut = self.position
+                bloc_sinon = self._placer(Bloc([self._placer(self.analyser_condition(), debut)]), debut)
             else:
                 bloc_sinon = self.analyser_bloc()
         return Condition(condition, bloc_si, bloc_sinon)
 
     def analyser_boucle_tant_que(self):
-        self.consommer_token('TANT_QUE')
-        self.consommer_token('PARENTHESE_OUVRANTE')
+        self.passer_token('TANT_QUE')
+        self.passer_token('PARENTHESE_OUVRANTE')
         condition = self.analyser_expression()
-        self.consommer_token('PARENTHESE_FERMANTE')
+        self.passer_token('PARENTHESE_FERMANTE')
         corps = self.analyser_bloc()
         return BoucleTantQue(condition, corps)
 
     def analyser_bloc(self):
-        self.consommer_token('ACCOLADE_OUVRANTE')
+        debut = self.position
+        self.passer_token('ACCOLADE_OUVRANTE')
         instructions = []
-        while self.regarder_token().type != 'ACCOLADE_FERMANTE' and not self.est_a_la_fin():
+        while self.regarder_type() != 'ACCOLADE_FERMANTE' and not self.est_a_la_fin():
             instruction = self.analyser_instruction()
             if instruction:
                 instructions.append(instruction)
-        self.consommer_token('ACCOLADE_FERMANTE')
-        return Bloc(instructions)
+        self.passer_token('ACCOLADE_FERMANTE')
+        return self._placer(Bloc(instructions), debut)
 
     def analyser_expression(self):
         return self.analyser_ou()
 
     def analyser_ou(self):
         gauche = self.analyser_et()
-        while self.regarder_token().type == 'OU':
-            operateur = self.consommer_token().valeur
+        while self.regarder_type() == 'OU':
+            index_operateur = self.position
+            operateur = self.consommer_valeur()
             droite = self.analyser_et()
-            gauche = ExpressionBinaire(gauche, operateur, droite)
+            gauche = self._placer(ExpressionLogique(gauche, operateur, droite), index_operateur)
         return gauche
 
     def analyser_et(self):
         gauche = self.analyser_comparaison()
-        while self.regarder_token().type == 'ET':
-            operateur = self.consommer_token().valeur
+        while self.regarder_type() == 'ET':
+            index_operateur = self.position
+            operateur = self.consommer_valeur()
             droite = self.analyser_comparaison()
-            gauche = ExpressionBinaire(gauche, operateur, droite)
+            gauche = self._placer(ExpressionLogique(gauche, operateur, droite), index_operateur)
         return gauche
 
     def analyser_comparaison(self):
         gauche = self.analyser_terme()
-        while self.regarder_token().type in ['EGAL', 'DIFF', 'INF', 'SUP', 'INF_EGAL', 'SUP_EGAL']:
-            operateur = self.consommer_token().valeur
+        while self.regarder_type() in ['EGAL', 'DIFF', 'INF', 'SUP', 'INF_EGAL', 'SUP_EGAL']:
+            index_operateur = self.position
+            operateur = self.consommer_valeur()
             droite = self.analyser_terme()
-            gauche = ExpressionBinaire(gauche, operateur, droite)
+            gauche = self._placer(ExpressionBinaire(gauche, operateur, droite), index_operateur)
         return gauche
 
     def analyser_terme(self):
         gauche = self.analyser_facteur()
-        while self.regarder_token().type in ['PLUS', 'MOINS']:
-            operateur = self.consommer_token().valeur
+        while self.regarder_type() in ['PLUS', 'MOINS']:
+            index_operateur = self.position
+            operateur = self.consommer_valeur()
             droite = self.analyser_facteur()
-            gauche = ExpressionBinaire(gauche, operateur, droite)
+            gauche = self._placer(ExpressionBinaire(gauche, operateur, droite), index_operateur)
         return gauche
 
     def analyser_facteur(self):
         gauche = self.analyser_unaire()
-        while self.regarder_token().type in ['FOIS', 'DIVISE', 'MODULO']:
-            operateur = self.consommer_token().valeur
+        while self.regarder_type() in ['FOIS', 'DIVISE', 'MODULO']:
+            index_operateur = self.position
+            operateur = self.consommer_valeur()
             droite = self.analyser_unaire()
-            gauche = ExpressionBinaire(gauche, operateur, droite)
+            gauche = self._placer(ExpressionBinaire(gauche, operateur, droite), index_operateur)
         return gauche
 
     def analyser_unaire(self):
-        if self.regarder_token().type == 'MOINS':
-            operateur = self.consommer_token().valeur
+        if self.regarder_type() == 'MOINS':
+            debut = self.position
+            operateur = self.consommer_valeur()
             operand = self.analyser_unaire()
-            return ExpressionUnaire(operateur, operand)
+            return self._placer(ExpressionUnaire(operateur, operand), debut)
         return self.analyser_appel()
 
     def analyser_appel(self):
+        # Appels et accès commencent au début de l'expression de base
+        debut = self.position
         gauche = self.analyser_primaire()
 
-        while self.regarder_token().type in ['PARENTHESE_OUVRANTE', 'CROCHET_OUVRANT', 'POINT']:
-            if self.regarder_token().type == 'PARENTHESE_OUVRANTE':
+        while self.regarder_type() in ['PARENTHESE_OUVRANTE', 'CROCHET_OUVRANT', 'POINT']:
+            if self.regarder_type() == 'PARENTHESE_OUVRANTE':
                 gauche = self.analyser_appel_fonction(gauche)
-            elif self.regarder_token().type == 'CROCHET_OUVRANT':
+            elif self.regarder_type() == 'CROCHET_OUVRANT':
                 gauche = self.analyser_acces_crochet(gauche)
-            elif self.regarder_token().type == 'POINT':
+            elif self.regarder_type() == 'POINT':
                 # NOUVEAU : Support de l'accès aux attributs (module.fonction)
                 gauche = self.analyser_acces_attribut(gauche)
             else:
                 break
+            self._placer(gauche, debut)
         return gauche
 
     def analyser_acces_attribut(self, objet_noeud):
         """
         Analyse l'accès aux attributs : objet.attribut
         """
-        self.consommer_token('POINT')
-        nom_attribut = self.consommer_token('IDENTIFIANT').valeur
+        self.passer_token('POINT')
+        nom_attribut = self.consommer_valeur('IDENTIFIANT')
         return AccesAttribut(objet_noeud, nom_attribut)
 
     def analyser_appel_fonction(self, nom_fonction_noeud):
-        self.consommer_token('PARENTHESE_OUVRANTE')
+        self.passer_token('PARENTHESE_OUVRANTE')
         arguments = []
-        if self.regarder_token().type != 'PARENTHESE_FERMANTE':
+        if self.regarder_type() != 'PARENTHESE_FERMANTE':
             arguments.append(self.analyser_expression())
-            while self.regarder_token().type == 'VIRGULE':
-                self.consommer_token('VIRGULE')
+            while self.regarder_type() == 'VIRGULE':
+                self.passer_token('VIRGULE')
                 arguments.append(self.analyser_expression())
-        self.consommer_token('PARENTHESE_FERMANTE')
+        self.passer_token('PARENTHESE_FERMANTE')
         
         if isinstance(nom_fonction_noeud, Identifiant):
             nom_fonction = nom_fonction_noeud.nom
@@ -352,9 +410,9 @@ class ParserFIA:
         return AppelFonction(nom_fonction, arguments)
 
     def analyser_acces_crochet(self, base_noeud):
-        self.consommer_token('CROCHET_OUVRANT')
+        self.passer_token('CROCHET_OUVRANT')
         index_expr = self.analyser_expression()
-        self.consommer_token('CROCHET_FERMANT')
+        self.passer_token('CROCHET_FERMANT')
         
         if hasattr(index_expr, 'valeur') and isinstance(index_expr.valeur, str):
             return AccesDictionnaire(base_noeud, index_expr)
@@ -362,83 +420,75 @@ class ParserFIA:
             return AccesIndex(base_noeud, index_expr)
 
     def analyser_primaire(self):
-        token = self.regarder_token()
-        if token.type == 'NOMBRE':
-            self.consommer_token()
-            return Littéral(token.valeur)
-        elif token.type == 'CHAINE':
-            self.consommer_token()
-            return Littéral(token.valeur)
-        elif token.type == 'VRAI':
-            self.consommer_token()
-            return Littéral(True)
-        elif token.type == 'FAUX':
-            self.consommer_token()
-            return Littéral(False)
-        elif token.type == 'NUL':
-            self.consommer_token()
-            return Littéral(None)
-        elif token.type == 'CROCHET_OUVRANT':
-            return self.analyser_liste()
-        elif token.type == 'ACCOLADE_OUVRANTE':
-            return self.analyser_dictionnaire()
-        elif token.type == 'IDENTIFIANT':
+        type_token = self.regarder_type()
+        debut = self.position
+        if type_token == 'NOMBRE':
+            return self._placer(Littéral(self.consommer_valeur()), debut)
+        elif type_token == 'CHAINE':
+            return self._placer(Littéral(self.consommer_valeur()), debut)
+        elif type_token == 'VRAI':
+            self.passer_token()
+            return self._placer(Littéral(True), debut)
+        elif type_token == 'FAUX':
+            self.passer_token()
+            return self._placer(Littéral(False), debut)
+        elif type_token == 'NUL':
+            self.passer_token()
+            return self._placer(Littéral(None), debut)
+        elif type_token == 'CROCHET_OUVRANT':
+            return self._placer(self.analyser_liste(), debut)
+        elif type_token == 'ACCOLADE_OUVRANTE':
+            return self._placer(self.analyser_dictionnaire(), debut)
+        elif type_token == 'IDENTIFIANT':
             # CHANGEMENT : Accepter TOUS les identifiants (y compris les anciens mots-clés)
-            nom = self.consommer_token().valeur
-            return Identifiant(nom)
-        elif token.type == 'PARENTHESE_OUVRANTE':
-            self.consommer_token('PARENTHESE_OUVRANTE')
+            nom = self.consommer_valeur()
+            return self._placer(Identifiant(nom), debut)
+        elif type_token == 'PARENTHESE_OUVRANTE':
+            self.passer_token('PARENTHESE_OUVRANTE')
             expr = self.analyser_expression()
-            self.consommer_token('PARENTHESE_FERMANTE')
+            self.passer_token('PARENTHESE_FERMANTE')
             return expr
         else:
+            token = self.regarder_token()
             raise ParseError(f"Expression inattendue '{token.type}' à la ligne {token.ligne}")
 
     def analyser_liste(self):
-        self.consommer_token()  # '['
+        self.passer_token()  # '['
         elements = []
-        if self.regarder_token().type != 'CROCHET_FERMANT':
+        if self.regarder_type() != 'CROCHET_FERMANT':
             elements.append(self.analyser_expression())
-            while self.regarder_token().type == 'VIRGULE':
-                self.consommer_token('VIRGULE')
+            while self.regarder_type() == 'VIRGULE':
+                self.passer_token('VIRGULE')
                 elements.append(self.analyser_expression())
-        self.consommer_token('CROCHET_FERMANT')  # ']'
-        
-        elements_evalues = []
-        for elem in elements:
-            if hasattr(elem, 'valeur') and hasattr(elem, 'accepter'):
-                elements_evalues.append(elem.valeur)
-            else:
-                elements_evalues.append(elem)
-        
-        return Littéral(elements_evalues)
+        self.passer_token('CROCHET_FERMANT')  # ']'
+        return ListeLitterale(elements)
 
     def analyser_dictionnaire(self):
-        self.consommer_token('ACCOLADE_OUVRANTE')  # '{'
+        self.passer_token('ACCOLADE_OUVRANTE')  # '{'
         elements = {}
     
-        if self.regarder_token().type != 'ACCOLADE_FERMANTE':
+        if self.regarder_type() != 'ACCOLADE_FERMANTE':
             # Premier élément
             cle = self.analyser_expression()
-            self.consommer_token('DEUX_POINTS')  # ':'
+            self.passer_token('DEUX_POINTS')  # ':'
             valeur = self.analyser_expression()
         
             # CORRECTION : Ne pas évaluer ici, laisser l'interpréteur le faire
             elements[self._extraire_cle_dict(cle)] = valeur
         
             # Éléments suivants
-            while self.regarder_token().type == 'VIRGULE':
-                self.consommer_token('VIRGULE')
-                if self.regarder_token().type == 'ACCOLADE_FERMANTE':
+            while self.regarder_type() == 'VIRGULE':
+                self.passer_token('VIRGULE')
+                if self.regarder_type() == 'ACCOLADE_FERMANTE':
                     break  # Virgule de fin autorisée
             
                 cle = self.analyser_expression()
-                self.consommer_token('DEUX_POINTS')
+                self.passer_token('DEUX_POINTS')
                 valeur = self.analyser_expression()
             
                 elements[self._extraire_cle_dict(cle)] = valeur
     
-        self.consommer_token('ACCOLADE_FERMANTE')  # '}'
+        self.passer_token('ACCOLADE_FERMANTE')  # '}'
         # CORRECTION : Retourner un nœud AST spécial pour les dictionnaires
         return DictionnaireLitteral(elements)
 
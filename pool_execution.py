@@ -0,0 +1,340 @@
+# pool_execution.py
+"""
+Pool de processus pour exécuter du code F-IA pour plusieurs clients à la fois.
+
+Chaque worker est un processus qui a déjà importé le lexer, le parser et les
+moteurs (démarrage à chaud) et qui exécute une requête à la fois : la sortie
+d'une exécution est capturée par le puits de son interpréteur (sans toucher à
+`sys.stdout`, bornée à `sortie_max` caractères), et les modules F-IA exécutés sont oubliés entre deux requêtes pour
+qu'aucun état ne passe d'un client à l'autre.
+
+File d'attente : au plus `taille + file_max` exécutions acceptées à la fois ;
+au-delà, `executer` attend `attente_max` secondes une place puis lève
+`PoolSature` (le serveur répond 503).
+
+Exécution en continu (`executer_en_flux`) : un processus dédié par exécution,
+lancé depuis un serveur de fork qui a préchargé l'interpréteur, renvoie chaque
+`imprimer` par un tube dès qu'il est écrit. Le tube est borné (un client lent
+ralentit le script au lieu de remplir la mémoire), la sortie totale est
+plafonnée à `sortie_max` caractères, et fermer le flux (client déconnecté)
+arrête le processus. Ces exécutions occupent les mêmes places que le pool.
+
+Configuration par variables d'environnement (voir `configuration_depuis_env`) :
+  FIA_POOL_TAILLE   nombre de workers (défaut : nombre de CPU)
+  FIA_POOL_FILE     exécutions en attente au-delà des workers (défaut : 2 x taille)
+  FIA_POOL_ATTENTE  secondes d'attente d'une place avant refus (défaut : 0)
+  FIA_SORTIE_MAX    caractères de sortie gardés par exécution (défaut : 1 000 000)
+
+Limites d'exécution (voir budget.py ; 0 = pas de limite) : une requête peut
+demander des limites plus basses, jamais plus hautes.
+  FIA_MAX_INSTRUCTIONS  pas (itérations de boucles, appels) par exécution (défaut : 0)
+  FIA_DELAI_MAX         secondes par exécution (défaut : 30)
+  FIA_MAX_PROFONDEUR    profondeur d'appels de fonctions (défaut : 0)
+  FIA_MAX_ELEMENTS      éléments d'une liste ou d'un dictionnaire (défaut : 1 000 000)
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from errors import FIAError
+
+class PoolSature(FIAError):
+    """Toutes les places du pool (workers et file d'attente) sont occupées"""
+    pass
+
+# === CÔTÉ WORKER ===
+
+def _initialiser_worker():
+    """Importe à l'avance tout ce qu'une exécution utilise (worker chaud)"""
+    import lexer, parser
+    from moteurs import MOTEURS, classe_moteur
+    for moteur in MOTEURS:
+        classe_moteur(moteur)
+
+def _pret():
+    return True
+
+def executer_isole(code, moteur, sortie_max=None, limites=None):
+    """Exécute du code F-IA et retourne sa sortie (ou le message d'erreur)"""
+    from lexer import LexerFIA
+    from parser import ParserFIA
+    from moteurs import creer_interpreteur
+    from module_resolver import module_resolver
+    from sortie import SortieFIA
+    from budget import BudgetExecution
+
+    # Capture seule : rien n'est écrit sur la sortie du processus
+    sortie = SortieFIA(flux=None, capturer=True, capacite=sortie_max)
+    try:
+        ast = ParserFIA(LexerFIA(code).tokeniser_tampon()).analyser()
+        interpreteur = creer_interpreteur(moteur, sortie, BudgetExecution.depuis_dict(limites))
+        interpreteur.executer(ast)
+        return _texte_capture(sortie)
+    except FIAError as e:
+        return str(e)
+    except Exception as e:
+        return f"Erreur inattendue: {str(e)}"
+    finally:
+        # Pas d'état partagé entre clients (les AST analysés restent en cache)
+        module_resolver.vider_modules_executes()
+
+def _texte_capture(sortie):
+    texte = sortie.texte()
+    if sortie.tronques:
+        return f"[... {sortie.tronques} caractères de sortie omis ...]\n" + texte
+    return texte
+
+def executer_en_flux_isole(code, moteur, connexion, limites=None):
+    """Exécute du code F-IA en envoyant chaque écriture par `connexion` :
+    ('sortie', texte)..., puis ('fin', None) ou ('erreur', message)"""
+    from lexer import LexerFIA
+    from parser import ParserFIA
+    from moteurs import creer_interpreteur
+    from sortie import SortieFIA
+    from budget import BudgetExecution
+
+    envoyer = connexion.send
+    sortie = SortieFIA(flux=None, rappel=lambda texte: envoyer(('sortie', texte)), taille_lot=0)
+    try:
+        ast = ParserFIA(LexerFIA(code).tokeniser_tampon()).analyser()
+        creer_interpreteur(moteur, sortie, BudgetExecution.depuis_dict(limites)).executer(ast)
+        envoyer(('fin', None))
+    except FIAError as e:
+        sortie.vider()
+        envoyer(('erreur', str(e)))
+    except Exception as e:
+        sortie.vider()
+        envoyer(('erreur', f"Erreur inattendue: {str(e)}"))
+    finally:
+        connexion.close()
+
+# Modules chargés une fois par le serveur de fork, hérités par chaque exécution
+MODULES_PRECHARGES = ['pool_execution', 'lexer', 'parser', 'moteurs', 'sortie', 'budget',
+                      'interpreter', 'compilateur_closures', 'machine_virtuelle']
+
+def _contexte_flux():
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        contexte = multiprocessing.get_context('forkserver')
+        contexte.set_forkserver_preload(MODULES_PRECHARGES)
+        return contexte
+    return multiprocessing.get_context('spawn')
+
+# === CÔTÉ SERVEUR ===
+
+def configuration_depuis_env(environ=os.environ):
+    """Paramètres du pool lus dans les variables d'environnement"""
+    taille = int(environ.get('FIA_POOL_TAILLE', 0)) or os.cpu_count() or 1
+    return {
+        'taille': taille,
+        'file_max': int(environ.get('FIA_POOL_FILE', 2 * taille)),
+        'attente_max': float(environ.get('FIA_POOL_ATTENTE', 0)),
+        'sortie_max': int(environ.get('FIA_SORTIE_MAX', 1_000_000)) or None,
+        'limites': {
+            'instructions': int(environ.get('FIA_MAX_INSTRUCTIONS', 0)) or None,
+            'delai': float(environ.get('FIA_DELAI_MAX', 30)) or None,
+            'profondeur': int(environ.get('FIA_MAX_PROFONDEUR', 0)) or None,
+            'elements': int(environ.get('FIA_MAX_ELEMENTS', 1_000_000)) or None,
+        },
+    }
+
+# Type attendu pour chaque limite demandée par un client
+TYPES_LIMITES = {'instructions': int, 'delai': float, 'profondeur': int, 'elements': int}
+
+def combiner_limites(limites_serveur, demandees):
+    """Limites d'une exécution : celles du serveur, abaissées par celles de la requête"""
+    limites = dict(limites_serveur or {})
+    if demandees is not None and not isinstance(demandees, dict):
+        raise ValueError("Les limites doivent être un objet {nom: valeur}")
+    for nom, valeur in (demandees or {}).items():
+        if nom not in TYPES_LIMITES:
+            raise ValueError(f"Limite inconnue: {nom}")
+        if valeur is None:
+            continue
+        if isinstance(valeur, bool) or not isinstance(valeur, (int, float)) or valeur <= 0:
+            raise ValueError(f"La limite '{nom}' doit être un nombre positif")
+        valeur = TYPES_LIMITES[nom](valeur)
+        maximum = limites.get(nom)
+        limites[nom] = valeur if maximum is None else min(valeur, maximum)
+    return limites
+
+class PoolExecution:
+    """Workers F-IA partagés par les requêtes, avec file d'attente bornée"""
+
+    def __init__(self, taille=1, file_max=0, attente_max=0.0, sortie_max=None, limites=None):
+        if taille < 1:
+            raise ValueError("Le pool doit avoir au moins un worker")
+        self.taille = taille
+        self.file_max = max(0, file_max)
+        self.attente_max = attente_max
+        self.sortie_max = sortie_max
+        # Limites maximales de chaque exécution (budget.py)
+        self.limites = limites or {}
+        self._places = threading.BoundedSemaphore(taille + self.file_max)
+        self._verrou = threading.Lock()
+        self._executeur = None
+
+    def _obtenir_executeur(self):
+        with self._verrou:
+            if self._executeur is None:
+                # spawn : pas de fork d'un serveur qui a déjà des threads
+                self._executeur = ProcessPoolExecutor(
+                    max_workers=self.taille,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_initialiser_worker,
+                )
+            return self._executeur
+
+    def demarrer(self):
+        """Lance les workers et attend qu'ils soient chauds"""
+        executeur = self._obtenir_executeur()
+        for futur in [executeur.submit(_pret) for _ in range(self.taille)]:
+            futur.result()
+        return self
+
+    def _reserver_place(self):
+        if self.attente_max > 0:
+            place = self._places.acquire(timeout=self.attente_max)
+        else:
+            place = self._places.acquire(blocking=False)
+        if not place:
+            raise PoolSature(
+                f"Serveur saturé : {self.taille} exécutions en cours et {self.file_max} en attente"
+            )
+
+    def executer(self, code, moteur, limites=None):
+        """Exécute du code dans un worker et retourne sa sortie
+        (limites : celles demandées par le client, bornées par celles du pool)"""
+        limites = combiner_limites(self.limites, limites)
+        self._reserver_place()
+        try:
+            executeur = self._obtenir_executeur()
+            try:
+                return executeur.submit(executer_isole, code, moteur, self.sortie_max, limites).result()
+            except BrokenProcessPool:
+                # Un worker est mort (mémoire, signal...) : on repart d'un pool neuf
+                self._remplacer_executeur(executeur)
+                return "Erreur inattendue: le processus d'exécution s'est arrêté"
+        finally:
+            self._places.release()
+
+    def executer_en_flux(self, code, moteur, limites=None):
+        """Lance une exécution en continu ; retourne un FluxExecution à itérer puis fermer"""
+        limites = combiner_limites(self.limites, limites)
+        self._reserver_place()
+        # La place est rendue par FluxExecution.fermer (y compris si le lancement échoue)
+        return FluxExecution(code, moteur, self.sortie_max, self._places.release, limites)
+
+    def _remplacer_executeur(self, casse):
+        with self._verrou:
+            # Un autre thread a peut-être déjà remplacé ce pool
+            if self._executeur is casse:
+                self._executeur = None
+        casse.shutdown(wait=False, cancel_futures=True)
+
+    def fermer(self):
+        """Arrête les workers"""
+        with self._verrou:
+            executeur, self._executeur = self._executeur, None
+        if executeur is not None:
+            executeur.shutdown(wait=True)
+
+class FluxExecution:
+    """Événements d'une exécution en continu : ('sortie', texte)..., puis
+    ('fin', None) ou ('erreur', message). `fermer` arrête l'exécution."""
+
+    # Sorties déjà arrivées regroupées en un seul événement (caractères)
+    TAILLE_PAQUET = 65536
+
+    _contexte = None
+
+    def __init__(self, code, moteur, sortie_max, liberer, limites=None):
+        self._termine = False
+        self._liberer = liberer
+        self._lecture = None
+        self._processus = None
+        self._suivant = None
+        self.sortie_max = sortie_max
+        self.envoyes = 0
+        try:
+            if FluxExecution._contexte is None:
+                FluxExecution._contexte = _contexte_flux()
+            self._lecture, ecriture = self._contexte.Pipe(duplex=False)
+            try:
+                self._processus = self._contexte.Process(
+                    target=executer_en_flux_isole, args=(code, moteur, ecriture, limites), daemon=True
+                )
+                self._processus.start()
+            finally:
+                # Seul l'enfant garde l'extrémité d'écriture : EOF s'il meurt
+                ecriture.close()
+        except BaseException:
+            self.fermer()
+            raise
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._termine:
+            raise StopIteration
+        evenement = self._suivant or self._recevoir()
+        self._suivant = None
+        if evenement[0] != 'sortie':
+            self.fermer()
+            return evenement
+
+        # Regrouper ce qui est déjà disponible dans le tube
+        morceaux = [evenement[1]]
+        taille = len(evenement[1])
+        while taille < self.TAILLE_PAQUET and self._lecture.poll():
+            evenement = self._recevoir()
+            if evenement[0] != 'sortie':
+                # Rendu au prochain appel
+                self._suivant = evenement
+                break
+            morceaux.append(evenement[1])
+            taille += len(evenement[1])
+        texte = "".join(morceaux)
+
+        if self.sortie_max is not None and self.envoyes + len(texte) > self.sortie_max:
+            texte = texte[:self.sortie_max - self.envoyes]
+            self._suivant = ('erreur', f"Limite de sortie atteinte ({self.sortie_max} caractères) : exécution arrêtée")
+            self._arreter_processus()
+        self.envoyes += len(texte)
+        return ('sortie', texte)
+
+    def _recevoir(self):
+        try:
+            return self._lecture.recv()
+        except (EOFError, OSError):
+            return ('erreur', "Erreur inattendue: le processus d'exécution s'est arrêté")
+
+    def _arreter_processus(self):
+        processus = self._processus
+        if processus is None or processus.pid is None:
+            return
+        if processus.is_alive():
+            processus.terminate()
+            processus.join(1)
+            if processus.is_alive():
+                processus.kill()
+        processus.join()
+
+    def fermer(self):
+        """Arrête l'exécution si elle tourne encore et libère sa place"""
+        if self._termine:
+            return
+        self._termine = True
+        try:
+            self._arreter_processus()
+            if self._lecture is not None:
+                self._lecture.close()
+        finally:
+            self._liberer()
+
+    # Appelé par les serveurs WSGI quand le client se déconnecte
+    close = fermer
+
+    def __del__(self):
+        self.fermer()
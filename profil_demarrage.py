@@ -0,0 +1,136 @@
+# profil_demarrage.py
+"""
+Profil du démarrage de F-IA (`python main.py --profil-demarrage fichier.fia`).
+
+Un chercheur placé en tête de `sys.meta_path` chronomètre l'exécution de
+chaque module importé ensuite, comme `python -X importtime` :
+  - temps cumulé : le module et tous les imports qu'il déclenche ;
+  - temps propre : le cumulé moins celui de ses imports.
+Le rapport détaille aussi les phases du lancement (analyse, création de
+l'interpréteur, exécution) et l'état des backends Python chargés à la demande.
+
+Ce module n'importe que `sys` et `time` : il ne fausse pas ce qu'il mesure.
+"""
+import sys
+import time
+
+class _ChercheurChronometre:
+    """Délègue la recherche aux autres chercheurs et chronomètre `exec_module`"""
+
+    def __init__(self, profil):
+        self.profil = profil
+
+    def find_spec(self, nom, chemin, cible=None):
+        for chercheur in sys.meta_path:
+            if chercheur is self or not hasattr(chercheur, 'find_spec'):
+                continue
+            spec = chercheur.find_spec(nom, chemin, cible)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        chargeur = spec.loader
+        # Chargeurs partagés (modules intégrés, gelés) : quasi gratuits, non mesurés
+        if chargeur is None or isinstance(chargeur, type) or not hasattr(chargeur, 'exec_module'):
+            return spec
+        executer = chargeur.exec_module
+        profil = self.profil
+
+        def exec_module(module):
+            profil._chronometrer(nom, executer, module)
+        try:
+            chargeur.exec_module = exec_module
+        except AttributeError:
+            pass
+        return spec
+
+class ProfilDemarrage:
+    """Temps d'import par module et durée des phases du lancement"""
+
+    def __init__(self):
+        self.actif = False
+        self.debut = None
+        # {module: [cumulé, propre]} en secondes
+        self.imports = {}
+        # [(phase, durée)] dans l'ordre d'exécution
+        self.phases = []
+        self._pile = []
+        self._chercheur = None
+
+    def demarrer(self):
+        """Installe le chercheur chronométré ; à appeler avant les imports à mesurer"""
+        self.actif = True
+        self.debut = time.perf_counter()
+        self._chercheur = _ChercheurChronometre(self)
+        sys.meta_path.insert(0, self._chercheur)
+
+    def arreter(self):
+        if self._chercheur in sys.meta_path:
+            sys.meta_path.remove(self._chercheur)
+        self.actif = False
+
+    def _chronometrer(self, nom, executer, module):
+        # [nom, temps des imports imbriqués]
+        self._pile.append([nom, 0.0])
+        debut = time.perf_counter()
+        try:
+            executer(module)
+        finally:
+            cumule = time.perf_counter() - debut
+            _, enfants = self._pile.pop()
+            if self._pile:
+                self._pile[-1][1] += cumule
+            self.imports[nom] = [cumule, cumule - enfants]
+
+    def phase(self, nom):
+        """Gestionnaire de contexte qui mesure une phase (sans effet si inactif)"""
+        return _Phase(self, nom)
+
+    def rapport(self, top=15):
+        """Texte du rapport : phases, imports les plus coûteux, backends différés"""
+        total = time.perf_counter() - self.debut
+        # La somme des temps propres ne compte aucun import deux fois
+        imports_total = sum(propre for _, propre in self.imports.values())
+        lignes = ["⏱️  Profil de démarrage", ""]
+        lignes.append(f"  {'Imports':<22}{imports_total * 1000:9.1f} ms  ({len(self.imports)} modules)")
+        for nom, duree in self.phases:
+            lignes.append(f"  {nom:<22}{duree * 1000:9.1f} ms")
+        lignes.append(f"  {'Total':<22}{total * 1000:9.1f} ms")
+
+        lignes.append("")
+        lignes.append(f"  Imports les plus coûteux (cumulé / propre, {min(top, len(self.imports))} sur {len(self.imports)}) :")
+        classement = sorted(self.imports.items(), key=lambda e: e[1][0], reverse=True)
+        for nom, (cumule, propre) in classement[:top]:
+            lignes.append(f"    {cumule * 1000:8.1f} ms {propre * 1000:8.1f} ms  {nom}")
+
+        import builtin
+        lignes.append("")
+        lignes.append("  Backends Python chargés à la demande :")
+        for nom in builtin.BACKENDS_DIFFERES:
+            if nom in sys.modules:
+                etat = f"chargé ({self.imports[nom][0] * 1000:.1f} ms)" if nom in self.imports else "chargé"
+            elif nom in self.imports:
+                etat = f"indisponible (échec de l'import, {self.imports[nom][0] * 1000:.1f} ms)"
+            else:
+                etat = "non chargé"
+            lignes.append(f"    {nom:<20}{etat}")
+        return "\n".join(lignes)
+
+class _Phase:
+    __slots__ = ('profil', 'nom', 'debut')
+
+    def __init__(self, profil, nom):
+        self.profil = profil
+        self.nom = nom
+
+    def __enter__(self):
+        self.debut = time.perf_counter()
+
+    def __exit__(self, *exc):
+        if self.profil.actif:
+            self.profil.phases.append((self.nom, time.perf_counter() - self.debut))
+        return False
+
+# Instance globale (comme cache_ast)
+profil = ProfilDemarrage()
@@ -0,0 +1,149 @@
+# profileur.py
+"""
+Profileur par échantillonnage des programmes F-IA (`python main.py --profiler fichier.fia`).
+
+Un thread relève toutes les `intervalle` secondes le cadre Python courant du
+thread qui exécute le programme (`sys._current_frames()`) et demande à
+l'interpréteur d'en déduire la pile d'appels F-IA (`pile_appels` : fonctions
+et lignes des instructions en cours). Le programme n'est pas instrumenté :
+seul le thread d'échantillonnage coûte (une remontée de pile toutes les 5 ms
+par défaut), ce qui permet de le laisser actif en préproduction.
+
+Résultats :
+  - piles repliées (« collapsed stacks »), lisibles par flamegraph.pl,
+    inferno ou speedscope : `<programme>:5;fib:3;fib:3 17` ;
+  - rapport texte des fonctions et des lignes les plus coûteuses.
+Temps propre : échantillons où la fonction (la ligne) est au sommet de la pile.
+Temps total : échantillons où elle apparaît, comptés une fois par échantillon
+même en cas de récursion.
+"""
+import sys
+import threading
+import time
+from collections import Counter
+
+# Secondes entre deux échantillons
+INTERVALLE_DEFAUT = 0.005
+
+class ProfileurFIA:
+    """Échantillonne la pile d'appels F-IA d'un interpréteur pendant son exécution"""
+
+    def __init__(self, interpreteur, intervalle=INTERVALLE_DEFAUT):
+        self.interpreteur = interpreteur
+        self.intervalle = intervalle
+        # {pile: nombre d'échantillons}, pile = ((fonction, ligne), ...) de l'extérieur vers l'intérieur
+        self.echantillons = Counter()
+        # Durée échantillonnée (secondes)
+        self.duree = 0.0
+        self._arret = threading.Event()
+        self._thread = None
+        self._cible = None
+        self._debut = None
+
+    def demarrer(self, thread_cible=None):
+        """Commence à échantillonner le thread cible (par défaut le thread courant)"""
+        self._cible = thread_cible if thread_cible is not None else threading.get_ident()
+        self._arret.clear()
+        self._debut = time.perf_counter()
+        self._thread = threading.Thread(target=self._echantillonner, name="profileur-fia", daemon=True)
+        self._thread.start()
+        return self
+
+    def arreter(self):
+        """Arrête l'échantillonnage (les échantillons sont conservés)"""
+        if self._thread is None:
+            return self
+        self._arret.set()
+        self._thread.join()
+        self._thread = None
+        self.duree += time.perf_counter() - self._debut
+        return self
+
+    def __enter__(self):
+        return self.demarrer()
+
+    def __exit__(self, *exc):
+        self.arreter()
+
+    def _echantillonner(self):
+        cible = self._cible
+        pile_appels = self.interpreteur.pile_appels
+        echantillons = self.echantillons
+        while not self._arret.wait(self.intervalle):
+            cadre = sys._current_frames().get(cible)
+            if cadre is None:
+                # Thread cible terminé
+                return
+            try:
+                pile = tuple(pile_appels(cadre))
+            except Exception:
+                # Pile modifiée pendant la lecture : échantillon ignoré
+                continue
+            finally:
+                del cadre
+            echantillons[pile] += 1
+
+    # === RÉSULTATS ===
+
+    @property
+    def nb_echantillons(self):
+        return sum(self.echantillons.values())
+
+    def _agreger(self, cle):
+        """(propre, total) en échantillons par clé ; `cle(appel)` None = appel ignoré"""
+        propre = Counter()
+        total = Counter()
+        for pile, nombre in self.echantillons.items():
+            cles = [c for c in map(cle, pile) if c is not None]
+            if not cles:
+                continue
+            propre[cles[-1]] += nombre
+            for c in set(cles):
+                total[c] += nombre
+        return propre, total
+
+    def par_fonction(self):
+        """Échantillons (propres, totaux) par fonction F-IA"""
+        return self._agreger(lambda appel: appel[0])
+
+    def par_ligne(self):
+        """Échantillons (propres, totaux) par (fonction, ligne) ; le temps propre
+        des fonctions intégrées revient à la ligne qui les appelle"""
+        return self._agreger(lambda appel: appel if appel[1] is not None else None)
+
+    def piles_repliees(self):
+        """Lignes `cadre;cadre;... nombre` (format collapsed de flamegraph.pl)"""
+        lignes = []
+        for pile, nombre in self.echantillons.items():
+            cadres = ";".join(nom if ligne is None else f"{nom}:{ligne}" for nom, ligne in pile)
+            lignes.append(f"{cadres} {nombre}")
+        return sorted(lignes)
+
+    def ecrire_piles_repliees(self, chemin):
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            for ligne in self.piles_repliees():
+                fichier.write(ligne + "\n")
+
+    def rapport(self, top=15):
+        """Rapport texte : les `top` fonctions et lignes les plus coûteuses"""
+        total_echantillons = self.nb_echantillons
+        lignes = [f"📊 Profil F-IA : {total_echantillons} échantillons en {self.duree:.2f} s "
+                  f"(intervalle {self.intervalle * 1000:g} ms)"]
+        if not total_echantillons:
+            lignes.append("   (programme trop court pour être échantillonné)")
+            return "\n".join(lignes)
+        secondes = self.duree / total_echantillons
+
+        def tableau(titre, propre, total, nommer):
+            lignes.append("")
+            lignes.append(f"{titre} (temps propre / temps total) :")
+            lignes.append(f"   {'propre':>9} {'%':>6} {'total':>9} {'%':>6}  nom")
+            for cle, _ in sorted(total.items(), key=lambda e: (-propre[e[0]], -e[1]))[:top]:
+                lignes.append(
+                    f"   {propre[cle] * secondes:8.3f}s {100 * propre[cle] / total_echantillons:5.1f}%"
+                    f" {total[cle] * secondes:8.3f}s {100 * total[cle] / total_echantillons:5.1f}%  {nommer(cle)}"
+                )
+
+        tableau("Fonctions", *self.par_fonction(), nommer=str)
+        tableau("Lignes", *self.par_ligne(), nommer=lambda cle: f"{cle[0]}:{cle[1]}")
+        return "\n".join(lignes)
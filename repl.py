@@ -18,7 +18,7 @@ class ReplFIA:
             
             # Lexer
             lexer = LexerFIA(ligne)
-            tokens = lexer.tokeniser()
+            tokens = lexer.tokeniser_tampon()
             
             # Parser
             parser = ParserFIA(tokens)
@@ -73,9 +73,9 @@ class ReplFIA:
     
     def afficher_variables(self):
         """Affiche les variables définies"""
-        if self.interpreter.contextes and self.interpreter.contextes[0]:
+        if self.interpreter.globales:
             print("📦 Variables définies:")
-            for nom, valeur in self.interpreter.contextes[0].items():
+            for nom, valeur in self.interpreter.globales.items():
                 print(f"  {nom} = {repr(valeur)}")
         else:
             print("📦 Aucune variable définie")
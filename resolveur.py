@@ -0,0 +1,164 @@
+# resolveur.py
+"""
+Résolution statique des portées F-IA.
+
+Exécuté à la fin de l'analyse syntaxique, ce passage attribue à chaque
+variable locale d'une fonction un index (slot) dans le cadre de la fonction :
+  - paramètres d'abord (slots 0..n-1), puis toute variable déclarée (`soit`),
+    assignée, variable de boucle `pour...dans` ou importée dans le corps ;
+  - `Fonction.index_locaux` : {nom: slot}, qui fixe la taille du cadre ;
+  - `Identifiant.slot`, `DeclarationVariable.slot`, `BouclePourDans.slot` :
+    slot >= 0 pour une locale, -1 pour une variable globale ;
+  - `Retour.appel_terminal` : `retourner f(...)` dans le corps de `f` lui-même,
+    exécuté en réutilisant le cadre de l'appel en cours (si `f` désigne
+    toujours cette fonction à l'exécution).
+
+Les nœuds non résolus gardent `slot = None` et sont recherchés par nom à
+l'exécution.
+"""
+from fia_ast import *
+
+GLOBAL = -1
+
+
+class ResolveurPortees:
+    """Attribue les slots des variables locales de chaque fonction"""
+
+    def resoudre(self, programme):
+        """Annote un Programme sur place et le retourne"""
+        self._index = None  # None = niveau global
+        self._fonction = None
+        for instruction in programme.instructions:
+            self._instruction(instruction)
+        return programme
+
+    # === COLLECTE DES LOCALES D'UNE FONCTION ===
+
+    def _collecter_locales(self, fonction):
+        index = {}
+        for parametre in fonction.parametres:
+            index.setdefault(parametre, len(index))
+        self._collecter(fonction.corps, index)
+        return index
+
+    def _collecter(self, noeud, index):
+        if isinstance(noeud, Bloc):
+            for instruction in noeud.instructions:
+                self._collecter(instruction, index)
+        elif isinstance(noeud, DeclarationVariable):
+            index.setdefault(noeud.nom, len(index))
+        elif isinstance(noeud, (Assignation, AssignationComposee)):
+            if isinstance(noeud.cible, Identifiant):
+                index.setdefault(noeud.cible.nom, len(index))
+        elif isinstance(noeud, Condition):
+            self._collecter(noeud.bloc_si, index)
+            if noeud.bloc_sinon:
+                self._collecter(noeud.bloc_sinon, index)
+        elif isinstance(noeud, BoucleTantQue):
+            self._collecter(noeud.corps, index)
+        elif isinstance(noeud, BouclePour):
+            self._collecter(noeud.init, index)
+            self._collecter(noeud.increment, index)
+            self._collecter(noeud.corps, index)
+        elif isinstance(noeud, BouclePourDans):
+            index.setdefault(noeud.variable, len(index))
+            self._collecter(noeud.corps, index)
+        elif isinstance(noeud, ImportDepuis):
+            for _, alias in noeud.elements_importes:
+                index.setdefault(alias, len(index))
+        # Les fonctions imbriquées ont leur propre portée : on ne descend pas
+
+    # === ANNOTATION ===
+
+    def _slot(self, nom):
+        if self._index is None:
+            return GLOBAL
+        return self._index.get(nom, GLOBAL)
+
+    def _instruction(self, noeud):
+        if isinstance(noeud, Fonction):
+            ancien_index, ancienne_fonction = self._index, self._fonction
+            self._index = self._collecter_locales(noeud)
+            self._fonction = noeud
+            noeud.index_locaux = self._index
+            try:
+                self._instruction(noeud.corps)
+            finally:
+                self._index, self._fonction = ancien_index, ancienne_fonction
+        elif isinstance(noeud, (Programme, Bloc)):
+            for instruction in noeud.instructions:
+                self._instruction(instruction)
+        elif isinstance(noeud, DeclarationVariable):
+            noeud.slot = self._slot(noeud.nom)
+            if noeud.valeur:
+                self._expression(noeud.valeur)
+        elif isinstance(noeud, (Assignation, AssignationComposee)):
+            self._expression(noeud.cible)
+            self._expression(noeud.valeur)
+        elif isinstance(noeud, Retour):
+            if noeud.valeur is not None:
+                self._expression(noeud.valeur)
+                noeud.appel_terminal = self._appel_recursif(noeud.valeur)
+        elif isinstance(noeud, Condition):
+            self._expression(noeud.condition)
+            self._instruction(noeud.bloc_si)
+            if noeud.bloc_sinon:
+                self._instruction(noeud.bloc_sinon)
+        elif isinstance(noeud, BoucleTantQue):
+            self._expression(noeud.condition)
+            self._instruction(noeud.corps)
+        elif isinstance(noeud, BouclePour):
+            self._instruction(noeud.init)
+            self._expression(noeud.condition)
+            self._instruction(noeud.increment)
+            self._instruction(noeud.corps)
+        elif isinstance(noeud, BouclePourDans):
+            noeud.slot = self._slot(noeud.variable)
+            self._expression(noeud.iterable)
+            self._instruction(noeud.corps)
+        elif isinstance(noeud, ExpressionStatement):
+            self._expression(noeud.expression)
+        elif isinstance(noeud, Noeud):
+            self._expression(noeud)
+
+    def _appel_recursif(self, noeud):
+        """Appel, par son nom, de la fonction en cours de résolution"""
+        if self._fonction is None or not isinstance(noeud, AppelFonction):
+            return False
+        nom = noeud.nom_fonction
+        if isinstance(nom, Identifiant):
+            nom = nom.nom
+        return nom == self._fonction.nom
+
+    def _expression(self, noeud):
+        if isinstance(noeud, Identifiant):
+            noeud.slot = self._slot(noeud.nom)
+        elif isinstance(noeud, ExpressionBinaire):
+            self._expression(noeud.gauche)
+            self._expression(noeud.droite)
+        elif isinstance(noeud, ExpressionUnaire):
+            self._expression(noeud.operande)
+        elif isinstance(noeud, AppelFonction):
+            if isinstance(noeud.nom_fonction, Noeud):
+                self._expression(noeud.nom_fonction)
+            for argument in noeud.arguments:
+                self._expression(argument)
+        elif isinstance(noeud, AccesAttribut):
+            self._expression(noeud.objet)
+        elif isinstance(noeud, AccesIndex):
+            self._expression(noeud.base)
+            self._expression(noeud.index)
+        elif isinstance(noeud, AccesDictionnaire):
+            self._expression(noeud.base)
+            self._expression(noeud.cle)
+        elif isinstance(noeud, ListeLitterale):
+            for element in noeud.elements:
+                self._expression(element)
+        elif isinstance(noeud, DictionnaireLitteral):
+            for valeur in noeud.elements.values():
+                self._expression(valeur)
+
+
+def resoudre_portees(programme):
+    """Résout les slots des variables locales d'un programme"""
+    return ResolveurPortees().resoudre(programme)
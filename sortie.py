@@ -0,0 +1,130 @@
+# sortie.py
+"""
+Puits de sortie F-IA.
+
+Chaque interpréteur possède sa `SortieFIA` : `imprimer`, les bannières de
+l'interpréteur et des imports, et les messages des backends Python y sont
+écrits au lieu de passer par `print`/`sys.stdout`. Un puits combine :
+  - un lot : les écritures sont regroupées et envoyées par paquets
+    (`taille_lot` caractères), au plus tard à la fin du programme ;
+  - un flux de destination (`sys.stdout` par défaut, lu au moment du vidage) ;
+  - une capture optionnelle en mémoire, éventuellement bornée : un tampon
+    circulaire de `capacite` caractères qui ne garde que la fin de la sortie ;
+  - un rappel optionnel appelé avec chaque paquet (diffusion en continu).
+
+Pendant l'exécution d'un programme, le puits de l'interpréteur est le « puits
+courant » (`sortie_courante()`, une ContextVar, donc propre à chaque thread) :
+les fonctions intégrées et les backends y écrivent avec `afficher(...)`.
+"""
+import sys
+from collections import deque
+from contextvars import ContextVar
+
+# Destination par défaut : sys.stdout tel qu'il est au moment du vidage
+SORTIE_STANDARD = object()
+
+class SortieFIA:
+    """Puits de sortie d'un interpréteur (lots, tampon circulaire, rappel)"""
+
+    def __init__(self, flux=SORTIE_STANDARD, capturer=False, capacite=None, rappel=None, taille_lot=8192):
+        # flux : objet avec write(), SORTIE_STANDARD ou None (aucun flux)
+        self.flux = flux
+        self.capturer = capturer or capacite is not None
+        self.capacite = capacite
+        self.rappel = rappel
+        self.taille_lot = taille_lot
+        self._lot = []
+        self._taille = 0
+        # Morceaux capturés et leur longueur totale
+        self._capture = deque()
+        self._taille_capture = 0
+        # Caractères écartés par le tampon circulaire
+        self.tronques = 0
+
+    def ecrire(self, texte):
+        """Ajoute du texte au lot ; le lot est vidé dès qu'il atteint taille_lot"""
+        self._lot.append(texte)
+        self._taille += len(texte)
+        if self._taille >= self.taille_lot:
+            self.vider()
+
+    def imprimer(self, *valeurs):
+        """Équivalent de print(*valeurs)"""
+        self.ecrire(" ".join(map(str, valeurs)) + "\n")
+
+    def vider(self):
+        """Envoie le lot en attente au flux, à la capture et au rappel"""
+        if not self._lot:
+            return
+        texte = "".join(self._lot)
+        self._lot.clear()
+        self._taille = 0
+
+        flux = sys.stdout if self.flux is SORTIE_STANDARD else self.flux
+        if flux is not None:
+            flux.write(texte)
+        if self.capturer:
+            self._capturer(texte)
+        if self.rappel is not None:
+            self.rappel(texte)
+
+    def _capturer(self, texte):
+        capacite = self.capacite
+        if capacite is not None and len(texte) >= capacite:
+            # Le paquet remplit à lui seul le tampon
+            self.tronques += self._taille_capture + len(texte) - capacite
+            self._capture.clear()
+            texte = texte[len(texte) - capacite:]
+            self._taille_capture = 0
+        self._capture.append(texte)
+        self._taille_capture += len(texte)
+        if capacite is None:
+            return
+        while self._taille_capture > capacite:
+            exces = self._taille_capture - capacite
+            premier = self._capture[0]
+            if len(premier) <= exces:
+                self._capture.popleft()
+                self._taille_capture -= len(premier)
+                self.tronques += len(premier)
+            else:
+                self._capture[0] = premier[exces:]
+                self._taille_capture -= exces
+                self.tronques += exces
+
+    def texte(self):
+        """Sortie capturée (les `capacite` derniers caractères si le tampon est borné)"""
+        self.vider()
+        return "".join(self._capture)
+
+    def effacer(self):
+        """Oublie la sortie capturée et le lot en attente"""
+        self._lot.clear()
+        self._taille = 0
+        self._capture.clear()
+        self._taille_capture = 0
+        self.tronques = 0
+
+# Puits utilisé hors de toute exécution : écrit directement sur sys.stdout
+SORTIE_DIRECTE = SortieFIA(taille_lot=0)
+
+_sortie_courante = ContextVar('sortie_fia', default=SORTIE_DIRECTE)
+
+def sortie_courante():
+    """Puits de l'interpréteur en cours d'exécution dans ce thread"""
+    return _sortie_courante.get()
+
+def activer_sortie(sortie):
+    """Fait de `sortie` le puits courant ; retourne le jeton pour `restaurer_sortie`"""
+    return _sortie_courante.set(sortie)
+
+def restaurer_sortie(jeton):
+    """Vide le puits courant puis rétablit le précédent"""
+    try:
+        _sortie_courante.get().vider()
+    finally:
+        _sortie_courante.reset(jeton)
+
+def afficher(*valeurs):
+    """print(*valeurs) vers le puits courant (fonctions intégrées, backends)"""
+    _sortie_courante.get().imprimer(*valeurs)
@@ -0,0 +1,40 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+import fia_ast
+from fia_ast import CLASSES_NOEUDS, ExpressionBinaire, Identifiant, Littéral, table_dispatch
+from interpreter import VisiteurInterpretation
+
+class TestNoeuds(unittest.TestCase):
+    def test_slots_sans_dict(self):
+        noeud = ExpressionBinaire(Identifiant('a'), '+', Littéral(1))
+        self.assertFalse(hasattr(noeud, '__dict__'))
+        with self.assertRaises(AttributeError):
+            noeud.attribut_inconnu = 1
+
+    def test_types_numerotes(self):
+        self.assertEqual([classe.type_noeud for classe in CLASSES_NOEUDS], list(range(len(CLASSES_NOEUDS))))
+        self.assertIs(CLASSES_NOEUDS[Identifiant.type_noeud], Identifiant)
+        self.assertEqual(fia_ast.Bloc.nom_visite, 'visiter_bloc')
+
+    def test_table_par_classe_de_visiteur(self):
+        class Compteur:
+            def visiter_littéral(self, noeud):
+                return noeud.valeur
+
+        table = table_dispatch(Compteur)
+        self.assertIs(table_dispatch(Compteur), table)
+        self.assertEqual(Littéral(3).accepter(Compteur()), 3)
+        with self.assertRaises(NotImplementedError):
+            Identifiant('x').accepter(Compteur())
+        # Les sous-classes ont leur propre table
+        class SousVisiteur(VisiteurInterpretation):
+            def visiter_littéral(self, noeud):
+                return 'surcharge'
+        self.assertIsNot(table_dispatch(SousVisiteur), table_dispatch(VisiteurInterpretation))
+        self.assertEqual(table_dispatch(SousVisiteur)[Littéral.type_noeud](None, Littéral(1)), 'surcharge')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from budget import BudgetExecution
+from errors import LimiteExecutionError
+
+def executer(code, moteur, **limites):
+    sortie = SortieFIA(flux=None, capturer=True)
+    ast = ParserFIA(LexerFIA(code).tokeniser()).analyser()
+    creer_interpreteur(moteur, sortie, BudgetExecution(**limites)).executer(ast)
+    return sortie.texte().splitlines()[-1]
+
+class TestBudgetExecution(unittest.TestCase):
+    def verifier_limite(self, code, limite, **limites):
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                with self.assertRaises(LimiteExecutionError) as contexte:
+                    executer(code, moteur, **limites)
+                self.assertEqual(contexte.exception.limite, limite)
+
+    def test_boucles_sans_plafond_fixe(self):
+        """Plus de limite arbitraire à 1000 itérations"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                code = 'soit n = 0\ntant_que (n < 5000) { n += 1 }\nsoit l = []\ntant_que (longueur(l) < 3000) { ajouter(l, n) }\npour x dans l { n += 1 }\nimprimer(n)'
+                self.assertEqual(executer(code, moteur), "8000")
+
+    def test_max_instructions(self):
+        self.verifier_limite('tant_que (vrai) { }', 'instructions', max_instructions=10_000)
+        self.verifier_limite('pour i dans [1, 2, 3, 4, 5] { imprimer(i) }', 'instructions', max_instructions=3)
+        self.verifier_limite('fonction f(n) { retourner n }\nsoit i = 0\ntant_que (i < 10) { i = f(i) + 1 }',
+                             'instructions', max_instructions=15)
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                # Exactement le budget : pas d'erreur
+                self.assertEqual(executer('soit n = 0\ntant_que (n < 100) { n += 1 }\nimprimer(n)',
+                                          moteur, max_instructions=100), "100")
+
+    def test_delai(self):
+        self.verifier_limite('soit n = 0\ntant_que (vrai) { n += 1 }', 'delai', delai=0.05)
+
+    def test_profondeur(self):
+        code = 'fonction f(n) { si (n == 0) { retourner 0 } retourner 1 + f(n - 1) }\nimprimer(f(30))'
+        self.verifier_limite(code, 'profondeur', max_profondeur=20)
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur, max_profondeur=31), "30")
+
+    def test_recursion_infinie(self):
+        """La limite de récursion de Python devient une erreur de profondeur"""
+        self.verifier_limite('fonction f(n) { retourner 1 + f(n + 1) }\nf(0)', 'profondeur')
+
+    def test_recursion_terminale_infinie(self):
+        """Un appel terminal réutilise le cadre : comme une boucle infinie, il épuise le budget de pas"""
+        self.verifier_limite('fonction f(n) { retourner f(n + 1) }\nf(0)', 'instructions', max_instructions=5000)
+        self.verifier_limite('fonction f(n) { retourner f(n + 1) }\nf(0)', 'instructions',
+                             max_instructions=5000, max_profondeur=10)
+
+    def test_max_elements(self):
+        self.verifier_limite('soit l = []\ntant_que (vrai) { ajouter(l, 1) }', 'elements', max_elements=100)
+        self.verifier_limite('soit d = {"a": 1}\nd["a"] = 2\nd["b"] = 3', 'elements', max_elements=1)
+        self.verifier_limite('soit d = fusionner({"a": 1, "b": 2}, {"c": 3})', 'elements', max_elements=2)
+        self.verifier_limite('soit p = []\ntant_que (vrai) { empiler(p, 1) }', 'elements', max_elements=100)
+        self.verifier_limite('soit f = creer_file()\ntant_que (vrai) { enfiler(f, 1) }', 'elements', max_elements=100)
+        self.verifier_limite('soit l = [1, 2]\netendre(l, [3])', 'elements', max_elements=2)
+        self.verifier_limite('soit l = [1, 2]\ninserer(l, 0, 3)', 'elements', max_elements=2)
+
+    def test_budget_reutilise_par_programme(self):
+        """Le décompte repart de zéro à chaque programme exécuté"""
+        budget = BudgetExecution(max_instructions=1000)
+        ast = ParserFIA(LexerFIA('soit n = 0\ntant_que (n < 800) { n += 1 }').tokeniser()).analyser()
+        interpreteur = creer_interpreteur('arbre', SortieFIA(flux=None), budget)
+        interpreteur.executer(ast)
+        interpreteur.executer(ast)
+        self.assertEqual(budget.pas_consommes(), 800)
+
+if __name__ == '__main__':
+    unittest.main()
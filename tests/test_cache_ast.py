@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import unittest
+from pathlib import Path
+from cache_ast import CacheAST
+
+class TestCacheAST(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.source = Path(self.dossier.name) / "module.fia"
+        self.source.write_text("fonction f(a) { retourner a + 1 }\nsoit x = 2\n", encoding='utf-8')
+
+    def tearDown(self):
+        self.dossier.cleanup()
+
+    def test_froid_puis_chaud(self):
+        cache = CacheAST()
+        ast = cache.charger(self.source)
+        self.assertEqual((cache.succes, cache.echecs), (0, 1))
+        self.assertTrue(cache.chemin_cache(self.source.resolve()).exists())
+
+        relu = CacheAST().charger(self.source)
+        self.assertEqual(len(relu.instructions), len(ast.instructions))
+        # Les annotations du résolveur sont conservées
+        self.assertEqual(relu.instructions[0].index_locaux, {'a': 0})
+
+        cache_chaud = CacheAST()
+        cache_chaud.charger(self.source)
+        self.assertEqual((cache_chaud.succes, cache_chaud.echecs), (1, 0))
+
+    def test_invalidation_si_contenu_modifie(self):
+        CacheAST().charger(self.source)
+        self.source.write_text("soit y = 1\nsoit z = 2\nsoit w = 3\n", encoding='utf-8')
+        cache = CacheAST()
+        ast = cache.charger(self.source)
+        self.assertEqual(cache.echecs, 1)
+        self.assertEqual([i.nom for i in ast.instructions], ['y', 'z', 'w'])
+
+    def test_touch_sans_changement_reste_en_cache(self):
+        CacheAST().charger(self.source)
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        cache = CacheAST()
+        cache.charger(self.source)
+        self.assertEqual((cache.succes, cache.echecs), (1, 0))
+
+    def test_entree_corrompue_et_cache_inactif(self):
+        cache = CacheAST()
+        cache.charger(self.source)
+        cache.chemin_cache(self.source.resolve()).write_bytes(b"pas un pickle")
+        cache = CacheAST()
+        self.assertEqual(len(cache.charger(self.source).instructions), 2)
+        self.assertEqual(cache.echecs, 1)
+
+        cache.invalider(self.source)
+        inactif = CacheAST(actif=False)
+        inactif.charger(self.source)
+        self.assertFalse(cache.chemin_cache(self.source.resolve()).exists())
+
+if __name__ == "__main__":
+    unittest.main()
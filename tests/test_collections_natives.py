@@ -0,0 +1,107 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from errors import RuntimeError
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def executer(code, moteur):
+    """Exécute du code F-IA et retourne les lignes imprimées (sans la bannière du module IA)"""
+    sortie = SortieFIA(flux=None, capturer=True)
+    interpreteur = creer_interpreteur(moteur, sortie)
+    debut = len(sortie.texte())
+    interpreteur.executer(ParserFIA(LexerFIA(code).tokeniser()).analyser())
+    return sortie.texte()[debut:].splitlines()
+
+class TestCollectionsNatives(unittest.TestCase):
+    def test_piles_et_files(self):
+        code = """
+soit p = []
+empiler(empiler(p, 1), 2)
+soit f = creer_file([1])
+enfiler(f, 2)
+enfiler(f, 3)
+soit vus = []
+pour x dans f { ajouter(vus, x) }
+imprimer(depiler(p), sommet(p), p, depiler([]))
+imprimer(defiler(f), tete(f), f, longueur(f), vus, defiler(creer_file()))
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), [
+                    "2 1 [1] None",
+                    "1 2 [2, 3] 2 [1, 2, 3] None",
+                ])
+
+    def test_trancher_etendre_inserer(self):
+        code = """
+soit l = [1, 2, 3, 4]
+imprimer(trancher(l, 1, 3), trancher(l, -2), trancher("bonjour", 0, 3), l)
+etendre(l, [5, 6])
+inserer(l, 0, 0)
+imprimer(inserer(l, longueur(l), 7), etendre([], creer_file([8])))
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), [
+                    "[2, 3] [3, 4] bon [1, 2, 3, 4]",
+                    "[0, 1, 2, 3, 4, 5, 6, 7] [8]",
+                ])
+
+    def test_trier_avec_cle(self):
+        code = """
+fonction par_age_inverse(p) {
+    retourner -p["age"]
+}
+soit personnes = [{"nom": "b", "age": 30}, {"nom": "a", "age": 25}, {"nom": "c", "age": 30}]
+fonction noms(liste) {
+    soit resultat = []
+    pour p dans liste { ajouter(resultat, p["nom"]) }
+    retourner resultat
+}
+imprimer(noms(trier(personnes, "age")))
+imprimer(noms(trier(personnes, par_age_inverse)))
+imprimer(trier(["ccc", "a", "bb"], longueur), trier([2, 3, 1], nul, vrai), trier([3, 1, 2]))
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), [
+                    "['a', 'b', 'c']",
+                    "['b', 'c', 'a']",
+                    "['a', 'bb', 'ccc'] [3, 2, 1] [1, 2, 3]",
+                ])
+
+    def test_erreurs(self):
+        for code in ('trier([1, "a"])', 'trier([{"a": 1}], "b")', 'inserer([1], 5, 0)',
+                     'defiler([1])', 'trancher([1], "a")'):
+            for moteur in MOTEURS:
+                with self.subTest(code=code, moteur=moteur):
+                    with self.assertRaises(RuntimeError):
+                        executer(code, moteur)
+
+    def test_lib_collections(self):
+        """lib/collections.fia s'appuie sur les piles natives"""
+        code = f"""
+depuis "{RACINE}/lib/collections.fia" importer creer_pile, empiler, depiler, est_vide
+soit pile = creer_pile()
+soit i = 0
+tant_que (i < 5000) {{
+    empiler(pile, i)
+    i += 1
+}}
+soit total = 0
+tant_que (est_vide(pile) == faux) {{ total += depiler(pile) }}
+imprimer(total, pile)
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur)[-1], "12497500 []")
+
+if __name__ == "__main__":
+    unittest.main()
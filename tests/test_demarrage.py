@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import subprocess
+import unittest
+from builtin import FonctionDifferee
+from errors import RuntimeError
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestDemarrage(unittest.TestCase):
+    def test_backends_non_importes_au_demarrage(self):
+        """Créer un interpréteur n'importe ni les backends IA/ML ni les autres moteurs"""
+        code = (
+            "import sys, io, contextlib\n"
+            "from moteurs import creer_interpreteur\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    i = creer_interpreteur('arbre')\n"
+            "assert 'reseau_neuronal' in i.fonctions_integrees\n"
+            "print(sorted(m for m in ('ia_module', 'ai_integration', 'ml_backend', 'vision_backend',\n"
+            "    'machine_virtuelle', 'compilateur_closures') if m in sys.modules))\n"
+        )
+        sortie = subprocess.run([sys.executable, "-c", code], cwd=RACINE,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(sortie.strip(), "[]")
+
+    def test_fonction_differee(self):
+        fonction = FonctionDifferee('math', 'sqrt', "indisponible")
+        self.assertIsNone(fonction._fonction)
+        self.assertEqual(fonction(9), 3.0)
+        self.assertIsNotNone(fonction._fonction)
+
+        absente = FonctionDifferee('module_qui_n_existe_pas', 'f', "Backend non disponible")
+        for _ in range(2):
+            with self.assertRaises(RuntimeError) as contexte:
+                absente()
+            self.assertEqual(str(contexte.exception), "Backend non disponible")
+
+    def test_rapport_profil_demarrage(self):
+        chemin = os.path.join(RACINE, "tests", "_bonjour_profil.fia")
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write('imprimer("bonjour")\n')
+        try:
+            sortie = subprocess.run([sys.executable, "main.py", "--profil-demarrage", "--no-cache", chemin],
+                                    cwd=RACINE, capture_output=True, text=True, check=True).stdout
+        finally:
+            os.remove(chemin)
+        self.assertIn("bonjour", sortie)
+        self.assertIn("Imports les plus coûteux", sortie)
+        self.assertIn("interpreter", sortie)
+        self.assertRegex(sortie, r"ai_integration\s+non chargé")
+
+if __name__ == '__main__':
+    unittest.main()
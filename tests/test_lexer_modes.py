@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import glob
+import unittest
+from errors import LexerError
+from lexer import LexerFIA, Token, TamponTokens
+from parser import ParserFIA
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def types_et_valeurs(code, mode):
+    return [(token.type, token.valeur) for token in LexerFIA(code, mode).tokeniser()]
+
+class TestModesLexer(unittest.TestCase):
+    def test_memes_tokens_sur_les_exemples(self):
+        """Le mode table produit les mêmes tokens que le lexer caractère par caractère"""
+        fichiers = glob.glob(os.path.join(RACINE, 'exemples', '**', '*.fia'), recursive=True)
+        fichiers += glob.glob(os.path.join(RACINE, 'lib', '*.fia'))
+        self.assertTrue(fichiers)
+        for fichier in fichiers:
+            with open(fichier, encoding='utf-8') as f:
+                code = f.read()
+            with self.subTest(fichier=os.path.relpath(fichier, RACINE)):
+                self.assertEqual(types_et_valeurs(code, 'table'), types_et_valeurs(code, 'caracteres'))
+
+    def test_positions_calculees_depuis_le_decalage(self):
+        tokens = LexerFIA("soit x = 1.5 // commentaire\n  x += 'é'  # fin").tokeniser()
+        self.assertEqual([(t.type, t.valeur, t.ligne, t.colonne) for t in tokens], [
+            ('SOIT', 'soit', 1, 1), ('IDENTIFIANT', 'x', 1, 6), ('ASSIGNATION', '=', 1, 8),
+            ('NOMBRE', 1.5, 1, 10), ('IDENTIFIANT', 'x', 2, 3), ('PLUS_EGAL', '+=', 2, 5),
+            ('CHAINE', 'é', 2, 8), ('EOF', '', 2, 18),
+        ])
+
+    def test_erreurs(self):
+        for code, message in [('x = "abc\nd"', "Chaîne non terminée à la ligne 1"),
+                              ('x = "abc', "Chaîne non terminée à la fin du fichier"),
+                              ('soit a\n  !', "Caractère inconnu '!' à la ligne 2, colonne 3")]:
+            with self.subTest(code=code):
+                with self.assertRaises(LexerError) as contexte:
+                    LexerFIA(code).tokeniser()
+                self.assertIn(message, str(contexte.exception))
+
+    def test_tampon_tokens_en_colonnes(self):
+        code = "soit x = [1, 'a']\nimprimer(x)"
+        tampon = LexerFIA(code).tokeniser_tampon()
+        self.assertEqual(tampon.types.typecode, 'B')
+        self.assertEqual(len(tampon), len(LexerFIA(code).tokeniser()))
+        self.assertEqual([(t.type, t.valeur, t.ligne, t.colonne) for t in tampon],
+                         [(t.type, t.valeur, t.ligne, t.colonne) for t in LexerFIA(code).tokeniser()])
+        self.assertEqual((tampon.type(8), tampon.ligne(8), tampon.colonne(8)), ('IDENTIFIANT', 2, 1))
+
+    def test_parser_accepte_liste_ou_tampon(self):
+        code = "soit x = 1\nsi (x >= 1) { imprimer(x + 2) }"
+        depuis_liste = ParserFIA(LexerFIA(code, 'caracteres').tokeniser()).analyser()
+        depuis_tampon = ParserFIA(LexerFIA(code).tokeniser_tampon()).analyser()
+        self.assertEqual(len(depuis_liste.instructions), 2)
+        self.assertEqual(type(depuis_tampon.instructions[1]).__name__, 'Condition')
+        self.assertFalse(hasattr(Token('EOF', ''), '__dict__'))
+
+    def test_mode_inconnu(self):
+        with self.assertRaises(LexerError):
+            LexerFIA("x", mode='inexistant')
+
+if __name__ == "__main__":
+    unittest.main()
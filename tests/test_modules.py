@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from cache_ast import cache_ast
+from module_resolver import module_resolver
+from moteurs import MOTEURS, creer_interpreteur
+
+class TestModulesExecutesUneFois(unittest.TestCase):
+    def setUp(self):
+        self.dossier = tempfile.TemporaryDirectory()
+        self.racine = Path(self.dossier.name)
+        (self.racine / "outils.fia").write_text(
+            'imprimer("chargement outils")\n'
+            'soit compteur = [0]\n'
+            'fonction incrementer() { ajouter(compteur, 1) retourner longueur(compteur) }\n',
+            encoding='utf-8')
+        for i in range(5):
+            (self.racine / f"client{i}.fia").write_text(
+                'importer "./outils.fia" comme o\n'
+                'depuis "./outils.fia" importer compteur\n'
+                'imprimer(o.incrementer(), longueur(compteur))\n',
+                encoding='utf-8')
+        module_resolver.vider_cache()
+        cache_ast.actif = False
+
+    def tearDown(self):
+        cache_ast.actif = True
+        module_resolver.vider_cache()
+        self.dossier.cleanup()
+
+    def executer_clients(self, moteur):
+        sortie = io.StringIO()
+        with redirect_stdout(sortie):
+            for i in range(5):
+                creer_interpreteur(moteur).executer_fichier(str(self.racine / f"client{i}.fia"))
+        return [ligne for ligne in sortie.getvalue().splitlines() if not ligne.startswith(('🤖', '   •', '📦'))]
+
+    def test_corps_execute_une_fois(self):
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                module_resolver.vider_cache()
+                lignes = self.executer_clients(moteur)
+                self.assertEqual(lignes.count("chargement outils"), 1)
+                # L'état du module est partagé par tous les importeurs
+                self.assertEqual(lignes[1:], [f"{i + 2} {i + 2}" for i in range(5)])
+                chemin = str((self.racine / "outils.fia").resolve())
+                self.assertIn(chemin, module_resolver.cache_contextes)
+
+    def test_import_circulaire(self):
+        (self.racine / "a.fia").write_text('importer "./b.fia" comme b\n', encoding='utf-8')
+        (self.racine / "b.fia").write_text('importer "./a.fia" comme a\n', encoding='utf-8')
+        with redirect_stdout(io.StringIO()):
+            with self.assertRaises(Exception) as contexte:
+                creer_interpreteur('arbre').executer_fichier(str(self.racine / "a.fia"))
+        self.assertIn("circulaire", str(contexte.exception))
+        self.assertEqual(module_resolver.pile_execution, [])
+
+if __name__ == '__main__':
+    unittest.main()
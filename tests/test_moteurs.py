@@ -0,0 +1,278 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+
+PROGRAMME = '''
+fonction fib(n) {
+    si (n < 2) { retourner n }
+    retourner fib(n - 1) + fib(n - 2)
+}
+soit total = 0
+soit i = 0
+tant_que (i < 10) {
+    total += i * 2
+    i += 1
+}
+soit d = {"a": 1, "b": "x" + 2}
+d["c"] = fib(10)
+imprimer(total, d, "3" * 2, 7 / 2, -i, vrai et faux)
+'''
+
+def executer(code, moteur):
+    """Exécute du code F-IA et retourne la sortie (sans la bannière du module IA)"""
+    ast = ParserFIA(LexerFIA(code).tokeniser()).analyser()
+    sortie = io.StringIO()
+    with redirect_stdout(sortie):
+        interpreteur = creer_interpreteur(moteur)
+        debut = len(sortie.getvalue())
+        interpreteur.executer(ast)
+    return sortie.getvalue()[debut:]
+
+class TestMoteurs(unittest.TestCase):
+    def test_moteurs_meme_resultat(self):
+        """Tous les moteurs produisent la même sortie que l'interpréteur visiteur"""
+        attendu = executer(PROGRAMME, 'arbre')
+        self.assertEqual(attendu, "90 {'a': 1, 'b': 'x2', 'c': 55} 6 3.5 -10 False\n")
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(PROGRAMME, moteur), attendu)
+
+    def test_vm_bytecode_compact(self):
+        """Le bytecode de la VM est stocké dans des tableaux typés"""
+        from machine_virtuelle import CompilateurBytecode, RETOURNER
+        ast = ParserFIA(LexerFIA(PROGRAMME).tokeniser()).analyser()
+        corps_fib = CompilateurBytecode().compiler_corps(ast.instructions[0].corps, 'fib')
+        self.assertEqual(corps_fib.operations.typecode, 'B')
+        self.assertIn(RETOURNER, corps_fib.operations)
+        self.assertIn('fib', corps_fib.desassembler())
+
+    def test_valeur_derniere_instruction(self):
+        """Le programme retourne la valeur de sa dernière instruction (utilisé par le REPL)"""
+        ast = ParserFIA(LexerFIA("soit x = 4\nx * 2").tokeniser()).analyser()
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur), redirect_stdout(io.StringIO()):
+                self.assertEqual(creer_interpreteur(moteur).executer(ast), 8)
+
+    def test_variables_locales_par_slot(self):
+        """Les locales vivent dans le cadre de la fonction, les globales sont partagées"""
+        code = """
+soit compteur = 0
+fonction somme(liste) {
+    soit total = 0
+    pour x dans liste {
+        total += x
+    }
+    compteur += 1  # assignation dans une fonction : variable locale
+    retourner total
+}
+soit x = "global"
+imprimer(somme([1, 2, 3]), somme([4]), compteur, x)
+"""
+        ast = ParserFIA(LexerFIA(code).tokeniser()).analyser()
+        self.assertEqual(ast.instructions[1].index_locaux, {'liste': 0, 'total': 1, 'x': 2, 'compteur': 3})
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "6 4 0 global\n")
+
+    def test_listes_par_reference(self):
+        """Les builtins reçoivent les listes par référence ; chaque littéral crée une nouvelle liste"""
+        code = """
+fonction nouvelle(x) {
+    soit l = [x, x + 1]
+    ajouter(l, x * 10)
+    retourner l
+}
+soit a = nouvelle(1)
+soit b = nouvelle(2)
+soit c = []
+ajouter(c, a)
+imprimer(a, b, c, longueur(c[0]))
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "[1, 2, 10] [2, 3, 20] [[1, 2, 10]] 3\n")
+
+    def test_frontiere_python_copie_une_fois(self):
+        from builtin import _frontiere_python
+        partagee = [1, 2]
+        recu = _frontiere_python(lambda *args: args)([partagee, partagee], {'k': partagee})
+        self.assertEqual(recu[0], [[1, 2], [1, 2]])
+        self.assertIsNot(recu[0][0], partagee)
+        self.assertIs(recu[0][0], recu[0][1])
+        self.assertIs(recu[1]['k'], recu[0][0])
+
+    def test_cache_en_ligne_des_operateurs(self):
+        """Le cache d'une ExpressionBinaire suit les types de ses opérandes"""
+        code = ('fonction op(a, b) { retourner a * b + a }\n'
+                'imprimer(op(2, 3), op(1.5, 2), op("4", 2), op(3, 2), vrai + 1, op("a", 0) == "a0")')
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "8 4.5 84 9 2 False\n")
+        ast = ParserFIA(LexerFIA('soit x = 1\nsoit y = x + 2\nx = "a"\ny = x + 2').tokeniser()).analyser()
+        with redirect_stdout(io.StringIO()):
+            creer_interpreteur('arbre').executer(ast)
+        self.assertEqual(ast.instructions[1].valeur.cache[:2], (int, int))
+        self.assertEqual(ast.instructions[3].valeur.cache[:2], (str, int))
+
+    def test_court_circuit_et_ou(self):
+        """Le côté droit de et / ou n'est évalué que si le gauche ne suffit pas"""
+        code = """
+fonction garde(x) {
+    retourner longueur(x) > 2  # erreur si x est nul
+}
+soit a = nul
+imprimer(a != nul et garde(a), vrai ou garde(a), "abc" != nul et garde("abc"), "0" et garde(a), 0 ou "7")
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "False True True 0 7\n")
+
+    def test_caches_en_ligne_des_noms(self):
+        """Redéfinir une fonction (définie ou intégrée) invalide les caches des appels déjà résolus"""
+        code = """
+fonction f() { retourner 1 }
+fonction appel() { retourner f() + longueur("ab") }
+soit avant = appel()
+fonction f() { retourner 2 }
+imprimer(avant, appel(), f)
+"""
+        ast = ParserFIA(LexerFIA(code).tokeniser()).analyser()
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur).split()[:2], ["3", "4"])
+                # Le même AST (caches déjà remplis) dans un autre interpréteur
+                sorties = []
+                with redirect_stdout(io.StringIO()):
+                    interpreteur = creer_interpreteur(moteur)
+                interpreteur.fonctions_integrees['imprimer'] = lambda *valeurs: sorties.append(valeurs)
+                interpreteur.executer(ast)
+                interpreteur.fonctions_integrees['longueur'] = lambda valeur: 10
+                interpreteur.executer(ast)
+                self.assertEqual([valeurs[:2] for valeurs in sorties], [(3, 4), (11, 12)])
+
+    def test_retour_depuis_blocs_et_boucles(self):
+        """`retourner` interrompt boucles et conditions imbriquées jusqu'à l'appel de fonction"""
+        code = """
+fonction chercher(grille, cible) {
+    pour ligne dans grille {
+        soit j = 0
+        tant_que (j < longueur(ligne)) {
+            si (ligne[j] == cible) { retourner j }
+            j += 1
+        }
+    }
+    retourner
+}
+fonction derniere(x) {
+    si (x) { x * 2 }
+}
+fonction sans_retour(x) {
+    x * 2
+}
+imprimer(chercher([[1, 2], [3, 4]], 4), chercher([[1]], 9), derniere(3), sans_retour(3))
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "1 None None 6\n")
+
+    def test_retour_hors_fonction(self):
+        from errors import ReturnException
+        ast = ParserFIA(LexerFIA("si (vrai) { retourner 5 }\nimprimer(1)").tokeniser()).analyser()
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur), redirect_stdout(io.StringIO()) as sortie:
+                with self.assertRaises(ReturnException) as contexte:
+                    creer_interpreteur(moteur).executer(ast)
+                self.assertEqual(contexte.exception.value, 5)
+                self.assertNotIn("1\n", sortie.getvalue())
+
+    def test_vm_recursion_sans_pile_python(self):
+        """Les appels F-IA de la VM vivent sur sa pile d'appels, pas sur la pile Python"""
+        code = ("fonction somme(n) {\n    si (n == 0) { retourner 0 }\n    retourner n + somme(n - 1)\n}\n"
+                "imprimer(somme(20000))")
+        self.assertEqual(executer(code, 'vm'), "200010000\n")
+
+    def test_vm_erreur_dans_un_appel_profond(self):
+        """Une erreur restaure le cadre global et la profondeur ; elle indique la ligne fautive"""
+        from errors import RuntimeError
+        with redirect_stdout(io.StringIO()):
+            interpreteur = creer_interpreteur('vm')
+        analyser = lambda code: ParserFIA(LexerFIA(code).tokeniser()).analyser()
+        with self.assertRaises(RuntimeError) as contexte:
+            interpreteur.executer(analyser("fonction f(n) {\n    si (n == 0) { retourner 1 / 0 }\n"
+                                           "    retourner 1 + f(n - 1)\n}\nsoit x = 1\nf(500)"))
+        self.assertEqual(contexte.exception.ligne, 2)
+        self.assertIsNone(interpreteur.cadre)
+        self.assertEqual(interpreteur.budget.profondeur, 0)
+        self.assertEqual(interpreteur.executer(analyser("x = x + 1\nx")), 2)
+
+    def test_appels_terminaux(self):
+        """`retourner f(...)` dans `f` réutilise le cadre : pas de limite de pile, même résultat"""
+        code = """
+fonction decompter(n, acc) {
+    si (n == 0) { retourner acc }
+    retourner decompter(n - 1, acc + 1)
+}
+fonction autre(n) {
+    retourner decompter(n, 0)
+}
+imprimer(decompter(5000, 0), autre(3))
+"""
+        ast = ParserFIA(LexerFIA(code).tokeniser()).analyser()
+        self.assertTrue(ast.instructions[0].corps.instructions[1].appel_terminal)
+        self.assertFalse(ast.instructions[1].corps.instructions[0].appel_terminal)
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur), "5000 3\n")
+        from machine_virtuelle import desassembler_programme
+        self.assertIn('APPELER_TERMINAL', desassembler_programme(ast))
+
+    def test_memoisation(self):
+        """memoiser() garde les résultats par contenu des arguments, dans une taille bornée"""
+        code = """
+soit appels = []
+fonction fib(n) {
+    si (n < 2) { retourner n }
+    retourner fib(n - 1) + fib(n - 2)
+}
+fonction total(l) {
+    ajouter(appels, l)
+    soit t = 0
+    pour x dans l { t += x }
+    retourner t
+}
+fonction decrire(x) {
+    retourner chaine(x) + "!"
+}
+memoiser("fib")
+memoiser("total", 2)
+memoiser("decrire")
+imprimer(fib(30), statistiques_memo("fib")["echecs"])
+soit l = [1, 2]
+imprimer(total(l), total([1, 2]), decrire(1), decrire(1.0), decrire(vrai))
+ajouter(l, 3)
+imprimer(total(l), total([5]), total([1, 2]), longueur(appels), statistiques_memo("total"))
+vider_memo("total")
+imprimer(statistiques_memo("total")["taille"])
+"""
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(code, moteur).splitlines(), [
+                    "832040 31",
+                    "3 3 1! 1.0! True!",
+                    "6 5 3 4 {'succes': 1, 'echecs': 4, 'taille': 2, 'taille_max': 2}",
+                    "0",
+                ])
+
+    def test_moteur_inconnu(self):
+        with self.assertRaises(Exception):
+            creer_interpreteur('inexistant')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from errors import RuntimeError
+from fia_ast import Littéral, Condition, BoucleTantQue, BouclePourDans, ExpressionBinaire
+from optimiseur import OptimiseurAST, compter_noeuds
+
+def analyser(code):
+    return ParserFIA(LexerFIA(code).tokeniser()).analyser()
+
+def optimiser(code):
+    optimiseur = OptimiseurAST()
+    return optimiseur.optimiser(analyser(code)), optimiseur
+
+def executer(ast, moteur):
+    sortie = SortieFIA(flux=None, capturer=True)
+    creer_interpreteur(moteur, sortie).executer(ast)
+    return [ligne for ligne in sortie.texte().splitlines() if not ligne.startswith(('🤖', '   •'))]
+
+class TestOptimiseur(unittest.TestCase):
+    def test_pliage_des_constantes(self):
+        ast, optimiseur = optimiser('soit a = 2 * 3 + 1\nsoit b = -4\nsoit c = "n" + 1 + 2\nsoit d = 3 >= 2')
+        self.assertEqual([i.valeur.valeur for i in ast.instructions], [7, -4, "n12", True])
+        self.assertEqual(optimiseur.expressions_pliees, 6)
+        # Le littéral plié garde la position de l'expression d'origine
+        self.assertEqual(ast.instructions[0].valeur.ligne, 1)
+
+    def test_court_circuit_constant(self):
+        ast, optimiseur = optimiser('soit a = faux et f()\nsoit b = 1 ou f()\nsoit c = vrai et f()')
+        self.assertEqual([i.valeur.valeur for i in ast.instructions[:2]], [False, 1])
+        self.assertNotIsInstance(ast.instructions[2].valeur, Littéral)
+        self.assertEqual(optimiseur.expressions_pliees, 2)
+
+    def test_rien_n_est_plie_si_l_operation_echoue_ou_a_des_effets(self):
+        ast, optimiseur = optimiser('soit a = 1 / 0\nsoit b = "ab" * 1000\nsoit c = f() + 1')
+        for instruction in ast.instructions:
+            self.assertIsInstance(instruction.valeur, ExpressionBinaire)
+        self.assertEqual(optimiseur.expressions_pliees, 0)
+
+    def test_branches_mortes(self):
+        code = ('si (vrai) { imprimer("a") } sinon { imprimer("b") }\n'
+                'si (1 > 2) { imprimer("c") }\n'
+                'tant_que (faux) { imprimer("d") }\n'
+                'si (x) { si (0) { imprimer("e") } }')
+        ast, optimiseur = optimiser(code)
+        self.assertEqual(len(ast.instructions), 2)
+        self.assertNotIsInstance(ast.instructions[0], (Condition, BoucleTantQue))
+        self.assertEqual(ast.instructions[1].bloc_si.instructions, [])
+        self.assertEqual(optimiseur.branches_eliminees, 4)
+        self.assertEqual(optimiseur.noeuds_elimines, compter_noeuds(analyser(code)) - compter_noeuds(ast))
+
+    def test_collections_figees_seulement_en_lecture(self):
+        ast, optimiseur = optimiser('pour x dans [1, 2, 3] { imprimer(x) }\nsoit l = [1, 2]\n'
+                                    'soit y = [4, 5][0]\nsoit z = [[1], 2][0]')
+        self.assertIsInstance(ast.instructions[0], BouclePourDans)
+        self.assertEqual(ast.instructions[0].iterable.valeur, [1, 2, 3])
+        # Liste affectée à une variable : elle peut être modifiée ensuite
+        self.assertNotIsInstance(ast.instructions[1].valeur, Littéral)
+        self.assertEqual(ast.instructions[2].valeur.base.valeur, [4, 5])
+        # Élément mutable : la liste n'est pas partagée
+        self.assertNotIsInstance(ast.instructions[3].valeur.base, Littéral)
+        self.assertEqual(optimiseur.collections_figees, 2)
+
+    def test_meme_resultat_dans_chaque_moteur(self):
+        code = ('fonction f(n) {\n    si (1 == 1) { retourner n * (10 / 4) }\n    retourner 0\n}\n'
+                'soit l = [1, 2]\nsi (faux) { soit l = [] }\n'
+                'pour x dans [3, 4] { ajouter(l, f(x)) }\nimprimer(l, "total: " + (2 + 3))')
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                self.assertEqual(executer(optimiser(code)[0], moteur), executer(analyser(code), moteur))
+
+    def test_erreur_a_la_bonne_ligne(self):
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                with self.assertRaises(RuntimeError) as contexte:
+                    executer(optimiser('soit a = 1 + 1\nsoit b = 1 / (2 - 2)')[0], moteur)
+                self.assertEqual(contexte.exception.ligne, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pool_execution import PoolExecution, PoolSature, combiner_limites, configuration_depuis_env, executer_isole
+
+def sans_banniere(sortie):
+    return [ligne for ligne in sortie.splitlines() if not ligne.startswith(('🤖', '   •'))]
+
+class TestPoolExecution(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = PoolExecution(taille=2, file_max=6).demarrer()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.fermer()
+
+    def test_sorties_separees_en_parallele(self):
+        programmes = {i: f'soit i = 0\ntant_que (i < 50) {{ i += 1 }}\nimprimer("client", {i}, i)\n' for i in range(8)}
+        stdout_serveur = io.StringIO()
+        with redirect_stdout(stdout_serveur), ThreadPoolExecutor(8) as threads:
+            resultats = dict(zip(programmes, threads.map(
+                lambda code: self.pool.executer(code, 'arbre'), programmes.values())))
+        for i, sortie in resultats.items():
+            self.assertEqual(sans_banniere(sortie), [f"client {i} 50"])
+        # Rien n'est écrit dans la sortie du processus serveur
+        self.assertEqual(stdout_serveur.getvalue(), "")
+
+    def test_erreurs_retournees_comme_texte(self):
+        self.assertIn("non définie", self.pool.executer("imprimer(x)", 'vm'))
+
+    def test_saturation(self):
+        pool = PoolExecution(taille=1, file_max=0)
+        try:
+            pool._places.acquire()
+            with self.assertRaises(PoolSature):
+                pool.executer('imprimer(1)', 'arbre')
+            pool._places.release()
+        finally:
+            pool.fermer()
+
+    def test_flux_evenements(self):
+        flux = self.pool.executer_en_flux('imprimer("a")\nimprimer("b")\nimprimer(x)', 'closures')
+        evenements = list(flux)
+        sortie = "".join(texte for type_evenement, texte in evenements if type_evenement == 'sortie')
+        self.assertEqual(sans_banniere(sortie), ["a", "b"])
+        self.assertEqual(evenements[-1][0], 'erreur')
+        self.assertIn("non définie", evenements[-1][1])
+
+    def test_flux_fermeture_arrete_execution(self):
+        places = self.pool._places._value
+        flux = self.pool.executer_en_flux('tant_que (vrai) { imprimer("encore") }', 'vm')
+        self.assertEqual(next(flux)[0], 'sortie')
+        processus = flux._processus
+        flux.fermer()
+        self.assertFalse(processus.is_alive())
+        self.assertEqual(self.pool._places._value, places)
+        self.assertEqual(list(flux), [])
+
+    def test_flux_sortie_plafonnee(self):
+        pool = PoolExecution(taille=1, sortie_max=300)
+        evenements = list(pool.executer_en_flux('soit i = 0\ntant_que (i < 1000) { imprimer(i) i += 1 }', 'arbre'))
+        self.assertEqual(sum(len(texte) for type_evenement, texte in evenements if type_evenement == 'sortie'), 300)
+        self.assertEqual(evenements[-1][0], 'erreur')
+        self.assertIn("Limite de sortie", evenements[-1][1])
+
+    def test_configuration(self):
+        config = configuration_depuis_env({'FIA_POOL_TAILLE': '3', 'FIA_POOL_ATTENTE': '0.5'})
+        self.assertEqual(config, {
+            'taille': 3, 'file_max': 6, 'attente_max': 0.5, 'sortie_max': 1_000_000,
+            'limites': {'instructions': None, 'delai': 30.0, 'profondeur': None, 'elements': 1_000_000},
+        })
+
+    def test_limites_requete_bornees_par_le_serveur(self):
+        serveur = {'instructions': 10_000, 'delai': 30.0, 'profondeur': None, 'elements': None}
+        limites = combiner_limites(serveur, {'instructions': 10**9, 'delai': 2, 'profondeur': 50})
+        self.assertEqual(limites, {'instructions': 10_000, 'delai': 2.0, 'profondeur': 50, 'elements': None})
+        for demandees in ({'memoire': 1}, {'delai': -1}, {'instructions': "beaucoup"}, [1]):
+            with self.assertRaises(ValueError):
+                combiner_limites(serveur, demandees)
+
+    def test_limite_atteinte_dans_un_worker(self):
+        sortie = self.pool.executer('tant_que (vrai) { }', 'closures', {'instructions': 5000})
+        self.assertIn("Limite d'exécution atteinte", sortie)
+        self.assertIn("5000 instructions", sortie)
+
+class TestExecutionIsolee(unittest.TestCase):
+    def test_stdout_restaure(self):
+        ancienne = sys.stdout
+        sortie = executer_isole('imprimer("ok")', 'closures')
+        self.assertIs(sys.stdout, ancienne)
+        self.assertEqual(sans_banniere(sortie), ["ok"])
+
+    def test_sortie_bornee(self):
+        sortie = executer_isole('pour i dans [1, 2, 3, 4, 5] { imprimer("ligne", i) }', 'vm', sortie_max=16)
+        self.assertTrue(sortie.startswith("[... "))
+        self.assertTrue(sortie.endswith("ligne 4\nligne 5\n"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+import unittest
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from errors import RuntimeError
+from fia_ast import compacter_position, MASQUE_COLONNE
+
+def analyser(code):
+    return ParserFIA(LexerFIA(code).tokeniser()).analyser()
+
+class TestPositions(unittest.TestCase):
+    def test_compactage(self):
+        position = compacter_position(1234, 56)
+        self.assertEqual((position >> 12, position & MASQUE_COLONNE), (1234, 56))
+        # Colonne saturée au-delà du masque
+        self.assertEqual(compacter_position(3, 10**6) & MASQUE_COLONNE, MASQUE_COLONNE)
+
+    def test_positions_des_noeuds(self):
+        ast = analyser('soit a = 1\n\nsoit b = a  +  2\n')
+        declaration = ast.instructions[1]
+        self.assertEqual((declaration.ligne, declaration.colonne), (3, 1))
+        # Expression binaire : position de l'opérateur
+        self.assertEqual((declaration.valeur.ligne, declaration.valeur.colonne), (3, 13))
+        self.assertEqual((declaration.valeur.gauche.ligne, declaration.valeur.gauche.colonne), (3, 10))
+
+    def test_positions_conservees_par_pickle(self):
+        ast = pickle.loads(pickle.dumps(analyser('soit a = 1\nimprimer(a)\n'), pickle.HIGHEST_PROTOCOL))
+        self.assertEqual([i.ligne for i in ast.instructions], [1, 2])
+
+    def test_ligne_des_erreurs_d_execution(self):
+        code = 'fonction f(x) {\n    soit y = x\n    retourner y + z\n}\nimprimer(f(1))\n'
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                with self.assertRaises(RuntimeError) as contexte:
+                    creer_interpreteur(moteur, SortieFIA(flux=None)).executer(analyser(code))
+                self.assertEqual(contexte.exception.ligne, 3)
+                self.assertIn("ligne 3: Variable 'z' non définie", str(contexte.exception))
+
+if __name__ == '__main__':
+    unittest.main()
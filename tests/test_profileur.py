@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from collections import Counter
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA
+from profileur import ProfileurFIA
+
+PROGRAMME = """fonction f(n) {
+    soit x = n
+    retourner g(x)
+}
+fonction g(n) {
+    capturer()
+    retourner n
+}
+f(1)
+"""
+
+def analyser(code):
+    return ParserFIA(LexerFIA(code).tokeniser()).analyser()
+
+class TestPileAppels(unittest.TestCase):
+    def test_pile_reconstruite_dans_chaque_moteur(self):
+        for moteur in MOTEURS:
+            with self.subTest(moteur=moteur):
+                interpreteur = creer_interpreteur(moteur, SortieFIA(flux=None))
+                piles = []
+                interpreteur.fonctions_integrees['capturer'] = \
+                    lambda: piles.append(interpreteur.pile_appels(sys._getframe()))
+                interpreteur.executer(analyser(PROGRAMME))
+                self.assertEqual(piles, [[('<programme>', 9), ('f', 3), ('g', 6), ('capturer', None)]])
+
+class TestProfileur(unittest.TestCase):
+    def test_agregation(self):
+        profileur = ProfileurFIA(interpreteur=None)
+        profileur.echantillons = Counter({
+            (('<programme>', 9), ('f', 3), ('f', 3), ('imprimer', None)): 3,
+            (('<programme>', 9), ('f', 2)): 1,
+        })
+        propre, total = profileur.par_fonction()
+        self.assertEqual(propre, {'imprimer': 3, 'f': 1})
+        self.assertEqual(total, {'<programme>': 4, 'f': 4, 'imprimer': 3})
+        propre, total = profileur.par_ligne()
+        self.assertEqual(propre, {('f', 3): 3, ('f', 2): 1})
+        self.assertEqual(total[('f', 3)], 3)
+        self.assertEqual(profileur.piles_repliees(), [
+            "<programme>:9;f:2 1",
+            "<programme>:9;f:3;f:3;imprimer 3",
+        ])
+
+    def test_echantillonnage(self):
+        code = ("fonction boucle(n) {\n    soit i = 0\n    tant_que (i < n) {\n        i += 1\n    }\n"
+                "    retourner i\n}\nboucle(30000)\n")
+        interpreteur = creer_interpreteur('arbre', SortieFIA(flux=None))
+        with ProfileurFIA(interpreteur, intervalle=0.001) as profileur:
+            interpreteur.executer(analyser(code))
+        self.assertGreater(profileur.nb_echantillons, 0)
+        propre, total = profileur.par_fonction()
+        self.assertGreater(total['boucle'], 0)
+        self.assertIn("Fonctions (temps propre / temps total)", profileur.rapport())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import threading
+import unittest
+from contextlib import redirect_stdout
+from lexer import LexerFIA
+from parser import ParserFIA
+from moteurs import MOTEURS, creer_interpreteur
+from sortie import SortieFIA, afficher
+
+class TestSortieFIA(unittest.TestCase):
+    def test_lots_et_rappel(self):
+        flux = io.StringIO()
+        paquets = []
+        sortie = SortieFIA(flux=flux, rappel=paquets.append, taille_lot=10)
+        sortie.imprimer("a", 1)
+        self.assertEqual(flux.getvalue(), "")
+        sortie.imprimer("bcdefgh")
+        self.assertEqual(paquets, ["a 1\nbcdefgh\n"])
+        sortie.ecrire("fin")
+        sortie.vider()
+        self.assertEqual(flux.getvalue(), "a 1\nbcdefgh\nfin")
+        self.assertEqual(paquets, ["a 1\nbcdefgh\n", "fin"])
+
+    def test_tampon_circulaire(self):
+        sortie = SortieFIA(flux=None, capacite=8, taille_lot=0)
+        for i in range(5):
+            sortie.ecrire(f"l{i}\n")
+        self.assertEqual(sortie.texte(), "2\nl3\nl4\n")
+        self.assertEqual(sortie.tronques, 7)
+        sortie.ecrire("x" * 20)
+        self.assertEqual(sortie.texte(), "x" * 8)
+        self.assertEqual(sortie.tronques, 27)
+
+    def test_interpreteurs_isoles_entre_threads(self):
+        """Chaque interpréteur écrit dans son propre puits, sans toucher sys.stdout"""
+        ast = ParserFIA(LexerFIA('soit i = 0\ntant_que (i < 200) { imprimer(i) i += 1 }').tokeniser()).analyser()
+        sorties = {}
+
+        def executer(moteur):
+            sortie = SortieFIA(flux=None, capturer=True)
+            creer_interpreteur(moteur, sortie).executer(ast)
+            sorties[moteur] = sortie.texte()
+
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            threads = [threading.Thread(target=executer, args=(moteur,)) for moteur in MOTEURS]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            # Hors exécution, afficher() écrit directement sur sys.stdout
+            afficher("hors programme")
+        self.assertEqual(stdout.getvalue(), "hors programme\n")
+        attendu = "".join(f"{i}\n" for i in range(200))
+        for moteur in MOTEURS:
+            self.assertTrue(sorties[moteur].endswith(attendu))
+
+if __name__ == '__main__':
+    unittest.main()